@@ -1,28 +1,521 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, g
 from pytrends.request import TrendReq
+from pytrends import exceptions as pytrends_exceptions
 import whois
+from whois.parser import PywhoisError
 import requests
 import time
 import json
-import random
+import hashlib
+import heapq
+import uuid
 import re
+import os
+import threading
+import sqlite3
+import asyncio
+from collections import OrderedDict, deque
+from functools import lru_cache
+from bisect import bisect_left
+from itertools import islice
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed, wait, FIRST_COMPLETED
 from urllib.parse import urlparse
 import dns.resolver
+import dns.asyncresolver
+from scoring import (
+    SIMULATION_SEED,
+    SIMULATION_CACHE_SIZE,
+    TR_TRANSLATION_TABLE,
+    normalize_keyword,
+    query_keyword,
+    EXTENSION_SCORES,
+    SPECIAL_COMBINATIONS,
+    POPULAR_AGE_KEYWORDS,
+    calculate_keyword_relevance,
+    analyze_domain_quality,
+    seeded_random,
+    _simulated_backlink_count,
+    simulate_backlink_analysis,
+    BACKLINK_DATA_FIELDS,
+    _simulated_backlink_profile,
+    simulate_backlink_data,
+    simulate_domain_age,
+    calculate_seo_score,
+    estimate_domain_value,
+    DomainAnalysis
+)
+from json_encoding import encode_json, json_default, FastJSONProvider
 
 app = Flask(__name__)
+# jsonify ve app.json hızlı kodlayıcıyı kullanır (orjson kuruluysa)
+app.json = FastJSONProvider(app)
+
+# Paralel domain analizi için thread sayısı
+DOMAIN_ANALYSIS_WORKERS = int(os.environ.get("DOMAIN_ANALYSIS_WORKERS", 8))
+
+# Keyword sağlayıcı yarışı - sağlayıcı başına süre sınırı ve toplam istek bütçesi (saniye)
+TRENDS_PROVIDER_DEADLINE = float(os.environ.get("TRENDS_PROVIDER_DEADLINE", 8.0))
+FALLBACK_PROVIDER_DEADLINE = float(os.environ.get("FALLBACK_PROVIDER_DEADLINE", 2.0))
+KEYWORD_REQUEST_BUDGET = float(os.environ.get("KEYWORD_REQUEST_BUDGET", 9.0))
+PROVIDER_WORKERS = int(os.environ.get("PROVIDER_WORKERS", 16))
+
+# Google Trends devre kesici - art arda hata eşiği, bekleme süresi (saniye) ve deneme arası temel gecikme
+TRENDS_FAILURE_THRESHOLD = int(os.environ.get("TRENDS_FAILURE_THRESHOLD", 3))
+TRENDS_BASE_COOLDOWN = float(os.environ.get("TRENDS_BASE_COOLDOWN", 30.0))
+TRENDS_MAX_COOLDOWN = float(os.environ.get("TRENDS_MAX_COOLDOWN", 600.0))
+TRENDS_ATTEMPT_DELAY = float(os.environ.get("TRENDS_ATTEMPT_DELAY", 1.0))
+
+# Google Trends istemci havuzu - boyut, boş istemci bekleme süresi ve NID çerezinin yenilenme süresi (saniye)
+TRENDS_POOL_SIZE = int(os.environ.get("TRENDS_POOL_SIZE", 4))
+TRENDS_POOL_TIMEOUT = float(os.environ.get("TRENDS_POOL_TIMEOUT", 5.0))
+TRENDS_COOKIE_TTL = float(os.environ.get("TRENDS_COOKIE_TTL", 1800.0))
+
+# Google Trends adresi - yük testlerinde yerel sahte sunucuya yönlendirilebilir
+GOOGLE_TRENDS_ORIGIN = "https://trends.google.com"
+TRENDS_BASE_URL = os.environ.get("TRENDS_BASE_URL", GOOGLE_TRENDS_ORIGIN).rstrip("/")
+
+# Google Trends toplu sorgu - payload başına en fazla terim ve aynı sorguları birleştirme penceresi (saniye)
+TRENDS_BATCH_SIZE = min(int(os.environ.get("TRENDS_BATCH_SIZE", 5)), 5)
+TRENDS_BATCH_WINDOW = float(os.environ.get("TRENDS_BATCH_WINDOW", 0.05))
+
+# Arka plan iş kuyruğu - worker sayısı, bekleyen iş sınırı ve biten işlerin saklanma süresi (saniye)
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", 2))
+JOB_QUEUE_SIZE = int(os.environ.get("JOB_QUEUE_SIZE", 32))
+JOB_TTL = int(os.environ.get("JOB_TTL", 15 * 60))
+
+# Arama endpoint'lerinde istenebilecek en fazla sonuç (limit parametresinin üst sınırı)
+MAX_RESULT_LIMIT = int(os.environ.get("MAX_RESULT_LIMIT", 100))
+
+# Toplu domain kontrolü ayarları
+BULK_CHECK_WORKERS = int(os.environ.get("BULK_CHECK_WORKERS", 16))
+BULK_CHECK_MAX_DOMAINS = int(os.environ.get("BULK_CHECK_MAX_DOMAINS", 500))
+
+# WHOIS sunucusu başına minimum istek aralığı (saniye)
+WHOIS_MIN_INTERVAL = float(os.environ.get("WHOIS_MIN_INTERVAL", 0.5))
+
+# WHOIS sunucusu başına sırada bekleyebilecek en fazla sorgu - dolarsa sorgu beklemeden reddedilir
+WHOIS_MAX_QUEUE = int(os.environ.get("WHOIS_MAX_QUEUE", 20))
+
+# Sunucuya özel aralıklar, örn: "whois.verisign-grs.com=0.2,whois.nic.tr=1.0"
+WHOIS_SERVER_INTERVALS = {
+    server.strip(): float(interval)
+    for server, interval in (
+        item.split("=", 1) for item in os.environ.get("WHOIS_RATE_LIMITS", "").split(",") if "=" in item
+    )
+}
+
+# Önbellek ayarları - "memory" veya "sqlite" (tek dosya, dış servis gerekmez)
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "memory").lower()
+CACHE_PATH = os.environ.get("CACHE_PATH", "/tmp/seo_tools_cache.sqlite3")
+CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", 5000))
+
+# WHOIS önbellek ayarları - "kayıt yok" ve hata sonuçları daha kısa süre tutulur
+WHOIS_CACHE_TTL = int(os.environ.get("WHOIS_CACHE_TTL", 6 * 3600))
+WHOIS_NEGATIVE_TTL = int(os.environ.get("WHOIS_NEGATIVE_TTL", 10 * 60))
+DNS_CACHE_TTL = int(os.environ.get("DNS_CACHE_TTL", 3600))
+DNS_NEGATIVE_TTL = int(os.environ.get("DNS_NEGATIVE_TTL", 10 * 60))
+TRENDS_CACHE_TTL = int(os.environ.get("TRENDS_CACHE_TTL", 6 * 3600))
+
+# Yanıt önbelleği - endpoint başına taze kalma süresi, sonrasında bayat yanıt verilip arka planda yenilenir
+RESPONSE_CACHE_TTLS = {
+    "get_keywords": int(os.environ.get("RESPONSE_TTL_KEYWORDS", 10 * 60)),
+    "find_seo_domains": int(os.environ.get("RESPONSE_TTL_SEO_DOMAINS", 30 * 60)),
+    "find_backlink_domains": int(os.environ.get("RESPONSE_TTL_BACKLINK_DOMAINS", 30 * 60))
+}
+RESPONSE_STALE_TTL = int(os.environ.get("RESPONSE_STALE_TTL", 60 * 60))
+RESPONSE_DEGRADED_TTL = int(os.environ.get("RESPONSE_DEGRADED_TTL", 60))  # Yerel öneri (yedek) sonuçları
+
+# DNS ön eleme ayarları (tek sorgu zaman aşımı, toplam süre, eşzamanlı sorgu sayısı)
+DNS_TIMEOUT = float(os.environ.get("DNS_TIMEOUT", 2.0))
+DNS_LIFETIME = float(os.environ.get("DNS_LIFETIME", 4.0))
+DNS_CONCURRENCY = int(os.environ.get("DNS_CONCURRENCY", 50))
+DNS_PRESCREEN_TYPES = ("A", "AAAA", "NS", "SOA")
+
+# Özel DNS sunucuları, örn: "1.1.1.1,8.8.8.8" veya "127.0.0.1:5353" (boşsa sistem ayarı kullanılır)
+DNS_NAMESERVERS = [item.strip() for item in os.environ.get("DNS_NAMESERVERS", "").split(",") if item.strip()]
+
+# Namespace başına varsayılan TTL
+CACHE_TTLS = {
+    "whois": WHOIS_CACHE_TTL,
+    "dns": DNS_CACHE_TTL,
+    "trends": TRENDS_CACHE_TTL,
+    "responses": max(RESPONSE_CACHE_TTLS.values()) + RESPONSE_STALE_TTL
+}
+
+# Metrik ve süre ölçümü - histogram kovaları (saniye)
+METRICS_PREFIX = "seo_tools"
+METRICS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRIC_DEFINITIONS = {
+    "stage_seconds": ("histogram", "Aşama bazında süre (dns, whois, trends, scoring, serialization)"),
+    "http_request_seconds": ("histogram", "Endpoint bazında istek süresi (stream yanıtlarında ilk bayta kadar)"),
+    "http_requests_total": ("counter", "Endpoint ve durum koduna göre istek sayısı"),
+    "provider_seconds": ("histogram", "Keyword sağlayıcı yarışında sağlayıcı süresi"),
+    "provider_results_total": ("counter", "Keyword sağlayıcı sonuçları (ok, failed, error, timeout, cancelled)"),
+    "response_cache_total": ("counter", "Yanıt önbelleği sonuçları (HIT, STALE, MISS)"),
+    "stage_errors_total": ("counter", "Aşama bazında hata sayısı")
+}
+
+class _Span:
+    """with bloğunun süresini histogram'a yazar (hata olursa hata sayacını da artırır)"""
+    
+    __slots__ = ("registry", "labels", "started")
+    
+    def __init__(self, registry, labels):
+        self.registry = registry
+        self.labels = labels
+    
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.registry.observe("stage_seconds", time.perf_counter() - self.started, self.labels)
+        if exc_type is not None:
+            self.registry.inc("stage_errors_total", self.labels)
+        return False
+
+class MetricsRegistry:
+    """
+    Süreç içi sayaç ve histogram kaydı - Prometheus metin formatında dışa aktarılır
+    Gözlem başına tek kilit ve sabit kova listesi üzerinde ikili arama yapılır.
+    """
+    
+    def __init__(self, prefix="seo_tools", buckets=METRICS_BUCKETS, definitions=None):
+        self.prefix = prefix
+        self.buckets = buckets
+        self.definitions = definitions or {}
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+    
+    def inc(self, name, labels=(), value=1):
+        key = (name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+    
+    def observe(self, name, seconds, labels=()):
+        key = (name, labels)
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            histogram[0][index] += 1
+            histogram[1] += seconds
+    
+    def span(self, stage):
+        """Aşama süresini ölçen context manager: with metrics.span("whois"): ..."""
+        return _Span(self, (("stage", stage),))
+    
+    @staticmethod
+    def _format_labels(labels, extra=()):
+        pairs = tuple(labels) + tuple(extra)
+        if not pairs:
+            return ""
+        escaped = (
+            (key, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+            for key, value in pairs
+        )
+        return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+    
+    def render(self, gauges=()):
+        """Prometheus metin formatı (text/plain; version=0.0.4)"""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: (list(value[0]), value[1]) for key, value in self._histograms.items()}
+        
+        lines = []
+        described = set()
+        
+        def describe(name, metric_type, help_text=None):
+            if name not in described:
+                described.add(name)
+                help_text = help_text or self.definitions.get(name, (None, name))[1]
+                lines.append(f"# HELP {self.prefix}_{name} {help_text}")
+                lines.append(f"# TYPE {self.prefix}_{name} {metric_type}")
+        
+        for (name, labels), value in sorted(counters.items()):
+            describe(name, "counter")
+            lines.append(f"{self.prefix}_{name}{self._format_labels(labels)} {value}")
+        
+        for (name, labels), (counts, total) in sorted(histograms.items()):
+            describe(name, "histogram")
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(f"{self.prefix}_{name}_bucket{self._format_labels(labels, (('le', bound),))} {cumulative}")
+            cumulative += counts[-1]
+            lines.append(f"{self.prefix}_{name}_bucket{self._format_labels(labels, (('le', '+Inf'),))} {cumulative}")
+            lines.append(f"{self.prefix}_{name}_sum{self._format_labels(labels)} {total}")
+            lines.append(f"{self.prefix}_{name}_count{self._format_labels(labels)} {cumulative}")
+        
+        # Anlık değerler (önbellek, devre kesici vb.) okuma anında eklenir: (ad, tip, açıklama, etiketler, değer)
+        # Aynı metriğin satırları bir arada olmalı - ada göre (kararlı) sıralanır
+        for name, metric_type, help_text, labels, value in sorted(gauges, key=lambda gauge: gauge[0]):
+            describe(name, metric_type, help_text)
+            lines.append(f"{self.prefix}_{name}{self._format_labels(labels)} {value}")
+        
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry(METRICS_PREFIX, METRICS_BUCKETS, METRIC_DEFINITIONS)
+
+# Keyword kategori verisi (öncelik sırası dosyadaki sıradır)
+CATEGORY_DATA_PATH = os.environ.get(
+    "CATEGORY_DATA_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "keyword_categories.json")
+)
+MATCH_SEPARATOR_PATTERN = re.compile(r'[^a-z0-9]+')
+
+def normalize_match_text(text):
+    """Kategori eşleştirmesi için metni normalize eder - kelime sınırları tek boşluk olarak kalır"""
+    return MATCH_SEPARATOR_PATTERN.sub(' ', text.translate(TR_TRANSLATION_TABLE).lower()).strip()
+
+class KeywordCategoryIndex:
+    """
+    Aho-Corasick otomatı ile keyword'ü tek geçişte tüm kategori desenleriyle eşleştirir
+    Her bölüm/ülke kaydının kendi desenleri vardır ("match": keyword içinde herhangi bir yerde,
+    "whole_words": sadece tam kelime); kayıtlar desen kimliği kümeleriyle tutulur.
+    """
+    
+    def __init__(self, categories):
+        self.categories = categories
+        self._goto = [{}]
+        self._fail = [0]
+        self._outputs = [[]]  # (desen uzunluğu, desen kimliği, tam kelime mi)
+        self._pattern_ids = {}
+        self._entry_patterns = {}  # (kategori sırası, bölüm, ülke) -> desen kimlikleri
+        
+        for priority, category in enumerate(categories):
+            for section, countries in category.items():
+                if not isinstance(countries, dict):
+                    continue
+                for country, entry in countries.items():
+                    ids = {self._add_pattern(pattern, False) for pattern in entry.get("match", [])}
+                    ids |= {self._add_pattern(pattern, True) for pattern in entry.get("whole_words", [])}
+                    ids.discard(None)
+                    self._entry_patterns[(priority, section, country)] = frozenset(ids)
+        self._build_failure_links()
+    
+    @classmethod
+    def from_file(cls, path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls(json.load(f)["categories"])
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            print(f"⚠️ Kategori verisi yüklenemedi ({path}): {e}")
+            return cls([])
+    
+    def _add_pattern(self, pattern, whole_word):
+        text = normalize_match_text(pattern)
+        if not text:
+            return None
+        key = (text, whole_word)
+        if key in self._pattern_ids:
+            return self._pattern_ids[key]
+        pattern_id = self._pattern_ids[key] = len(self._pattern_ids)
+        
+        state = 0
+        for char in text:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._outputs[state].append((len(text), pattern_id, whole_word))
+        return pattern_id
+    
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+    
+    def match(self, keyword):
+        """Keyword'de geçen desenlerin kimlik kümesi"""
+        text = normalize_match_text(keyword)
+        matched = set()
+        state = 0
+        
+        for end, char in enumerate(text, 1):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            
+            for length, pattern_id, whole_word in self._outputs[state]:
+                # Tam kelime desenleri iki yanda da kelime sınırında olmalı
+                if whole_word:
+                    start = end - length
+                    if (start > 0 and text[start - 1] != ' ') or (end < len(text) and text[end] != ' '):
+                        continue
+                matched.add(pattern_id)
+        
+        return frozenset(matched)
+    
+    def lookup(self, matched, section, country):
+        """Eşleşen desenlere uyan en öncelikli kategorinin bölüm/ülke verisi (yoksa None)"""
+        if not matched:
+            return None
+        for priority, category in enumerate(self.categories):
+            entry = category.get(section, {}).get(country)
+            if entry and matched & self._entry_patterns[(priority, section, country)]:
+                return entry["data"]
+        return None
+
+category_index = KeywordCategoryIndex.from_file(CATEGORY_DATA_PATH)
+
+@lru_cache(maxsize=4096)
+def match_keyword_categories(keyword):
+    return category_index.match(keyword)
+
+def get_category_data(keyword, section, country):
+    """Keyword'e uyan en öncelikli kategorinin bölüm/ülke verisini döndürür (yoksa None)"""
+    return category_index.lookup(match_keyword_categories(keyword), section, country)
 
 @app.route("/")
 def home():
     return render_template("index.html")
 
-# Birden fazla API'den veri çekme fonksiyonu
+# Keyword sağlayıcılarının paylaşılan thread havuzu; iptal edilen yavaş istekler yanıtı bekletmez
+provider_executor = ThreadPoolExecutor(max_workers=PROVIDER_WORKERS)
+
+def get_keyword_providers():
+    """Öncelik sırasına göre keyword sağlayıcıları: (ad, fonksiyon, süre sınırı)"""
+    return [
+        ("Google Trends", lambda keyword, country, cancel_event: get_google_trends_data(keyword, country, cancel_event), TRENDS_PROVIDER_DEADLINE),
+        ("Keyword Surfer", lambda keyword, country, cancel_event: get_keyword_surfer_data(keyword, country), FALLBACK_PROVIDER_DEADLINE),
+        ("Ubersuggest Alternative", lambda keyword, country, cancel_event: get_ubersuggest_alternative(keyword, country), FALLBACK_PROVIDER_DEADLINE)
+    ]
+
+class ProviderCancelEvent(threading.Event):
+    """Sağlayıcı iptal olayı - reason: "deadline" (sağlayıcı süresini doldurdu) veya "cancelled" (yarış bitti)"""
+    
+    def __init__(self):
+        super().__init__()
+        self.reason = None
+        self._callbacks = []
+        self._callback_lock = threading.Lock()
+    
+    def on_cancel(self, callback):
+        """İptal anında callback(reason) çağrılır (zaten iptal edildiyse hemen)"""
+        with self._callback_lock:
+            if self.reason is None:
+                self._callbacks.append(callback)
+                return
+        callback(self.reason)
+    
+    def cancel(self, reason):
+        with self._callback_lock:
+            if self.reason is not None:
+                return
+            self.reason = reason
+            callbacks, self._callbacks = self._callbacks, []
+        self.set()
+        for callback in callbacks:
+            callback(reason)
+
+def _timed_provider_call(name, func, keyword, country, cancel_event):
+    started = time.monotonic()
+    try:
+        result = func(keyword, country, cancel_event)
+        status = "ok" if result["success"] else "failed"
+    except Exception as e:
+        print(f"❌ {name} hatası: {e}")
+        result = {"success": False, "error": str(e)}
+        status = "error"
+    return {"status": status, "result": result, "latency_ms": int((time.monotonic() - started) * 1000)}
+
+def _pick_provider_winner(outcomes, provider_count):
+    """(kazanan, karar_verildi) - kazanan, kendinden öncekilerin hepsi bitmiş ilk başarılı sağlayıcıdır"""
+    for priority in range(provider_count):
+        if priority not in outcomes:
+            return None, False
+        if outcomes[priority]["status"] == "ok":
+            return priority, True
+    return None, True
+
+def race_keyword_providers(keyword, country, providers=None, budget=None):
+    """
+    Sağlayıcıları paralel başlatır ve bütçe içinde başarılı olan en öncelikli sağlayıcıyı seçer.
+    Daha öncelikli bir sağlayıcı süresini doldurana kadar beklenir; kazanan belli olunca
+    kalan sağlayıcılar iptal edilir. Dönüş: (kazanan sıra no veya None, sağlayıcı sonuçları)
+    """
+    providers = providers or get_keyword_providers()
+    budget = KEYWORD_REQUEST_BUDGET if budget is None else budget
+    started = time.monotonic()
+    
+    futures = {}
+    deadlines = []
+    cancel_events = []
+    for priority, (name, func, deadline) in enumerate(providers):
+        cancel_events.append(ProviderCancelEvent())
+        future = provider_executor.submit(_timed_provider_call, name, func, keyword, country, cancel_events[priority])
+        futures[future] = priority
+        deadlines.append(started + min(deadline, budget))
+    
+    outcomes = {}
+    pending = set(futures)
+    while True:
+        winner, decided = _pick_provider_winner(outcomes, len(providers))
+        if decided:
+            break
+        
+        now = time.monotonic()
+        expired = [future for future in pending if now >= deadlines[futures[future]]]
+        for future in expired:
+            pending.discard(future)
+            # Süresi dolan sağlayıcı hemen durdurulur; sebebi "deadline" (devre kesici için hata sayılır)
+            cancel_events[futures[future]].cancel("deadline")
+            outcomes[futures[future]] = {"status": "timeout", "result": None, "latency_ms": int((now - started) * 1000)}
+        if expired:
+            continue
+        
+        next_deadline = min(deadlines[futures[future]] for future in pending)
+        done, _ = wait(pending, timeout=max(next_deadline - now, 0), return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.discard(future)
+            outcomes[futures[future]] = future.result()
+    
+    # Kazanan belli - geride kalanlar iptal edilir
+    for cancel_event in cancel_events:
+        cancel_event.cancel("cancelled")
+    now = time.monotonic()
+    for future in pending:
+        future.cancel()
+        outcomes[futures[future]] = {"status": "cancelled", "result": None, "latency_ms": int((now - started) * 1000)}
+    
+    for priority, outcome in outcomes.items():
+        labels = (("provider", providers[priority][0]),)
+        metrics.inc("provider_results_total", labels + (("outcome", outcome["status"]),))
+        metrics.observe("provider_seconds", outcome["latency_ms"] / 1000, labels)
+    
+    return winner, outcomes
+
+def format_provider_timings(providers, outcomes):
+    icons = {"ok": "✅", "failed": "❌", "error": "❌", "timeout": "⏱️", "cancelled": "🚫"}
+    return ", ".join(
+        f"{name} {outcomes[priority]['latency_ms']}ms {icons[outcomes[priority]['status']]}"
+        for priority, (name, _, _) in enumerate(providers) if priority in outcomes
+    )
+
+# Sağlayıcı yarışının sonucunu endpoint yanıtına çevirir, hiçbiri veri döndürmezse yerel önerilere düşer
 def get_keyword_data_multi_api(keyword, country):
     """
-    Birden fazla API'den keyword verisi çeker
+    Birden fazla API'den keyword verisi çeker - sağlayıcılar paralel yarışır, öncelik sırası:
     1. Google Trends (pytrends)
-    2. Serpstack API (ücretsiz plan)
-    3. DataForSEO API (ücretsiz plan)
-    4. Keyword Tool API alternatifi
+    2. Keyword Surfer alternatifi
+    3. Ubersuggest alternatifi
+    4. Yerel öneriler (son çare)
     """
     
     result = {
@@ -35,55 +528,439 @@ def get_keyword_data_multi_api(keyword, country):
         "debug_info": ""
     }
     
-    # API 1: Google Trends (pytrends)
-    try:
-        print("🔍 API 1: Google Trends deneniyor...")
-        google_result = get_google_trends_data(keyword, country)
-        if google_result["success"]:
-            result.update(google_result["data"])
-            result["api_used"] = "Google Trends"
-            result["debug_info"] = "✅ Google Trends başarılı"
-            return {"success": True, "data": result}
-    except Exception as e:
-        print(f"❌ Google Trends hatası: {e}")
-    
-    # API 2: Serpstack benzeri ücretsiz alternatif
-    try:
-        print("🔍 API 2: Keyword Surfer alternatifi deneniyor...")
-        surfer_result = get_keyword_surfer_data(keyword, country)
-        if surfer_result["success"]:
-            result.update(surfer_result["data"])
-            result["api_used"] = "Keyword Surfer"
-            result["debug_info"] = "✅ Keyword Surfer başarılı"
-            return {"success": True, "data": result}
-    except Exception as e:
-        print(f"❌ Keyword Surfer hatası: {e}")
+    print("🔍 Keyword sağlayıcıları paralel başlatılıyor...")
+    providers = get_keyword_providers()
+    winner, outcomes = race_keyword_providers(keyword, country, providers)
+    timings = format_provider_timings(providers, outcomes)
     
-    # API 3: Ubersuggest benzeri ücretsiz alternatif
-    try:
-        print("🔍 API 3: Ubersuggest alternatifi deneniyor...")
-        uber_result = get_ubersuggest_alternative(keyword, country)
-        if uber_result["success"]:
-            result.update(uber_result["data"])
-            result["api_used"] = "Ubersuggest Alternative"
-            result["debug_info"] = "✅ Ubersuggest Alternative başarılı"
-            return {"success": True, "data": result}
-    except Exception as e:
-        print(f"❌ Ubersuggest Alternative hatası: {e}")
+    if winner is not None:
+        name = providers[winner][0]
+        result.update(outcomes[winner]["result"]["data"])
+        result["api_used"] = name
+        result["debug_info"] = f"✅ {name} başarılı | {timings}"
+        return {"success": True, "data": result}
     
     # API 4: Son çare - basit öneriler
     print("🔍 API 4: Yerel öneriler sistemi...")
     local_result = get_local_suggestions(keyword, country)
     result.update(local_result["data"])
     result["api_used"] = "Yerel Öneriler"
-    result["debug_info"] = "⚠️ Tüm API'ler başarısız - yerel öneriler kullanıldı"
+    result["debug_info"] = f"⚠️ Tüm API'ler başarısız - yerel öneriler kullanıldı | {timings}"
     
     return {"success": True, "data": result}
 
-def get_google_trends_data(keyword, country):
-    """Google Trends API'si"""
+class CircuitBreaker:
+    """
+    Sağlayıcı başına devre kesici (closed / open / half-open)
+    - closed: istekler serbest, art arda hatalar sayılır
+    - open: istekler beklemeden reddedilir, bekleme süresi dolunca half-open'a geçer
+    - half-open: tek bir deneme isteğine izin verilir; başarılıysa closed, değilse bekleme süresi
+      ikiye katlanarak tekrar open
+    Rate limit (429) hatası eşiği beklemeden devreyi açar.
+    """
+    
+    def __init__(self, name, failure_threshold=3, base_cooldown=30.0, max_cooldown=600.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.cooldown = base_cooldown
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+    
+    def allow_request(self):
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < self.cooldown:
+                    self.rejected += 1
+                    return False
+                self.state = "half-open"
+                self._probe_in_flight = False
+            
+            if self.state == "half-open":
+                if self._probe_in_flight:
+                    self.rejected += 1
+                    return False
+                self._probe_in_flight = True
+            return True
+    
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.consecutive_failures = 0
+            self.cooldown = self.base_cooldown
+            self._probe_in_flight = False
+    
+    def record_failure(self, rate_limited=False):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == "half-open":
+                # Deneme başarısız - bekleme süresi uyarlanarak artırılır
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+                self._open()
+            elif rate_limited or self.consecutive_failures >= self.failure_threshold:
+                self._open()
+    
+    def release_probe(self):
+        """Sonuçsuz biten (iptal edilen) deneme isteği için half-open kilidini bırakır"""
+        with self._lock:
+            self._probe_in_flight = False
+    
+    def _open(self):
+        self.state = "open"
+        self.opened_at = time.monotonic()
+        self._probe_in_flight = False
+        print(f"🔌 {self.name} devre kesici açıldı ({self.cooldown:.0f}s)")
+    
+    def attempt_delay(self, base_delay):
+        """Denemeler arası gecikme - gözlenen art arda hatalarla üstel artar"""
+        return min(base_delay * (2 ** min(self.consecutive_failures, 4)), base_delay * 16)
+    
+    def snapshot(self):
+        with self._lock:
+            remaining = max(self.cooldown - (time.monotonic() - self.opened_at), 0) if self.state == "open" else 0
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "cooldown": self.cooldown,
+                "retry_in": round(remaining, 1),
+                "rejected": self.rejected
+            }
+
+trends_breaker = CircuitBreaker("Google Trends", TRENDS_FAILURE_THRESHOLD, TRENDS_BASE_COOLDOWN, TRENDS_MAX_COOLDOWN)
+
+def classify_trends_error(error):
+    """pytrends/requests hatasını "rate_limited", "timeout" veya None olarak sınıflandırır"""
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429 or isinstance(error, requests.exceptions.RetryError):
+        return "rate_limited"
+    if "429" in str(error):
+        return "rate_limited"
+    if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        return "timeout"
+    return None
+
+class PooledTrendReq(TrendReq):
+    """
+    Kalıcı requests oturumu kullanan TrendReq
+    pytrends her istekte yeni bir session (yeni TCP/TLS bağlantısı) açar; burada havuzun
+    verdiği oturum keep-alive ile tekrar kullanılır ve NID çerezi havuzdan paylaşılır.
+    """
+    
+    def __init__(self, pool, **kwargs):
+        self.pool = pool
+        self.broken = False
+        self.session = pool.new_session()
+        super().__init__(**kwargs)
+    
+    def GetGoogleCookie(self):
+        return self.pool.shared_cookies(self)
+    
+    def fetch_google_cookie(self):
+        response = self.session.get(f"{TRENDS_BASE_URL}/?geo={self.hl[-2:]}", timeout=self.timeout, **self.requests_args)
+        return {name: value for name, value in response.cookies.items() if name == "NID"}
+    
+    def _get_data(self, url, method=TrendReq.GET_METHOD, trim_chars=0, **kwargs):
+        self.cookies = self.pool.shared_cookies(self)
+        if TRENDS_BASE_URL != GOOGLE_TRENDS_ORIGIN:
+            url = url.replace(GOOGLE_TRENDS_ORIGIN, TRENDS_BASE_URL, 1)
+        if method == TrendReq.POST_METHOD:
+            response = self.session.post(url, timeout=self.timeout, cookies=self.cookies, **kwargs, **self.requests_args)
+        else:
+            response = self.session.get(url, timeout=self.timeout, cookies=self.cookies, **kwargs, **self.requests_args)
+        
+        content_type = response.headers.get("Content-Type", "")
+        if response.status_code == 200 and any(kind in content_type for kind in ("application/json", "application/javascript", "text/javascript")):
+            return json.loads(response.text[trim_chars:])
+        
+        raise pytrends_exceptions.ResponseError(
+            f"The request failed: Google returned a response with code {response.status_code}.",
+            response=response
+        )
+    
+    def close(self):
+        self.session.close()
+
+class TrendReqPool:
+    """
+    Sınırlı boyutlu, thread-safe Google Trends istemci havuzu
+    - İstemciler ilk ihtiyaçta oluşturulur ve checkout/iade ile tekrar kullanılır
+    - Bir istemci aynı anda tek thread'e verilir (TrendReq payload durumunu nesnede tutar)
+    - Bağlantı hatası veren istemcinin oturumu kapatılıp havuzdan çıkarılır
+    """
+    
+    def __init__(self, size=4, checkout_timeout=5.0, cookie_ttl=1800.0, **client_kwargs):
+        self.size = size
+        self.checkout_timeout = checkout_timeout
+        self.cookie_ttl = cookie_ttl
+        self.client_kwargs = client_kwargs
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.waits = 0
+        self._idle = deque()
+        self._cookies = None
+        self._cookies_at = 0.0
+        self._cookie_lock = threading.Lock()
+        self._condition = threading.Condition()
+    
+    def new_session(self):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        session.mount("https://", adapter)
+        session.headers.update({"accept-language": self.client_kwargs.get("hl", "tr-TR")})
+        return session
+    
+    def shared_cookies(self, client):
+        """NID çerezi havuz genelinde bir kez alınır, TTL dolunca yenilenir"""
+        with self._cookie_lock:
+            if self._cookies is None or time.monotonic() - self._cookies_at > self.cookie_ttl:
+                self._cookies = client.fetch_google_cookie()
+                self._cookies_at = time.monotonic()
+            return self._cookies
+    
+    def _acquire(self):
+        deadline = time.monotonic() + self.checkout_timeout
+        with self._condition:
+            while True:
+                if self._idle:
+                    self.reused += 1
+                    return self._idle.pop()
+                if self.created < self.size:
+                    self.created += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("Google Trends istemci havuzu meşgul")
+                self.waits += 1
+                self._condition.wait(remaining)
+        
+        # İstemci kilit dışında oluşturulur (çerez isteği yapabilir)
+        try:
+            return PooledTrendReq(self, **self.client_kwargs)
+        except Exception:
+            with self._condition:
+                self.created -= 1
+                self._condition.notify()
+            raise
+    
+    def _release(self, client, discard=False):
+        with self._condition:
+            if discard:
+                self.created -= 1
+                self.discarded += 1
+            else:
+                self._idle.append(client)
+            self._condition.notify()
+        if discard:
+            client.close()
+    
+    @contextmanager
+    def checkout(self):
+        client = self._acquire()
+        try:
+            yield client
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            client.broken = True
+            raise
+        finally:
+            self._release(client, discard=client.broken)
+    
+    def stats(self):
+        with self._condition:
+            return {
+                "size": self.size,
+                "created": self.created,
+                "idle": len(self._idle),
+                "reused": self.reused,
+                "discarded": self.discarded,
+                "waits": self.waits
+            }
+
+# Yeniden deneme politikası devre kesicide - urllib3 tekrarları 429'da sadece süre kaybettirir
+trends_pool = TrendReqPool(TRENDS_POOL_SIZE, TRENDS_POOL_TIMEOUT, TRENDS_COOKIE_TTL, hl='tr-TR', tz=180, timeout=(15,30), retries=0)
+
+class TrendsBatcher:
+    """
+    Google Trends sorgularını 5 terimlik payload'larda toplar
+    - Bir keyword'ün varyasyonları aynı payload'a girer
+    - Kısa pencere içinde aynı (ülke, zaman aralığı, terimler) için gelen istekler aynı payload'ı paylaşır
+    - Farklı keyword'ler birleştirilmez: Trends değerleri payload'daki en büyük terime göre
+      ölçeklenir, niş bir keyword başka bir kullanıcının popüler keyword'ü yanında 0'a yuvarlanırdı
+    - İlgili sorgular sadece kullanılacak terim (sıradaki ilk ilgisi > 0 olan) için alınır
+    """
+    
+    def __init__(self, pool, window=0.05, max_terms=5):
+        self.pool = pool
+        self.window = window
+        self.max_terms = max_terms
+        self.payloads = 0
+        self.terms = 0
+        self.coalesced = 0
+        self._pending = {}
+        self._lock = threading.Lock()
+    
+    def _join(self, key):
+        """Aynı terimler için açık gruba katılır, yoksa yeni grup açar. (grup, lider mi) döndürür"""
+        with self._lock:
+            batch = self._pending.get(key)
+            if batch is not None:
+                self.coalesced += 1
+                return batch, False
+            
+            batch = {"terms": list(key[2]), "future": Future()}
+            self._pending[key] = batch
+            return batch, True
+    
+    def query(self, terms, geo, timeframe, cancel_event=None):
+        """
+        Terimlerin toplam ilgisini döndürür: {terim: {"total", "related_queries"}}
+        related_queries sadece ilgisi olan ilk terim için doludur (diğerleri için {})
+        cancel_event ayarlanırsa bekleme bırakılır ve None döner (grup diğerleri için çalışmaya devam eder)
+        """
+        results = {}
+        for start in range(0, len(terms), self.max_terms):
+            key = (geo, timeframe, tuple(dict.fromkeys(terms[start:start + self.max_terms])))
+            batch, leader = self._join(key)
+            
+            if leader:
+                if _cancellable_sleep(self.window, cancel_event):
+                    self._close(key, batch)
+                    batch["future"].set_result(None)
+                    return None
+                self._close(key, batch)
+                try:
+                    batch["future"].set_result(self._execute(batch["terms"], geo, timeframe))
+                except Exception as e:
+                    batch["future"].set_exception(e)
+            
+            while not batch["future"].done():
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+                wait([batch["future"]], timeout=0.1)
+            
+            batch_results = batch["future"].result()
+            if batch_results is None:
+                # Lider iptal edildi - terimler yeniden sorgulanır
+                batch_results = self.query(terms[start:start + self.max_terms], geo, timeframe, cancel_event)
+                if batch_results is None:
+                    return None
+            results.update(batch_results)
+        
+        return {term: results[term] for term in terms}
+    
+    def _close(self, key, batch):
+        with self._lock:
+            if self._pending.get(key) is batch:
+                del self._pending[key]
+    
+    def _execute(self, terms, geo, timeframe):
+        with self.pool.checkout() as client:
+            with metrics.span("trends_build_payload"):
+                client.build_payload(kw_list=terms, geo=geo, timeframe=timeframe)
+            with metrics.span("trends_interest_over_time"):
+                interest_over_time = client.interest_over_time()
+            with self._lock:
+                self.payloads += 1
+                self.terms += len(terms)
+            
+            totals = {
+                term: int(interest_over_time[term].sum()) if not interest_over_time.empty and term in interest_over_time else 0
+                for term in terms
+            }
+            
+            # related_queries() payload'daki her terim için ayrı istek atar - sadece kullanılacak terim sorgulanır
+            selected = next((term for term in terms if totals[term] > 0), None)
+            related = {}
+            if selected is not None:
+                client.related_queries_widget_list[:] = [
+                    widget for widget in client.related_queries_widget_list
+                    if widget['request']['restriction']['complexKeywordsRestriction']['keyword'][0]['value'] == selected
+                ]
+                _cancellable_sleep(trends_breaker.attempt_delay(TRENDS_ATTEMPT_DELAY) / 2)
+                with metrics.span("trends_related_queries"):
+                    query_data = (client.related_queries() or {}).get(selected) or {}
+                if query_data.get('top') is not None and not query_data['top'].empty:
+                    related["top"] = shape_query_records(query_data['top'])
+                if query_data.get('rising') is not None and not query_data['rising'].empty:
+                    related["rising"] = shape_query_records(query_data['rising'])
+        
+        return {term: {"total": totals[term], "related_queries": related if term == selected else {}} for term in terms}
+    
+    def stats(self):
+        with self._lock:
+            return {
+                "payloads": self.payloads,
+                "terms": self.terms,
+                "terms_per_payload": round(self.terms / self.payloads, 2) if self.payloads else 0,
+                "coalesced_keywords": self.coalesced
+            }
+
+def shape_query_records(frame, limit=10):
+    """
+    İlgili sorgu tablosunun ilk `limit` satırı -> [{"query": ..., "value": ...}]
+    to_dict('records') yerine sütunlar tek seferde düz Python tiplerine çevrilir.
+    """
+    frame = frame.head(limit)
+    columns = list(frame.columns)
+    return [dict(zip(columns, row)) for row in zip(*(frame[column].tolist() for column in columns))]
+
+trends_batcher = TrendsBatcher(trends_pool, TRENDS_BATCH_WINDOW, TRENDS_BATCH_SIZE)
+
+def _cancellable_sleep(seconds, cancel_event=None):
+    """Bekler; bekleme sırasında iptal edilirse True döner"""
+    if cancel_event is None:
+        time.sleep(seconds)
+        return False
+    return cancel_event.wait(seconds)
+
+def get_google_trends_data(keyword, country, cancel_event=None):
+    """Google Trends API'si (başarılı sonuçlar önbelleğe alınır)"""
+    cache_key = f"{country.upper()}|{query_keyword(keyword)}"
+    cached = cache_backend.get("trends", cache_key)
+    if cached is not None:
+        return cached
+    
+    # Devre açıksa beklemeden yedek sağlayıcılara geçilir
+    if not trends_breaker.allow_request():
+        retry_in = trends_breaker.snapshot()["retry_in"]
+        return {"success": False, "error": f"Google Trends devre kesici açık ({retry_in}s sonra tekrar denenecek)"}
+    
+    if isinstance(cancel_event, ProviderCancelEvent):
+        # Yarış süresini dolduran çağrı yavaş upstream'dir (çağıranın vazgeçmesi değil) - yanıtın
+        # bitmesi beklenmeden o anda hata sayılır, böylece devre sonraki istekler için açılabilir
+        def record_deadline(reason):
+            if reason == "deadline":
+                trends_breaker.record_failure()
+        cancel_event.on_cancel(record_deadline)
+    
+    result = fetch_google_trends_data(keyword, country, cancel_event)
+    deadline_missed = getattr(cancel_event, "reason", None) == "deadline"
+    if deadline_missed and result.get("error_type") == "cancelled":
+        result = {"success": False, "error": "Google Trends süre sınırı aşıldı", "error_type": "timeout"}
+    if result["success"]:
+        cache_backend.set("trends", cache_key, result)
+    
+    if deadline_missed:
+        pass  # Hata süre dolduğunda sayıldı
+    elif result["success"]:
+        trends_breaker.record_success()
+    elif result.get("error_type") in ("rate_limited", "timeout"):
+        trends_breaker.record_failure(rate_limited=result["error_type"] == "rate_limited")
+    elif result.get("error_type") in ("cancelled", "busy"):
+        trends_breaker.release_probe()
+    else:
+        # Google yanıt verdi ama veri yok - sağlayıcı sağlıklı
+        trends_breaker.record_success()
+    return result
+
+def fetch_google_trends_data(keyword, country, cancel_event=None):
+    """Google Trends'ten canlı veri çeker (cancel_event ayarlanırsa denemeler arasında durur)"""
     try:
-        pytrends = TrendReq(hl='tr-TR', tz=180, timeout=(15,30), retries=1, backoff_factor=1.0)
         geo_code = country if len(country) == 2 else ""
         
         # Daha az agresif arama
@@ -94,47 +971,527 @@ def get_google_trends_data(keyword, country):
             keyword_variations = ["altın", "gram altın", "altın fiyatı"]
         
         for i, timeframe in enumerate(timeframes):
-            for j, kw_variant in enumerate(keyword_variations):
-                try:
-                    if i > 0 or j > 0:
-                        time.sleep(2)
-                    
-                    pytrends.build_payload(kw_list=[kw_variant], geo=geo_code, timeframe=timeframe)
-                    
-                    # İlgi düzeyini al
-                    interest_over_time = pytrends.interest_over_time()
-                    if not interest_over_time.empty and interest_over_time[kw_variant].sum() > 0:
-                        
-                        # İlgili sorguları al
-                        time.sleep(1)
-                        related_queries = pytrends.related_queries()
-                        
+            try:
+                if i > 0 and _cancellable_sleep(trends_breaker.attempt_delay(TRENDS_ATTEMPT_DELAY), cancel_event):
+                    return {"success": False, "error": "Google Trends isteği iptal edildi", "error_type": "cancelled"}
+                
+                # Keyword'ün tüm varyasyonları tek payload'da sorgulanır
+                batch_results = trends_batcher.query(keyword_variations, geo_code, timeframe, cancel_event)
+                if batch_results is None:
+                    return {"success": False, "error": "Google Trends isteği iptal edildi", "error_type": "cancelled"}
+                
+                for kw_variant in keyword_variations:
+                    variant_data = batch_results[kw_variant]
+                    if variant_data["total"] > 0:
                         result_data = {
-                            "interest_data": f"✅ Veri mevcut ({timeframe}) - Toplam ilgi: {interest_over_time[kw_variant].sum()}",
+                            "interest_data": f"✅ Veri mevcut ({timeframe}) - Toplam ilgi: {variant_data['total']}",
                             "keyword": kw_variant,
-                            "related_queries": {}
+                            "related_queries": variant_data["related_queries"]
                         }
-                        
-                        if related_queries and kw_variant in related_queries:
-                            query_data = related_queries[kw_variant]
-                            
-                            if query_data.get('top') is not None and not query_data['top'].empty:
-                                result_data["related_queries"]["top"] = query_data['top'].head(10).to_dict('records')
-                            
-                            if query_data.get('rising') is not None and not query_data['rising'].empty:
-                                result_data["related_queries"]["rising"] = query_data['rising'].head(10).to_dict('records')
-                        
                         return {"success": True, "data": result_data}
-                        
-                except Exception as e:
-                    print(f"Google Trends varyasyon hatası: {e}")
-                    continue
+                    
+            except TimeoutError as e:
+                return {"success": False, "error": str(e), "error_type": "busy"}
+            except Exception as e:
+                print(f"Google Trends sorgu hatası: {e}")
+                error_type = classify_trends_error(e)
+                if error_type:
+                    # 429 / zaman aşımında diğer zaman aralığını denemek sadece süre kaybettirir
+                    return {"success": False, "error": f"Google Trends hatası: {str(e)}", "error_type": error_type}
+                continue
         
         # Hiçbir varyasyon çalışmazsa
         return {"success": False, "error": "Google Trends verisi alınamadı"}
         
     except Exception as e:
-        return {"success": False, "error": f"Google Trends API hatası: {str(e)}"}
+        # Çerez alma gibi havuz dışı hatalar da devre kesiciye yansır
+        return {"success": False, "error": f"Google Trends API hatası: {str(e)}", "error_type": classify_trends_error(e)}
+
+# TLD -> WHOIS sunucusu eşleşmesi (hız sınırlaması sunucu bazında yapılır)
+WHOIS_SERVERS = {
+    "com": "whois.verisign-grs.com",
+    "net": "whois.verisign-grs.com",
+    "org": "whois.pir.org",
+    "info": "whois.afilias.net",
+    "biz": "whois.biz",
+    "tr": "whois.nic.tr"
+}
+
+class WhoisUnavailable(Exception):
+    """WHOIS sorgusu yapılmadı (kuyruk dolu veya istek iptal edildi) - sonuç önbelleğe alınmaz"""
+    pass
+
+class WhoisRateLimiter:
+    """WHOIS sunucusu başına minimum istek aralığı uygular (thread-safe, sınırlı kuyruk)"""
+    
+    def __init__(self, default_interval=0.5, server_intervals=None, max_queue=20):
+        self.default_interval = default_interval
+        self.server_intervals = server_intervals or {}
+        self.max_queue = max_queue
+        self._next_slot = {}
+        self._lock = threading.Lock()
+    
+    def server_for(self, domain):
+        tld = domain.rsplit('.', 1)[-1].lower()
+        return WHOIS_SERVERS.get(tld, tld)
+    
+    def wait(self, domain, cancel_event=None):
+        """
+        Sunucudaki sıradaki boş zaman dilimine kadar bekler
+        Kuyruk doluysa veya bekleme sırasında cancel_event ayarlanırsa WhoisUnavailable fırlatır.
+        """
+        server = self.server_for(domain)
+        interval = self.server_intervals.get(server, self.default_interval)
+        
+        # Sıradaki boş zaman dilimini ayır, beklemeyi kilit dışında yap
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(server, 0.0))
+            if interval > 0 and (slot - now) / interval >= self.max_queue:
+                raise WhoisUnavailable(f"WHOIS kuyruğu dolu ({server})")
+            self._next_slot[server] = slot + interval
+        
+        delay = slot - now
+        if delay > 0 and _cancellable_sleep(delay, cancel_event):
+            with self._lock:
+                # Sıradaki son dilim bizimse geri verilir
+                if self._next_slot.get(server) == slot + interval:
+                    self._next_slot[server] = slot
+            raise WhoisUnavailable("WHOIS sorgusu iptal edildi")
+
+whois_rate_limiter = WhoisRateLimiter(WHOIS_MIN_INTERVAL, WHOIS_SERVER_INTERVALS, WHOIS_MAX_QUEUE)
+
+class TTLCache:
+    """Boyut sınırlı, TTL destekli LRU önbellek (thread-safe)"""
+    
+    def __init__(self, maxsize=1024, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+    
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+    
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0
+            }
+
+class MemoryCacheBackend:
+    """Süreç içi önbellek - her namespace için ayrı LRU"""
+    
+    def __init__(self, namespace_ttls=None, max_entries=5000):
+        self.namespace_ttls = namespace_ttls or {}
+        self.max_entries = max_entries
+        self._caches = {}
+        self._lock = threading.Lock()
+    
+    def _cache(self, namespace):
+        with self._lock:
+            if namespace not in self._caches:
+                ttl = self.namespace_ttls.get(namespace, 3600)
+                self._caches[namespace] = TTLCache(self.max_entries, ttl)
+            return self._caches[namespace]
+    
+    def get(self, namespace, key, default=None):
+        return self._cache(namespace).get(key, default)
+    
+    def set(self, namespace, key, value, ttl=None):
+        self._cache(namespace).set(key, value, ttl)
+    
+    def compact(self):
+        pass
+    
+    def stats(self):
+        with self._lock:
+            caches = dict(self._caches)
+        return {
+            "backend": "memory",
+            "namespaces": {namespace: cache.stats() for namespace, cache in caches.items()}
+        }
+
+class SQLiteCacheBackend:
+    """Tek dosyalık kalıcı önbellek (SQLite) - soğuk başlatmalar arasında korunur"""
+    
+    COMPACT_EVERY = 500  # Bu kadar yazmada bir sıkıştırma yapılır
+    
+    def __init__(self, path, namespace_ttls=None, max_entries=5000):
+        self.path = path
+        self.namespace_ttls = namespace_ttls or {}
+        self.max_entries = max_entries
+        self.read_only = False
+        self._hits = {}
+        self._misses = {}
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS cache_lru ON cache (namespace, accessed_at)")
+        except sqlite3.OperationalError as e:
+            # Deploy ile gelen salt okunur dosya - sadece okuma yapılır
+            print(f"⚠️ Önbellek dosyası salt okunur açıldı: {e}")
+            self.read_only = True
+    
+    def get(self, namespace, key, default=None):
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                    (namespace, key)
+                ).fetchone()
+            except sqlite3.Error as e:
+                print(f"Önbellek okuma hatası: {e}")
+                row = None
+            
+            if row is None or row[1] <= now:
+                self._misses[namespace] = self._misses.get(namespace, 0) + 1
+                return default
+            
+            self._hits[namespace] = self._hits.get(namespace, 0) + 1
+            if not self.read_only:
+                try:
+                    self._conn.execute(
+                        "UPDATE cache SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                        (now, namespace, key)
+                    )
+                except sqlite3.Error:
+                    pass
+        return json.loads(row[0])
+    
+    def set(self, namespace, key, value, ttl=None):
+        if self.read_only:
+            return
+        
+        ttl = self.namespace_ttls.get(namespace, 3600) if ttl is None else ttl
+        now = time.time()
+        payload = json.dumps(value, ensure_ascii=False, default=json_default)
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (namespace, key, payload, now + ttl, now)
+                )
+            except sqlite3.Error as e:
+                print(f"Önbellek yazma hatası: {e}")
+                return
+            self._writes += 1
+            should_compact = self._writes % self.COMPACT_EVERY == 0
+        
+        if should_compact:
+            self.compact()
+    
+    def compact(self, vacuum=False):
+        """Süresi dolan kayıtları siler ve her namespace'i boyut sınırına indirir"""
+        if self.read_only:
+            return
+        
+        with self._lock:
+            try:
+                self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+                namespaces = [row[0] for row in self._conn.execute("SELECT DISTINCT namespace FROM cache")]
+                for namespace in namespaces:
+                    # En az kullanılanlar silinir (LRU)
+                    self._conn.execute(
+                        "DELETE FROM cache WHERE namespace = ? AND key IN ("
+                        "SELECT key FROM cache WHERE namespace = ? "
+                        "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                        (namespace, namespace, self.max_entries)
+                    )
+                if vacuum:
+                    self._conn.execute("VACUUM")
+            except sqlite3.Error as e:
+                print(f"Önbellek sıkıştırma hatası: {e}")
+    
+    def stats(self):
+        with self._lock:
+            try:
+                sizes = dict(self._conn.execute("SELECT namespace, COUNT(*) FROM cache GROUP BY namespace").fetchall())
+            except sqlite3.Error:
+                sizes = {}
+            namespaces = set(sizes) | set(self._hits) | set(self._misses)
+            result = {}
+            for namespace in namespaces:
+                hits = self._hits.get(namespace, 0)
+                misses = self._misses.get(namespace, 0)
+                total = hits + misses
+                result[namespace] = {
+                    "size": sizes.get(namespace, 0),
+                    "maxsize": self.max_entries,
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": round(hits / total, 3) if total else 0.0
+                }
+        return {"backend": "sqlite", "path": self.path, "read_only": self.read_only, "namespaces": result}
+
+def create_cache_backend():
+    """Ortam değişkenlerine göre önbellek backend'i oluşturur"""
+    if CACHE_BACKEND == "sqlite":
+        try:
+            return SQLiteCacheBackend(CACHE_PATH, CACHE_TTLS, CACHE_MAX_ENTRIES)
+        except sqlite3.Error as e:
+            print(f"⚠️ SQLite önbellek açılamadı, bellek içi önbellek kullanılıyor: {e}")
+    return MemoryCacheBackend(CACHE_TTLS, CACHE_MAX_ENTRIES)
+
+cache_backend = create_cache_backend()
+
+def whois_lookup(domain, cancel_event=None):
+    """Hız sınırlamalı WHOIS sorgusu"""
+    whois_rate_limiter.wait(domain, cancel_event)
+    with metrics.span("whois"):
+        return whois.whois(domain)
+
+def _whois_date_text(value):
+    # /check_domain'in yanıt biçimi: str(değer) ("2005-01-01 00:00:00", liste ise listenin metni)
+    return str(value) if value else None
+
+def _whois_created_at(value):
+    # Yaş hesabı için ilk oluşturma tarihi (ISO) - tarih olarak ayrıştırılamadıysa None
+    if isinstance(value, list):
+        value = value[0] if value else None
+    return value.isoformat() if hasattr(value, "isoformat") else None
+
+def get_whois_record(domain, cancel_event=None):
+    """WHOIS kaydını JSON uyumlu özet olarak döndürür (önbellekli, negatif önbellekli)"""
+    key = domain.lower()
+    record = cache_backend.get("whois", key)
+    if record is not None and ("created_at" in record or "error" in record):
+        return record  # created_at'i olmayan eski biçimli kayıtlar yeniden sorgulanır
+    
+    try:
+        domain_info = whois_lookup(domain, cancel_event)
+        if domain_info is None or not (getattr(domain_info, "text", "") or "").strip():
+            # Bağlantı yanıtsız kapandı - "kayıt yok" anlamına gelmez
+            raise Exception("WHOIS sunucusu boş yanıt döndü")
+        record = {
+            "registered": bool(domain_info and domain_info.domain_name),
+            "registrar": domain_info.registrar if domain_info else None,
+            "creation_date": _whois_date_text(domain_info.creation_date),
+            "expiration_date": _whois_date_text(domain_info.expiration_date),
+            "created_at": _whois_created_at(domain_info.creation_date)
+        }
+    except WhoisUnavailable as e:
+        # Sorgu hiç yapılmadı - sonuç bilinmiyor, sonraki istekler yeniden denesin
+        return {"registered": False, "error": str(e), "unchecked": True}
+    except PywhoisError:
+        # Sunucu "kayıt bulunamadı" yanıtı verdi - domain kayıtlı değil
+        record = {"registered": False, "registrar": None, "creation_date": None, "expiration_date": None, "created_at": None}
+    except Exception as e:
+        # Bağlantı / ayrıştırma hatası - "error" içeren kayıt kayıtsız değil, bilinmiyor demektir
+        record = {"registered": False, "error": str(e)}
+    
+    # "Kayıt yok" ve hata sonuçları daha kısa süre tutulur
+    ttl = WHOIS_CACHE_TTL if record["registered"] else WHOIS_NEGATIVE_TTL
+    cache_backend.set("whois", key, record, ttl=ttl)
+    return record
+
+_async_resolver = None
+_async_resolver_lock = threading.Lock()
+
+def get_async_resolver():
+    """Açık zaman aşımlarıyla paylaşılan asenkron DNS resolver"""
+    global _async_resolver
+    with _async_resolver_lock:
+        if _async_resolver is None:
+            resolver = dns.asyncresolver.Resolver()
+            resolver.timeout = DNS_TIMEOUT
+            resolver.lifetime = DNS_LIFETIME
+            if DNS_NAMESERVERS:
+                # "adres:port" biçiminde port verilirse tüm sunucular için kullanılır
+                hosts = [item.rsplit(":", 1) if item.count(":") == 1 else [item] for item in DNS_NAMESERVERS]
+                resolver.nameservers = [parts[0] for parts in hosts]
+                ports = [int(parts[1]) for parts in hosts if len(parts) == 2]
+                if ports:
+                    resolver.port = ports[0]
+            _async_resolver = resolver
+        return _async_resolver
+
+async def _classify_domain_dns(resolver, domain, semaphore):
+    """A/AAAA/NS/SOA sorgularıyla domain'i NXDOMAIN / NOERROR olarak sınıflandırır"""
+    async def query(rdtype):
+        async with semaphore:
+            return await resolver.resolve(domain, rdtype, raise_on_no_answer=False)
+    
+    answers = await asyncio.gather(*(query(rdtype) for rdtype in DNS_PRESCREEN_TYPES), return_exceptions=True)
+    
+    record_types = []
+    noerror = False
+    nxdomain = False
+    for rdtype, answer in zip(DNS_PRESCREEN_TYPES, answers):
+        if isinstance(answer, dns.resolver.NXDOMAIN):
+            nxdomain = True
+        elif isinstance(answer, Exception):
+            continue  # Zaman aşımı, SERVFAIL vb. - karar verilemez
+        else:
+            noerror = True
+            if answer.rrset is not None:
+                record_types.append(rdtype)
+    
+    if noerror:
+        status = "registered"  # NOERROR: isim mevcut
+    elif nxdomain:
+        status = "available"  # NXDOMAIN: delegasyon yok
+    else:
+        status = "ambiguous"  # Sadece WHOIS karar verebilir
+    
+    return {"status": status, "records": record_types}
+
+async def _prescreen_domains_async(domains):
+    resolver = get_async_resolver()
+    semaphore = asyncio.Semaphore(DNS_CONCURRENCY)
+    results = await asyncio.gather(*(_classify_domain_dns(resolver, domain, semaphore) for domain in domains))
+    return dict(zip(domains, results))
+
+def prescreen_domains_dns(domains):
+    """Tüm adayları tek seferde asenkron DNS ile sınıflandırır (önbellekli)"""
+    results = {}
+    pending = []
+    for domain in domains:
+        cached = cache_backend.get("dns", domain.lower())
+        if cached is not None:
+            results[domain] = cached
+        elif domain not in pending:
+            pending.append(domain)
+    
+    if pending:
+        try:
+            with metrics.span("dns_prescreen"):
+                fresh = asyncio.run(_prescreen_domains_async(pending))
+        except Exception as e:
+            print(f"DNS ön eleme hatası: {e}")
+            fresh = {domain: {"status": "ambiguous", "records": []} for domain in pending}
+        
+        for domain, record in fresh.items():
+            # Belirsiz sonuçlar önbelleğe alınmaz, bir sonraki istekte tekrar denenir
+            if record["status"] != "ambiguous":
+                ttl = DNS_CACHE_TTL if record["status"] == "registered" else DNS_NEGATIVE_TTL
+                cache_backend.set("dns", domain.lower(), record, ttl=ttl)
+            results[domain] = record
+    
+    return results
+
+def iter_concurrent_results(func, items, max_workers=None, cancel_event=None):
+    """
+    func'ı öğeler üzerinde paralel çalıştırır, (sıra, sonuç) çiftlerini biter bitmez döndürür
+    Tüketici erken çıkarsa cancel_event ayarlanır - çalışan işler WHOIS beklemesini bırakır.
+    """
+    if not items:
+        return
+    
+    def safe_call(item):
+        try:
+            return func(item)
+        except Exception as e:
+            print(f"Domain analiz hatası {item}: {e}")
+            return None
+    
+    workers = min(max_workers or DOMAIN_ANALYSIS_WORKERS, len(items))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    exhausted = False
+    try:
+        futures = {executor.submit(safe_call, item): index for index, item in enumerate(items)}
+        for future in as_completed(futures):
+            result = future.result()
+            if result is not None:
+                yield futures[future], result
+        exhausted = True
+    finally:
+        # Tüketici erken çıkarsa bekleyen işler iptal edilir, çalışanlar uyandırılır
+        executor.shutdown(wait=False, cancel_futures=True)
+        if cancel_event is not None and not exhausted:
+            cancel_event.set()
+
+def run_dns_prescreen(domains):
+    """Tüm adaylar için DNS ön eleme - sadece belirsiz olanlar WHOIS'e gider"""
+    dns_results = prescreen_domains_dns(domains)
+    ambiguous_count = sum(1 for record in dns_results.values() if record["status"] == "ambiguous")
+    print(f"🌐 DNS ön eleme: {len(dns_results)} domain, {ambiguous_count} tanesi WHOIS'e gidecek")
+    return dns_results
+
+def iter_seo_domain_search(keyword, country="TR", limit=10):
+    """
+    SEO domain aramasını olay akışı olarak yürütür
+    - ("progress", {...}): aşama ve ilerleme (n / N)
+    - ("domain", analiz): her domain analizi biter bitmez
+    - ("done", sonuç): sıralanmış nihai sonuç
+    """
+    print(f"🔍 '{keyword}' için SEO domain'leri aranıyor...")
+    
+    # Domain önerileri oluştur
+    domain_suggestions = generate_domain_suggestions(keyword, country, limit)
+    total = len(domain_suggestions)
+    
+    yield "progress", {"phase": "dns", "completed": 0, "total": total}
+    dns_results = run_dns_prescreen(domain_suggestions)
+    
+    # Domain'leri paralel analiz et (WHOIS hız sınırı sunucu bazında uygulanır)
+    yield "progress", {"phase": "whois", "completed": 0, "total": total}
+    # Sadece minimum skoru geçen analizler JSON'a çevrilip saklanır
+    analyses = {}
+    cancel_event = threading.Event()
+    analyzer = lambda domain: analyze_domain_seo_value(domain, keyword, dns_results[domain]["status"], cancel_event)
+    completed = 0
+    for completed, (index, analysis) in enumerate(iter_concurrent_results(analyzer, domain_suggestions, cancel_event=cancel_event), 1):
+        if analysis.seo_score > 30:  # Minimum SEO skoru
+            analyses[index] = analysis.to_dict()
+            yield "domain", analyses[index]
+        yield "progress", {"phase": "whois", "completed": completed, "total": total}
+    
+    # SEO skoruna göre sırala (eşitlikte öneri sırası korunur)
+    yield "progress", {"phase": "scoring", "completed": completed, "total": total}
+    analyzed_domains = [analyses[index] for index in sorted(analyses)]
+    analyzed_domains.sort(key=lambda x: x["seo_score"], reverse=True)
+    
+    yield "done", {
+        "success": True,
+        "keyword": keyword,
+        "total_found": len(analyzed_domains),
+        "domains": analyzed_domains[:limit]
+    }
+
+def run_search_events(events):
+    """Olay akışını tüketir ve sadece nihai sonucu döndürür"""
+    for event, data in events:
+        if event == "done":
+            return data
 
 def find_seo_domains_for_keyword(keyword, country="TR", limit=10):
     """
@@ -144,32 +1501,7 @@ def find_seo_domains_for_keyword(keyword, country="TR", limit=10):
     - Keyword ile alakalı domain'ler
     """
     try:
-        print(f"🔍 '{keyword}' için SEO domain'leri aranıyor...")
-        
-        # Domain önerileri oluştur
-        domain_suggestions = generate_domain_suggestions(keyword, country)
-        
-        # Her domain'i analiz et
-        analyzed_domains = []
-        for domain in domain_suggestions[:limit]:
-            try:
-                analysis = analyze_domain_seo_value(domain, keyword)
-                if analysis["seo_score"] > 30:  # Minimum SEO skoru
-                    analyzed_domains.append(analysis)
-                time.sleep(0.5)  # Rate limiting
-            except Exception as e:
-                print(f"Domain analiz hatası {domain}: {e}")
-                continue
-        
-        # SEO skoruna göre sırala
-        analyzed_domains.sort(key=lambda x: x["seo_score"], reverse=True)
-        
-        return {
-            "success": True,
-            "keyword": keyword,
-            "total_found": len(analyzed_domains),
-            "domains": analyzed_domains[:limit]
-        }
+        return run_search_events(iter_seo_domain_search(keyword, country, limit))
         
     except Exception as e:
         return {
@@ -177,23 +1509,22 @@ def find_seo_domains_for_keyword(keyword, country="TR", limit=10):
             "error": f"SEO domain arama hatası: {str(e)}"
         }
 
-def generate_domain_suggestions(keyword, country="TR"):
-    """Keyword'e göre domain önerileri oluşturur"""
-    
-    # Keyword'ü temizle ve normalize et
-    clean_keyword = re.sub(r'[^a-zA-ZğüşıöçĞÜŞİÖÇ0-9]', '', keyword.lower())
-    
-    # Türkçe karakterleri İngilizce'ye çevir
-    tr_to_en = {
-        'ğ': 'g', 'ü': 'u', 'ş': 's', 'ı': 'i', 'ö': 'o', 'ç': 'c',
-        'Ğ': 'G', 'Ü': 'U', 'Ş': 'S', 'İ': 'I', 'Ö': 'O', 'Ç': 'C'
-    }
-    
-    for tr_char, en_char in tr_to_en.items():
-        clean_keyword = clean_keyword.replace(tr_char, en_char)
+# Aday domain uzantıları - birincil uzantılar tüm varyasyonlar için önce denenir,
+# ikincil uzantılar sadece daha fazla aday istendiğinde üretilir
+PRIMARY_EXTENSIONS = {
+    "TR": [".com", ".com.tr", ".net", ".net.tr"],
+    "default": [".com", ".net", ".org"]
+}
+SECONDARY_EXTENSIONS = {
+    "TR": [".org", ".org.tr", ".info", ".biz"],
+    "default": [".info", ".biz"]
+}
+
+def get_domain_variations(keyword, country="TR"):
+    """Keyword'den domain isim varyasyonları (uzantısız, öncelik sırasıyla)"""
     
-    # Domain varyasyonları oluştur
-    domain_variations = []
+    # Keyword'ü temizle ve normalize et (Türkçe karakterler İngilizce'ye çevrilir)
+    clean_keyword = normalize_keyword(keyword)
     
     # Ana keyword'ü öncelikle ekle
     base_variations = [
@@ -207,48 +1538,22 @@ def generate_domain_suggestions(keyword, country="TR"):
         f"{clean_keyword}online"
     ]
     
-    # Keyword'e özel alakalı varyasyonlar
-    if country == "TR":
-        if "altın" in keyword.lower() or "gold" in keyword.lower():
-            base_variations.extend([
-                "altinfiyat", "altinyatirim", "altinborsa", "altinpiyasa",
-                "gramaltın", "altinanaliz", "goldturkey", "altinmarket"
-            ])
-        elif "bitcoin" in keyword.lower() or "btc" in keyword.lower():
-            base_variations.extend([
-                "bitcointr", "btcturkey", "bitcoinfiyat", "bitcoinanaliz",
-                "kriptopara", "bitcoinhaber", "btcmarket", "bitcoinpro"
-            ])
-        elif "dolar" in keyword.lower() or "usd" in keyword.lower():
-            base_variations.extend([
-                "dolarkuru", "usdtry", "doviz", "dolaranaliz",
-                "kurlar", "dolarmarket", "usdturkey", "dovizpro"
-            ])
-        elif "emlak" in keyword.lower() or "ev" in keyword.lower():
-            base_variations.extend([
-                "emlaktr", "evmarket", "emlakpro", "gayrimenkul",
-                "evbul", "emlakhub", "konutmarket", "emlakanaliz"
-            ])
-        elif "araba" in keyword.lower() or "otomobil" in keyword.lower():
-            base_variations.extend([
-                "arabatr", "otomarket", "arabapro", "otomobilhub",
-                "arababulcom", "otoanaliz", "arabamarket", "otopro"
-            ])
-    
-    # Sadece en popüler ve güvenilir uzantıları kullan
-    if country == "TR":
-        extensions = [".com", ".com.tr", ".net", ".net.tr"]
-    else:
-        extensions = [".com", ".net", ".org"]
-    
-    # Domain'leri oluştur
-    for variation in base_variations:
-        for ext in extensions:
-            domain_variations.append(f"{variation}{ext}")
+    # Keyword'e özel alakalı varyasyonlar (kategori verisinden)
+    base_variations.extend(get_category_data(keyword, "domain_variations", country) or [])
+    return clean_keyword, base_variations
+
+def iter_domain_suggestions(keyword, country="TR"):
+    """
+    Domain önerilerini en alakalıdan başlayarak tembel (lazy) üretir
+    Her (uzantı grubu, varyasyon) bir kaynaktır; kaynaklar öncelik kuyruğuyla birleştirilir,
+    böylece çapraz çarpım oluşturulup sıralanmadan sadece istenen kadar aday üretilir.
+    Sıra: uzantı grubu, keyword alakası, varyasyon sırası, uzantı sırası.
+    """
+    clean_keyword, base_variations = get_domain_variations(keyword, country)
     
-    # Keyword alakasına göre sırala (daha alakalı olanlar önce)
-    def keyword_relevance_sort(domain):
-        domain_name = domain.split('.')[0].lower()
+    # Keyword alakasına göre sıra (daha alakalı olanlar önce)
+    def keyword_relevance_rank(variation):
+        domain_name = variation.split('.')[0].lower()
         if clean_keyword == domain_name:
             return 0  # Tam eşleşme en önce
         elif clean_keyword in domain_name:
@@ -260,257 +1565,124 @@ def generate_domain_suggestions(keyword, country="TR"):
         else:
             return 4  # Diğerleri
     
-    domain_variations.sort(key=keyword_relevance_sort)
+    def source(tier, index, variation, extensions):
+        rank = keyword_relevance_rank(variation)
+        for ext_index, ext in enumerate(extensions):
+            yield (tier, rank, index, ext_index), f"{variation}{ext}"
+    
+    extension_tiers = [
+        PRIMARY_EXTENSIONS.get(country, PRIMARY_EXTENSIONS["default"]),
+        SECONDARY_EXTENSIONS.get(country, SECONDARY_EXTENSIONS["default"])
+    ]
+    sources = [
+        source(tier, index, variation, extensions)
+        for tier, extensions in enumerate(extension_tiers)
+        for index, variation in enumerate(base_variations)
+    ]
     
-    # Sınırla ve döndür
-    return domain_variations[:30]
+    seen = set()
+    for _, domain in heapq.merge(*sources):
+        if domain not in seen:
+            seen.add(domain)
+            yield domain
+
+def generate_domain_suggestions(keyword, country="TR", limit=30):
+    """Keyword'e göre en alakalı `limit` domain önerisini liste olarak döndürür"""
+    return list(islice(iter_domain_suggestions(keyword, country), max(limit, 0)))
 
-def analyze_domain_seo_value(domain, keyword):
-    """Domain'in SEO değerini analiz eder"""
+def analyze_domain_seo_value(domain, keyword, dns_status=None, cancel_event=None):
+    """
+    Domain'in SEO değerini analiz eder (DomainAnalysis kaydı döner)
+    dns_status: ön elemenin sonucu ("registered" / "available" / "ambiguous") - verilirse DNS tekrar sorgulanmaz
+    """
     
-    analysis = {
-        "domain": domain,
-        "status": "unknown",
-        "seo_score": 0,
-        "factors": {},
-        "backlink_estimate": 0,
-        "domain_age": "unknown",
-        "keyword_relevance": 0,
-        "availability": "unknown",
-        "estimated_value": "$0"
-    }
+    analysis = DomainAnalysis(domain)
     
     try:
         # 1. Domain availability kontrolü
-        availability = check_domain_availability(domain)
-        analysis["availability"] = availability["status"]
-        analysis["status"] = availability["status"]
+        availability = check_domain_availability(domain, dns_status, cancel_event)
+        analysis.status = availability["status"]
         
         # 2. Keyword relevance skoru
         keyword_score = calculate_keyword_relevance(domain, keyword)
-        analysis["keyword_relevance"] = keyword_score
-        analysis["factors"]["keyword_match"] = keyword_score
+        analysis.keyword_relevance = keyword_score
+        analysis.keyword_match = keyword_score
         
         # 3. Domain uzunluğu ve kalitesi
         domain_quality = analyze_domain_quality(domain)
-        analysis["factors"].update(domain_quality)
+        analysis.extension_score = domain_quality["extension_score"]
+        analysis.length_score = domain_quality["length_score"]
+        analysis.character_score = domain_quality["character_score"]
+        analysis.pronounceable = domain_quality["pronounceable"]
         
         # 4. Simüle edilmiş backlink analizi (gerçek API'ler için key gerekir)
         backlink_data = simulate_backlink_analysis(domain, keyword)
-        analysis["backlink_estimate"] = backlink_data["count"]
-        analysis["factors"]["backlink_quality"] = backlink_data["quality_score"]
+        analysis.backlink_estimate = backlink_data["count"]
+        analysis.backlink_quality = backlink_data["quality_score"]
         
         # 5. Domain yaşı tahmini (WHOIS'tan)
         if availability["status"] == "registered":
-            age_data = estimate_domain_age(domain)
-            analysis["domain_age"] = age_data["age"]
-            analysis["factors"]["domain_age"] = age_data["score"]
-            if "creation_date" in age_data:
-                analysis["creation_date"] = age_data["creation_date"]
-            if "note" in age_data:
-                analysis["age_note"] = age_data["note"]
+            age_data = estimate_domain_age(domain, cancel_event)
         else:
             # Müsait domain'ler için de yaş tahmini yap
             age_data = simulate_domain_age(domain)
-            analysis["domain_age"] = age_data["age"]
-            analysis["factors"]["domain_age"] = age_data["score"]
-            analysis["creation_date"] = age_data["creation_date"]
-            analysis["age_note"] = age_data["note"]
+        analysis.domain_age = age_data["age"]
+        analysis.age_score = age_data["score"]
+        analysis.creation_date = age_data.get("creation_date")
+        analysis.age_note = age_data.get("note")
         
         # 6. SEO skoru hesapla
-        seo_score = calculate_seo_score(analysis["factors"])
-        analysis["seo_score"] = seo_score
-        
-        # 7. Tahmini değer
-        analysis["estimated_value"] = estimate_domain_value(analysis)
+        with metrics.span("scoring"):
+            seo_score = calculate_seo_score(analysis.factors)
+            analysis.seo_score = seo_score
+            
+            # 7. Tahmini değer
+            analysis.estimated_value = estimate_domain_value(analysis)
         
         return analysis
         
     except Exception as e:
-        analysis["error"] = str(e)
+        analysis.error = str(e)
         return analysis
 
-def check_domain_availability(domain):
-    """Domain'in müsaitlik durumunu kontrol eder"""
+def check_domain_availability(domain, dns_status=None, cancel_event=None):
+    """Domain'in müsaitlik durumunu kontrol eder (dns_status verilmezse DNS sorgulanır)"""
     try:
-        # DNS kontrolü
-        try:
-            dns.resolver.resolve(domain, 'A')
+        # DNS kontrolü - toplu ön elemenin sonucu verildiyse tekrar çözümlenmez
+        if dns_status is None:
+            dns_status = prescreen_domains_dns([domain])[domain]["status"]
+        if dns_status == "registered":
             return {"status": "registered", "note": "Domain kayıtlı"}
-        except:
-            pass
+        elif dns_status == "available":
+            return {"status": "available", "note": "Domain müsait olabilir"}
         
-        # WHOIS kontrolü
-        try:
-            domain_info = whois.whois(domain)
-            if domain_info.domain_name:
-                return {"status": "registered", "note": "Domain kayıtlı"}
-            else:
-                return {"status": "available", "note": "Domain müsait olabilir"}
-        except:
+        # Belirsiz durumlarda WHOIS kontrolü (sorgulanamazsa durum bilinmiyor - müsait sayılmaz)
+        record = get_whois_record(domain, cancel_event)
+        if record.get("error"):
+            return {"status": "unknown", "note": f"WHOIS sorgulanamadı: {record['error']}"}
+        if record["registered"]:
+            return {"status": "registered", "note": "Domain kayıtlı"}
+        else:
             return {"status": "available", "note": "Domain müsait olabilir"}
             
     except Exception as e:
         return {"status": "unknown", "note": f"Kontrol edilemedi: {str(e)}"}
 
-def calculate_keyword_relevance(domain, keyword):
-    """Domain'in keyword ile alakasını hesaplar"""
-    domain_name = domain.split('.')[0].lower()
-    keyword_clean = re.sub(r'[^a-zA-Z0-9]', '', keyword.lower())
-    
-    # Türkçe karakter dönüşümü
-    tr_to_en = {'ğ': 'g', 'ü': 'u', 'ş': 's', 'ı': 'i', 'ö': 'o', 'ç': 'c'}
-    for tr_char, en_char in tr_to_en.items():
-        keyword_clean = keyword_clean.replace(tr_char, en_char)
-    
-    score = 0
-    
-    # Tam eşleşme (en yüksek puan)
-    if keyword_clean == domain_name:
-        score += 80
-    elif keyword_clean in domain_name:
-        # Keyword domain içinde geçiyor
-        if domain_name.startswith(keyword_clean):
-            score += 60  # Başında geçiyor
-        elif domain_name.endswith(keyword_clean):
-            score += 55  # Sonunda geçiyor
-        else:
-            score += 45  # Ortada geçiyor
-    
-    # Kısmi eşleşme - keyword'ün kelimelerini kontrol et
-    keyword_words = keyword_clean.split()
-    for word in keyword_words:
-        if len(word) > 2 and word in domain_name:
-            if domain_name.startswith(word):
-                score += 25
-            elif domain_name.endswith(word):
-                score += 20
-            else:
-                score += 15
-    
-    # Domain uzunluğu bonusu (kısa domain'ler daha değerli)
-    domain_length = len(domain_name)
-    if domain_length <= 6:
-        score += 20
-    elif domain_length <= 8:
-        score += 15
-    elif domain_length <= 10:
-        score += 10
-    elif domain_length <= 12:
-        score += 5
-    
-    # Özel keyword kombinasyonları için bonus
-    special_combinations = {
-        'tr', 'market', 'hub', 'pro', 'online', 'get', 'my', 'best'
-    }
-    
-    for combo in special_combinations:
-        if combo in domain_name and keyword_clean in domain_name:
-            score += 10
-            break
-    
-    # Sayı ve özel karakter cezası
-    if any(char.isdigit() for char in domain_name):
-        score -= 5
-    if '-' in domain_name:
-        score -= 3
-    
-    return min(score, 100)
-
-def analyze_domain_quality(domain):
-    """Domain kalitesini analiz eder"""
-    domain_name = domain.split('.')[0]
-    extension = domain.split('.', 1)[1] if '.' in domain else ""
-    
-    quality_factors = {}
-    
-    # Uzantı skoru
-    ext_scores = {
-        "com": 30, "net": 20, "org": 25, "info": 15, "biz": 10,
-        "com.tr": 25, "net.tr": 15, "org.tr": 20
-    }
-    quality_factors["extension_score"] = ext_scores.get(extension, 5)
-    
-    # Domain uzunluğu
-    length = len(domain_name)
-    if length <= 6:
-        quality_factors["length_score"] = 25
-    elif length <= 10:
-        quality_factors["length_score"] = 20
-    elif length <= 15:
-        quality_factors["length_score"] = 15
-    else:
-        quality_factors["length_score"] = 5
-    
-    # Karakter kalitesi
-    char_score = 20
-    if '-' in domain_name:
-        char_score -= 5
-    if any(char.isdigit() for char in domain_name):
-        char_score -= 3
-    quality_factors["character_score"] = max(char_score, 0)
-    
-    # Telaffuz kolaylığı
-    vowels = 'aeiouAEIOU'
-    vowel_count = sum(1 for char in domain_name if char in vowels)
-    consonant_count = sum(1 for char in domain_name if char.isalpha() and char not in vowels)
-    
-    if vowel_count > 0 and consonant_count > 0:
-        ratio = vowel_count / (vowel_count + consonant_count)
-        if 0.2 <= ratio <= 0.6:
-            quality_factors["pronounceable"] = 15
-        else:
-            quality_factors["pronounceable"] = 5
-    else:
-        quality_factors["pronounceable"] = 0
-    
-    return quality_factors
-
-def simulate_backlink_analysis(domain, keyword):
-    """Simüle edilmiş backlink analizi (gerçek API'ler için key gerekir)"""
-    
-    # Domain kalitesine göre simüle edilmiş backlink sayısı
-    domain_name = domain.split('.')[0]
-    base_score = len(domain_name) * 10
-    
-    # Keyword alakası bonusu
-    keyword_clean = re.sub(r'[^a-zA-Z0-9]', '', keyword.lower())
-    if keyword_clean in domain_name.lower():
-        base_score *= 2
-    
-    # Rastgele faktör
-    random_factor = random.uniform(0.5, 2.0)
-    estimated_backlinks = int(base_score * random_factor)
-    
-    # Kalite skoru
-    if estimated_backlinks > 1000:
-        quality_score = 30
-    elif estimated_backlinks > 500:
-        quality_score = 25
-    elif estimated_backlinks > 100:
-        quality_score = 20
-    elif estimated_backlinks > 50:
-        quality_score = 15
-    else:
-        quality_score = 10
-    
-    return {
-        "count": estimated_backlinks,
-        "quality_score": quality_score
-    }
+# WHOIS sorgulanamadığında simüle edilen yaşın notu (bu nottaki sonuçlar önbelleğe alınmaz)
+WHOIS_FAILED_AGE_NOTE = "Tahmini yaş (WHOIS sorgulanamadı)"
 
-def estimate_domain_age(domain):
+def estimate_domain_age(domain, cancel_event=None):
     """Domain yaşını tahmin eder - gerçek WHOIS verisi + simülasyon"""
     try:
-        # Önce gerçek WHOIS verisi deneyelim
-        domain_info = whois.whois(domain)
-        if domain_info and domain_info.creation_date:
-            if isinstance(domain_info.creation_date, list):
-                creation_date = domain_info.creation_date[0]
-            else:
-                creation_date = domain_info.creation_date
-            
+        # Önce gerçek WHOIS verisi deneyelim (önbellekten)
+        record = get_whois_record(domain, cancel_event)
+        if record.get("error"):
+            print(f"WHOIS hatası {domain}: {record['error']}")
+            return {**simulate_domain_age(domain), "note": WHOIS_FAILED_AGE_NOTE}
+        elif record.get("created_at"):
             from datetime import datetime
+            creation_date = datetime.fromisoformat(record["created_at"])
+            
             if creation_date:
                 age_years = (datetime.now() - creation_date).days / 365.25
                 
@@ -539,162 +1711,37 @@ def estimate_domain_age(domain):
     # WHOIS başarısız olursa, domain özelliklerine göre simüle et
     return simulate_domain_age(domain)
 
-def simulate_domain_age(domain):
-    """Domain özelliklerine göre yaş simülasyonu"""
-    from datetime import datetime, timedelta
-    import hashlib
-    
-    # Domain'in hash'ine göre deterministik yaş oluştur
-    domain_hash = int(hashlib.md5(domain.encode()).hexdigest()[:8], 16)
-    
-    # Domain uzantısına göre yaş aralığı
-    if domain.endswith('.com'):
-        # .com domain'ler genelde daha eski
-        min_years, max_years = 2, 20
-    elif domain.endswith('.net'):
-        min_years, max_years = 1, 15
-    elif domain.endswith('.org'):
-        min_years, max_years = 3, 18
-    elif domain.endswith('.info'):
-        min_years, max_years = 1, 12
-    elif domain.endswith('.biz'):
-        min_years, max_years = 1, 10
-    elif domain.endswith('.com.tr'):
-        min_years, max_years = 1, 15
-    elif domain.endswith('.net.tr'):
-        min_years, max_years = 1, 12
-    else:
-        min_years, max_years = 1, 10
-    
-    # Domain adı özelliklerine göre ayarlama
-    domain_name = domain.split('.')[0].lower()
-    
-    # Kısa domain'ler genelde daha eski
-    if len(domain_name) <= 4:
-        min_years += 3
-        max_years += 5
-    elif len(domain_name) <= 6:
-        min_years += 1
-        max_years += 2
-    
-    # Popüler keyword'ler daha eski olabilir
-    popular_keywords = ['altın', 'bitcoin', 'dolar', 'gold', 'money', 'news', 'market', 'trade']
-    for keyword in popular_keywords:
-        if keyword in domain_name:
-            min_years += 2
-            max_years += 3
-            break
-    
-    # Hash'e göre yaş hesapla
-    age_range = max_years - min_years
-    age_years = min_years + (domain_hash % (age_range * 10)) / 10.0
-    
-    # Yaş skoru
-    if age_years > 15:
-        age_score = 30
-    elif age_years > 10:
-        age_score = 25
-    elif age_years > 5:
-        age_score = 20
-    elif age_years > 2:
-        age_score = 15
-    elif age_years > 1:
-        age_score = 10
-    else:
-        age_score = 5
-    
-    # Tahmini oluşturulma tarihi
-    creation_date = datetime.now() - timedelta(days=age_years * 365.25)
-    
-    return {
-        "age": f"~{age_years:.1f} yıl",
-        "score": age_score,
-        "creation_date": creation_date.strftime("%Y-%m-%d"),
-        "note": "Tahmini yaş (WHOIS verisi alınamadı)"
-    }
-
-def calculate_seo_score(factors):
-    """Tüm faktörleri kullanarak SEO skoru hesaplar"""
-    total_score = 0
-    
-    # Tüm faktörleri topla
-    for factor, score in factors.items():
-        if isinstance(score, (int, float)):
-            total_score += score
-    
-    # 0-100 arasında normalize et
-    return min(total_score, 100)
-
-def estimate_domain_value(analysis):
-    """Domain'in tahmini değerini hesaplar"""
-    seo_score = analysis["seo_score"]
-    backlinks = analysis["backlink_estimate"]
-    keyword_relevance = analysis["keyword_relevance"]
-    
-    # Temel değer hesaplama
-    base_value = seo_score * 10
-    backlink_value = min(backlinks * 0.5, 1000)
-    keyword_value = keyword_relevance * 5
-    
-    total_value = base_value + backlink_value + keyword_value
-    
-    if total_value > 5000:
-        return f"${total_value:,.0f}+"
-    elif total_value > 1000:
-        return f"${total_value:,.0f}"
-    elif total_value > 100:
-        return f"${total_value:.0f}"
-    else:
-        return f"${total_value:.0f}"
-
 def get_keyword_surfer_data(keyword, country):
     """Keyword Surfer benzeri ücretsiz API alternatifi"""
     try:
         # Simüle edilmiş veri - gerçek API entegrasyonu için API key gerekir
         # Bu örnekte demo veri döndürüyoruz
         
-        # Türkiye için özel keyword önerileri
-        if country.upper() == "TR":
-            if "altın" in keyword.lower():
-                related_keywords = [
-                    {"query": "altın fiyatı", "value": 85},
-                    {"query": "gram altın", "value": 78},
-                    {"query": "çeyrek altın", "value": 65},
-                    {"query": "altın yatırım", "value": 45},
-                    {"query": "altın alım satım", "value": 38}
-                ]
-            elif "bitcoin" in keyword.lower():
-                related_keywords = [
-                    {"query": "bitcoin fiyat", "value": 92},
-                    {"query": "btc türkiye", "value": 67},
-                    {"query": "kripto para", "value": 54},
-                    {"query": "bitcoin al", "value": 43}
-                ]
-            elif "dolar" in keyword.lower():
-                related_keywords = [
-                    {"query": "dolar kuru", "value": 95},
-                    {"query": "usd try", "value": 88},
-                    {"query": "amerikan doları", "value": 72},
-                    {"query": "dolar yorum", "value": 56}
-                ]
-            else:
+        # Kategoriye özel keyword önerileri
+        related_keywords = get_category_data(keyword, "surfer", country.upper())
+        
+        if not related_keywords:
+            if country.upper() == "TR":
                 related_keywords = [
                     {"query": f"{keyword} fiyat", "value": 70},
                     {"query": f"{keyword} türkiye", "value": 60},
                     {"query": f"{keyword} nasıl", "value": 50},
                     {"query": f"{keyword} nedir", "value": 40}
                 ]
-        else:
-            # Diğer ülkeler için genel öneriler
-            related_keywords = [
-                {"query": f"{keyword} price", "value": 75},
-                {"query": f"{keyword} buy", "value": 65},
-                {"query": f"{keyword} review", "value": 55},
-                {"query": f"{keyword} best", "value": 45}
-            ]
+            else:
+                # Diğer ülkeler için genel öneriler
+                related_keywords = [
+                    {"query": f"{keyword} price", "value": 75},
+                    {"query": f"{keyword} buy", "value": 65},
+                    {"query": f"{keyword} review", "value": 55},
+                    {"query": f"{keyword} best", "value": 45}
+                ]
+        
+        # Keyword ve ülke için sabit hacim tahmini
+        search_volume = seeded_random("keyword_surfer", keyword.lower(), country.upper()).randint(1000, 50000)
         
         result_data = {
-            "interest_data": f"✅ Keyword Surfer verisi - Arama hacmi tahmini: {random.randint(1000, 50000)}",
+            "interest_data": f"✅ Keyword Surfer verisi - Arama hacmi tahmini: {search_volume}",
             "keyword": keyword,
             "related_queries": {
                 "top": related_keywords[:5],
@@ -712,47 +1759,31 @@ def get_ubersuggest_alternative(keyword, country):
     try:
         # Bu da simüle edilmiş veri - gerçek API için key gerekir
         
-        # Ülkeye göre özelleştirilmiş öneriler
-        country_keywords = {
-            "TR": {
-                "altın": ["altın fiyatları", "altın borsa", "altın grafik", "altın analiz"],
-                "bitcoin": ["bitcoin ne zaman alınır", "bitcoin geleceği", "bitcoin analiz"],
-                "dolar": ["dolar ne olur", "dolar analiz", "dolar beklenti"],
-                "default": [f"{keyword} nedir", f"{keyword} nasıl", f"{keyword} fiyat"]
-            },
-            "US": {
-                "gold": ["gold price", "gold investment", "gold market", "gold analysis"],
-                "bitcoin": ["bitcoin price prediction", "bitcoin investment", "bitcoin news"],
-                "default": [f"{keyword} price", f"{keyword} market", f"{keyword} analysis"]
-            }
+        # Ülkeye göre varsayılan öneriler
+        default_suggestions = {
+            "TR": [f"{keyword} nedir", f"{keyword} nasıl", f"{keyword} fiyat"],
+            "US": [f"{keyword} price", f"{keyword} market", f"{keyword} analysis"]
         }
         
-        # Ülke koduna göre öneriler
+        # Kategoriye ve ülke koduna göre öneriler
         country_code = country.upper()
-        if country_code in country_keywords:
-            keyword_lower = keyword.lower()
-            suggestions = []
-            
-            for key in country_keywords[country_code]:
-                if key in keyword_lower and key != "default":
-                    suggestions = country_keywords[country_code][key]
-                    break
-            
-            if not suggestions:
-                suggestions = country_keywords[country_code]["default"]
-        else:
-            suggestions = [f"{keyword} analysis", f"{keyword} trends", f"{keyword} market"]
+        suggestions = get_category_data(keyword, "ubersuggest", country_code)
+        if not suggestions:
+            suggestions = default_suggestions.get(
+                country_code, [f"{keyword} analysis", f"{keyword} trends", f"{keyword} market"]
+            )
         
-        # Önerileri query formatına çevir
+        # Önerileri query formatına çevir (değerler keyword ve ülkeye göre sabit)
+        rng = seeded_random("ubersuggest", keyword.lower(), country_code)
         related_queries = []
         for i, suggestion in enumerate(suggestions[:6]):
             related_queries.append({
                 "query": suggestion,
-                "value": random.randint(30, 90)
+                "value": rng.randint(30, 90)
             })
         
         result_data = {
-            "interest_data": f"✅ Ubersuggest Alternative - Tahmini aylık arama: {random.randint(500, 25000)}",
+            "interest_data": f"✅ Ubersuggest Alternative - Tahmini aylık arama: {rng.randint(500, 25000)}",
             "keyword": keyword,
             "related_queries": {
                 "rising": related_queries,
@@ -768,41 +1799,19 @@ def get_ubersuggest_alternative(keyword, country):
 def get_local_suggestions(keyword, country):
     """Yerel öneriler sistemi - son çare"""
     
-    # Kapsamlı yerel öneriler
-    suggestions_db = {
-        "TR": {
-            "altın": ["altın fiyatı", "gram altın", "çeyrek altın", "altın yatırım", "altın borsa", "altın grafik"],
-            "bitcoin": ["bitcoin fiyat", "btc", "kripto para", "bitcoin türkiye", "bitcoin al", "bitcoin analiz"],
-            "dolar": ["dolar kuru", "usd try", "amerikan doları", "dolar yorum", "dolar analiz"],
-            "euro": ["euro kuru", "eur try", "euro dolar", "euro analiz"],
-            "emlak": ["emlak fiyatları", "ev fiyatları", "konut", "gayrimenkul"],
-            "borsa": ["borsa istanbul", "hisse", "bist", "borsa analiz"],
-            "petrol": ["petrol fiyatı", "ham petrol", "benzin fiyat"],
-            "default": [f"{keyword} fiyat", f"{keyword} türkiye", f"{keyword} analiz", f"{keyword} nedir"]
-        },
-        "US": {
-            "gold": ["gold price", "gold investment", "gold market", "gold futures"],
-            "bitcoin": ["bitcoin price", "btc usd", "crypto", "bitcoin news"],
-            "stock": ["stock market", "stocks", "nasdaq", "dow jones"],
-            "default": [f"{keyword} price", f"{keyword} market", f"{keyword} news"]
-        }
+    # Ülkeye göre varsayılan öneriler (kategoriye özel olanlar data/keyword_categories.json'da)
+    default_suggestions = {
+        "TR": [f"{keyword} fiyat", f"{keyword} türkiye", f"{keyword} analiz", f"{keyword} nedir"],
+        "US": [f"{keyword} price", f"{keyword} market", f"{keyword} news"]
     }
     
-    country_code = country.upper()
-    keyword_lower = keyword.lower()
-    
     # Ülke ve keyword'e göre öneriler bul
-    if country_code in suggestions_db:
-        suggestions = []
-        for key in suggestions_db[country_code]:
-            if key in keyword_lower and key != "default":
-                suggestions = suggestions_db[country_code][key]
-                break
-        
-        if not suggestions:
-            suggestions = suggestions_db[country_code]["default"]
-    else:
-        suggestions = [f"{keyword} analysis", f"{keyword} trends", f"{keyword} market", f"{keyword} price"]
+    country_code = country.upper()
+    suggestions = get_category_data(keyword, "local", country_code)
+    if not suggestions:
+        suggestions = default_suggestions.get(
+            country_code, [f"{keyword} analysis", f"{keyword} trends", f"{keyword} market", f"{keyword} price"]
+        )
     
     result_data = {
         "interest_data": "📊 Yerel veri tabanından öneriler",
@@ -815,48 +1824,347 @@ def get_local_suggestions(keyword, country):
     
     return {"success": True, "data": result_data}
 
-@app.route("/get_keywords", methods=["POST"])
+class SingleFlight:
+    """
+    Aynı anda gelen özdeş istekleri tek hesaplamada birleştirir (single-flight)
+    İlk gelen istek hesaplamayı yapar, aynı anahtarla bekleyenler sonucu (veya hatayı) paylaşır.
+    Sonuç saklanmaz - hesaplama bitince anahtar serbest kalır.
+    """
+    
+    def __init__(self):
+        self._in_flight = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key, func, *args):
+        endpoint = key[0]
+        with self._lock:
+            counters = self._counters.setdefault(endpoint, {"executed": 0, "coalesced": 0})
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+                counters["executed"] += 1
+            else:
+                counters["coalesced"] += 1
+        
+        if leader:
+            try:
+                future.set_result(func(*args))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    del self._in_flight[key]
+        
+        return future.result()
+    
+    def stats(self):
+        with self._lock:
+            return {
+                "in_flight": len(self._in_flight),
+                "endpoints": {endpoint: dict(counters) for endpoint, counters in self._counters.items()}
+            }
+
+request_flights = SingleFlight()
+
+def request_key(endpoint, keyword, country, params):
+    """Endpoint, normalize edilmiş keyword (query_keyword), ülke ve parametrelerden istek anahtarı"""
+    return (endpoint, query_keyword(keyword), country.upper(), tuple(params))
+
+def coalesced_call(endpoint, keyword, country, params, func, *args):
+    """Özdeş istekleri (aynı request_key) tek hesaplamada birleştirir"""
+    return request_flights.do(request_key(endpoint, keyword, country, params), func, *args)
+
+revalidate_executor = ThreadPoolExecutor(max_workers=2)
+_revalidating = set()
+_revalidating_lock = threading.Lock()
+
+def _has_unchecked_whois(result):
+    """Sonuçta WHOIS'i sorgulanamamış (kuyruk dolu, iptal, hata) domain var mı"""
+    for domain in result.get("domains") or ():
+        if domain.get("availability") == "unknown":
+            return True
+        age = domain.get("domain_age")
+        note = age.get("note") if isinstance(age, dict) else domain.get("age_note")
+        if note == WHOIS_FAILED_AGE_NOTE:
+            return True
+    return False
+
+def _response_fresh_ttl(endpoint, result):
+    """
+    Başarısız sonuçlar ve WHOIS'i sorgulanamamış domain içeren sonuçlar önbelleğe alınmaz
+    (get_whois_record bunları kasıtlı olarak önbelleğe almaz); yedek (yerel öneri) sonuçları kısa süre tutulur
+    """
+    if not result.get("success") or _has_unchecked_whois(result):
+        return 0
+    if result.get("data", {}).get("api_used") == "Yerel Öneriler":
+        return RESPONSE_DEGRADED_TTL
+    return RESPONSE_CACHE_TTLS[endpoint]
+
+def compute_response_entry(endpoint, cache_key, func, *args):
+    """
+    Yanıtı hesaplar, ETag ile birlikte önbelleğe yazar ve kaydı döndürür
+    Gövde bir kez JSON'a çevrilip metin olarak saklanır; önbellekten verilen yanıtlar yeniden kodlanmaz.
+    """
+    result = func(*args)
+    with metrics.span("serialization"):
+        body = encode_json(result, sort_keys=True)
+    entry = {
+        "stored_at": time.time(),
+        "fresh_ttl": _response_fresh_ttl(endpoint, result),
+        "etag": hashlib.sha1(body).hexdigest(),
+        "json": body.decode("utf-8")
+    }
+    if entry["fresh_ttl"] > 0:
+        cache_backend.set("responses", cache_key, entry, entry["fresh_ttl"] + RESPONSE_STALE_TTL)
+    return entry
+
+def _revalidate_response(endpoint, keyword, country, params, cache_key, func, args):
+    try:
+        coalesced_call(endpoint, keyword, country, params, compute_response_entry, endpoint, cache_key, func, *args)
+    except Exception as e:
+        print(f"Arka plan yenileme hatası ({endpoint}): {e}")
+    finally:
+        with _revalidating_lock:
+            _revalidating.discard(cache_key)
+
+def schedule_revalidation(endpoint, keyword, country, params, cache_key, func, args):
+    """Bayat kayıt için tek bir arka plan yenilemesi başlatır"""
+    with _revalidating_lock:
+        if cache_key in _revalidating:
+            return
+        _revalidating.add(cache_key)
+    revalidate_executor.submit(_revalidate_response, endpoint, keyword, country, params, cache_key, func, args)
+
+def _with_request_keyword(entry, keyword):
+    """Paylaşılan kaydın keyword alanlarını isteği yapanın yazdığı keyword ile değiştirir (yeni gövde ve ETag)"""
+    result = json.loads(entry["json"])
+    for target in (result, result.get("data")):
+        if isinstance(target, dict) and "keyword" in target:
+            target["keyword"] = keyword
+    body = encode_json(result, sort_keys=True)
+    return dict(entry, json=body.decode("utf-8"), etag=hashlib.sha1(body).hexdigest())
+
+def cached_json_response(endpoint, keyword, country, params, func):
+    """
+    Endpoint yanıtını önbellekten verir (stale-while-revalidate)
+    - Taze kayıt: doğrudan döner (X-Cache: HIT)
+    - Bayat kayıt: hemen döner, arka planda yenilenir (X-Cache: STALE)
+    - Kayıt yok: özdeş isteklerle birleştirilerek hesaplanır (X-Cache: MISS)
+    GET isteklerinde ETag / Cache-Control ile tarayıcı ve edge önbelleği de kullanılabilir.
+    
+    Sonuç func(query_keyword(keyword), country, *params) ile hesaplanır; aynı anahtarı paylaşan istekler
+    böylece gerçekten aynı hesaplamayı alır, yanıttaki keyword alanı ise isteği yapanın yazdığı keyword olur.
+    """
+    args = (query_keyword(keyword), country, *params)
+    cache_key = "|".join(str(part) for part in request_key(endpoint, keyword, country, params))
+    entry = cache_backend.get("responses", cache_key)
+    if entry is not None and "json" not in entry:
+        entry = None  # Gövdesi kodlanmamış eski biçimli kayıt
+    status = "HIT"
+    
+    if entry is None:
+        status = "MISS"
+        entry = coalesced_call(endpoint, keyword, country, params, compute_response_entry, endpoint, cache_key, func, *args)
+    
+    age = max(int(time.time() - entry["stored_at"]), 0)
+    if status == "HIT" and age >= entry["fresh_ttl"]:
+        status = "STALE"
+        schedule_revalidation(endpoint, keyword, country, params, cache_key, func, args)
+    
+    if keyword != args[0]:
+        entry = _with_request_keyword(entry, keyword)
+    
+    metrics.inc("response_cache_total", (("endpoint", endpoint), ("status", status)))
+    response = app.response_class(entry["json"] + "\n", mimetype=app.json.mimetype)
+    response.headers["X-Cache"] = status
+    response.headers["Age"] = str(age)
+    response.set_etag(entry["etag"])
+    
+    if entry["fresh_ttl"] <= 0:
+        response.headers["Cache-Control"] = "no-store"
+    elif request.method == "GET":
+        max_age = max(entry["fresh_ttl"] - age, 0)
+        response.headers["Cache-Control"] = f"public, max-age={max_age}, s-maxage={max_age}, stale-while-revalidate={RESPONSE_STALE_TTL}"
+    else:
+        response.headers["Cache-Control"] = "no-cache"
+    
+    return response.make_conditional(request)
+
+class JobQueueFull(Exception):
+    pass
+
+class JobQueue:
+    """
+    Ağır aramalar için süreç içi iş kuyruğu
+    - submit: olay akışı (iter_*_search) worker havuzunda çalışır, iş kimliği hemen döner
+    - "domain" olayları kısmi sonuç, "done" olayı nihai sonuç olarak saklanır
+    - cancel: iş bekliyorsa hiç başlamaz, çalışıyorsa bir sonraki olayda durur
+    - Biten işler JOB_TTL sonra silinir
+    """
+    
+    ACTIVE_STATES = ("queued", "running")
+    
+    def __init__(self, workers=2, max_queued=32, ttl=900):
+        self.max_pending = workers + max_queued
+        self.ttl = ttl
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+    
+    def submit(self, kind, params, events_factory, *args):
+        with self._lock:
+            self._evict_expired()
+            pending = sum(1 for job in self._jobs.values() if job["status"] in self.ACTIVE_STATES)
+            if pending >= self.max_pending:
+                raise JobQueueFull(f"İş kuyruğu dolu ({pending} iş bekliyor)")
+            
+            job = {
+                "job_id": uuid.uuid4().hex,
+                "kind": kind,
+                "params": params,
+                "status": "queued",
+                "created_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+                "progress": None,
+                "partial": [],
+                "result": None,
+                "error": None,
+                "cancel_event": threading.Event()
+            }
+            self._jobs[job["job_id"]] = job
+        
+        self._executor.submit(self._run, job, events_factory, args)
+        return self.snapshot(job["job_id"], include_partial=False)
+    
+    def _finish(self, job, status, **fields):
+        with self._lock:
+            job.update(fields)
+            job["status"] = status
+            job["finished_at"] = time.time()
+    
+    def _run(self, job, events_factory, args):
+        if job["cancel_event"].is_set():
+            return self._finish(job, "cancelled")
+        
+        with self._lock:
+            job["status"] = "running"
+            job["started_at"] = time.time()
+        
+        events = events_factory(*args)
+        try:
+            for event, data in events:
+                if job["cancel_event"].is_set():
+                    return self._finish(job, "cancelled")
+                with self._lock:
+                    if event == "progress":
+                        job["progress"] = data
+                    elif event == "domain":
+                        job["partial"].append(data)
+                    elif event == "done":
+                        job["result"] = data
+            self._finish(job, "done")
+        except Exception as e:
+            print(f"İş hatası ({job['kind']} {job['job_id']}): {e}")
+            self._finish(job, "failed", error=str(e))
+        finally:
+            # Bekleyen domain analizleri de iptal edilir
+            events.close()
+    
+    def cancel(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job["status"] in self.ACTIVE_STATES:
+                job["cancel_event"].set()
+                if job["status"] == "queued":
+                    job["status"] = "cancelled"
+                    job["finished_at"] = time.time()
+        return self.snapshot(job_id, include_partial=False)
+    
+    def snapshot(self, job_id, include_partial=True):
+        with self._lock:
+            self._evict_expired()
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            snapshot = {key: value for key, value in job.items() if key not in ("cancel_event", "partial")}
+            snapshot["cancel_requested"] = job["cancel_event"].is_set()
+            snapshot["partial_count"] = len(job["partial"])
+            if include_partial:
+                snapshot["partial"] = list(job["partial"])
+            return snapshot
+    
+    def _evict_expired(self):
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job["finished_at"] is not None and now - job["finished_at"] > self.ttl
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+    
+    def stats(self):
+        with self._lock:
+            self._evict_expired()
+            counts = {}
+            for job in self._jobs.values():
+                counts[job["status"]] = counts.get(job["status"], 0) + 1
+            return {"jobs": len(self._jobs), "max_pending": self.max_pending, "by_status": counts}
+
+job_queue = JobQueue(JOB_WORKERS, JOB_QUEUE_SIZE, JOB_TTL)
+
+@app.route("/get_keywords", methods=["GET", "POST"])
 def get_keywords():
     try:
-        country = request.form.get("country", "").upper()
-        keyword = request.form.get("keyword", "")
+        country = request.values.get("country", "").upper()
+        keyword = request.values.get("keyword", "")
         
         if not country or not keyword:
             return jsonify({"success": False, "error": "Lütfen hem ülke hem de keyword alanlarını doldurun."})
         
         # Multi-API sistemi ile veri çek
-        result = get_keyword_data_multi_api(keyword, country)
-        
-        return jsonify(result)
+        return cached_json_response("get_keywords", keyword, country, (), get_keyword_data_multi_api)
         
     except Exception as e:
         error_msg = f"Genel hata: {str(e)}"
         print(f"Error in get_keywords: {error_msg}")
         return jsonify({"success": False, "error": f"API hatası: {error_msg}"})
 
-@app.route("/find_seo_domains", methods=["POST"])
+def request_limit(default):
+    """İstekteki limit parametresi - tamsayı değilse ValueError, 0..MAX_RESULT_LIMIT aralığına kırpılır"""
+    return max(0, min(int(request.values.get("limit", default)), MAX_RESULT_LIMIT))
+
+@app.route("/find_seo_domains", methods=["GET", "POST"])
 def find_seo_domains():
     """Keyword ile ilgili SEO açısından değerli domain'leri bulur"""
     try:
-        keyword = request.form.get("keyword", "").strip()
-        country = request.form.get("country", "TR").upper()
-        limit = int(request.form.get("limit", 10))
+        keyword = request.values.get("keyword", "").strip()
+        country = request.values.get("country", "TR").upper()
+        try:
+            limit = request_limit(10)
+        except ValueError as e:
+            return jsonify({"success": False, "error": f"Geçersiz parametre: {str(e)}"}), 400
         
         if not keyword:
             return jsonify({"success": False, "error": "Lütfen bir keyword girin."})
         
         # SEO domain analizi yap
-        result = find_seo_domains_for_keyword(keyword, country, limit)
-        
-        return jsonify(result)
+        return cached_json_response("find_seo_domains", keyword, country, (limit,), find_seo_domains_for_keyword)
         
     except Exception as e:
         error_msg = f"SEO domain arama hatası: {str(e)}"
         print(f"Error in find_seo_domains: {error_msg}")
         return jsonify({"success": False, "error": error_msg})
 
+@lru_cache(maxsize=SIMULATION_CACHE_SIZE)
 def simulate_domain_availability(domain):
-    """Domain müsaitlik durumunu simüle eder"""
+    """Domain müsaitlik durumunu simüle eder (aynı domain için her zaman aynı sonuç)"""
+    rng = seeded_random("availability", domain.lower())
     try:
         # Gerçek WHOIS sorgusu yapmak yerine simülasyon
         # Bazı domain'leri müsait olarak göster
@@ -876,130 +2184,117 @@ def simulate_domain_availability(domain):
         if '-' in domain or any(char.isdigit() for char in domain):
             availability_chance += 0.2
         
-        # Rastgele müsaitlik durumu
-        is_available = random.random() < availability_chance
+        # Domain'e bağlı sabit müsaitlik durumu
+        is_available = rng.random() < availability_chance
         
         return is_available
         
     except Exception as e:
         # Hata durumunda %50 şansla müsait göster
-        return random.random() < 0.5
+        return rng.random() < 0.5
 
-def simulate_backlink_data(domain, keyword):
-    """Backlink verilerini simüle eder"""
-    try:
-        # Domain karakteristiklerine göre backlink sayısı hesapla
-        base_backlinks = random.randint(50, 5000)
-        
-        # Keyword relevansına göre bonus
-        keyword_lower = keyword.lower()
-        domain_lower = domain.lower()
-        
-        if keyword_lower in domain_lower:
-            base_backlinks *= random.uniform(1.5, 3.0)
-        
-        # Domain uzunluğuna göre ayarlama
-        if len(domain) <= 8:
-            base_backlinks *= random.uniform(1.2, 2.0)
-        elif len(domain) >= 15:
-            base_backlinks *= random.uniform(0.5, 0.8)
-        
-        # TLD'ye göre ayarlama
-        if domain.endswith('.com'):
-            base_backlinks *= random.uniform(1.3, 2.0)
-        elif domain.endswith('.com.tr'):
-            base_backlinks *= random.uniform(1.1, 1.5)
-        elif domain.endswith('.net'):
-            base_backlinks *= random.uniform(1.0, 1.3)
-        
-        backlinks = int(base_backlinks)
-        
-        # Kalite skoru hesapla (1-100)
-        quality_score = min(100, max(10, 
-            random.randint(30, 95) + 
-            (20 if keyword_lower in domain_lower else 0) +
-            (10 if len(domain) <= 10 else 0) +
-            (15 if domain.endswith('.com') else 0)
-        ))
-        
-        # Referring domains (backlink sayısının %10-30'u)
-        referring_domains = int(backlinks * random.uniform(0.1, 0.3))
-        
-        # Domain Authority (DA) simülasyonu
-        domain_authority = min(100, max(1, 
-            random.randint(15, 85) + 
-            (15 if backlinks > 1000 else 0) +
-            (10 if quality_score > 70 else 0)
-        ))
-        
-        return {
-            "backlinks": backlinks,
-            "quality_score": quality_score,
-            "referring_domains": referring_domains,
-            "domain_authority": domain_authority
-        }
-        
-    except Exception as e:
-        return {
-            "backlinks": random.randint(100, 1000),
-            "quality_score": random.randint(40, 80),
-            "referring_domains": random.randint(20, 200),
-            "domain_authority": random.randint(20, 60)
-        }
+def simulate_candidate_batch(domains, keyword):
+    """
+    Aday listesinin müsaitlik ve backlink simülasyonunu tek seferde hesaplar
+    Dönüş: [(domain, müsait mi, backlink verisi veya None)] - müsait olmayanlar için backlink hesaplanmaz
+    """
+    keyword_lower = keyword.lower()
+    batch = []
+    for domain in domains:
+        if simulate_domain_availability(domain):
+            batch.append((domain, True, dict(zip(BACKLINK_DATA_FIELDS, _simulated_backlink_profile(domain, keyword_lower)))))
+        else:
+            batch.append((domain, False, None))
+    return batch
+
+def build_backlink_result(domain, keyword, backlink_data, dns_status=None, cancel_event=None):
+    """Backlink şartını geçen domain için SEO değeri ve yaş bilgisini ekler"""
+    # SEO değeri hesapla
+    seo_value = analyze_domain_seo_value(domain, keyword, dns_status, cancel_event)
+    
+    # Domain yaşı bilgisi
+    age_info = estimate_domain_age(domain, cancel_event)
+    
+    return {
+        "domain": domain,
+        "available": True,
+        "backlinks": backlink_data['backlinks'],
+        "quality_score": backlink_data['quality_score'],
+        "referring_domains": backlink_data['referring_domains'],
+        "domain_authority": backlink_data['domain_authority'],
+        "estimated_value": seo_value.estimated_value,
+        "keyword_relevance": seo_value.keyword_relevance,
+        "domain_age": age_info
+    }
+
+def iter_backlink_domain_search(keyword, country="TR", min_backlinks=100, limit=20):
+    """
+    Backlink domain aramasını olay akışı olarak yürütür (iter_seo_domain_search ile aynı olaylar)
+    Sıralama backlink sayısına göre olduğundan ucuz adımlar (müsaitlik, backlink) önce yapılır;
+    WHOIS/yaş zenginleştirmesi sadece listeye girebilecek en iyi `limit` aday için çalışır.
+    """
+    # Domain önerileri en alakalıdan başlayarak tembel üretilir - sadece `limit * 2` tanesi çekilir
+    domain_suggestions = islice(iter_domain_suggestions(keyword, country), max(limit, 0) * 2)  # Daha fazla domain analiz et
+    
+    # Müsait ve minimum backlink şartını geçen adaylardan en iyi `limit` tanesi heap'te tutulur
+    # (anahtar: backlink sayısı, eşitlikte öneri sırası); dışarıda kalanlar yedek olarak saklanır
+    top_candidates = []
+    reserves = []
+    order = {}
+    # Müsaitlik ve backlink verisi tüm aday listesi için tek seferde simüle edilir
+    for index, (domain, available, backlink_data) in enumerate(simulate_candidate_batch(domain_suggestions, keyword)):
+        order[domain] = index
+        if available:
+            # Minimum backlink şartını kontrol et
+            if backlink_data['backlinks'] >= min_backlinks:
+                candidate = ((backlink_data['backlinks'], -index), domain, backlink_data)
+                if len(top_candidates) < limit:
+                    heapq.heappush(top_candidates, candidate)
+                else:
+                    candidate = heapq.heappushpop(top_candidates, candidate)
+                    heapq.heappush(reserves, ((-candidate[0][0], -candidate[0][1]), candidate[1], candidate[2]))
+    
+    contenders = [(domain, backlink_data) for _, domain, backlink_data in sorted(top_candidates, reverse=True)]
+    total = len(contenders)
+    yield "progress", {"phase": "dns", "completed": 0, "total": total}
+    dns_results = run_dns_prescreen([domain for domain, _ in contenders])
+    
+    # Sadece listeye girecek adaylar zenginleştirilir; hata veren adayın yerine en iyi yedek geçer
+    yield "progress", {"phase": "whois", "completed": 0, "total": total}
+    results = []
+    cancel_event = threading.Event()
+    builder = lambda candidate: build_backlink_result(candidate[0], keyword, candidate[1], dns_results[candidate[0]]["status"], cancel_event)
+    completed = 0
+    while contenders:
+        for _, result in iter_concurrent_results(builder, contenders, cancel_event=cancel_event):
+            completed += 1
+            results.append(result)
+            yield "domain", result
+            yield "progress", {"phase": "whois", "completed": completed, "total": total}
+        
+        missing = min(limit - len(results), len(reserves))
+        contenders = [heapq.heappop(reserves)[1:] for _ in range(missing)]
+        if contenders:
+            # Yedekler de tek seferde ön elenir
+            dns_results.update(run_dns_prescreen([domain for domain, _ in contenders]))
+    
+    # Backlink sayısına göre sırala (eşitlikte öneri sırası korunur)
+    yield "progress", {"phase": "scoring", "completed": len(results), "total": total}
+    final_results = sorted(results, key=lambda x: (-x['backlinks'], order[x['domain']]))[:limit]
+    
+    yield "done", {
+        "success": True,
+        "keyword": keyword,
+        "country": country,
+        "min_backlinks": min_backlinks,
+        "total_found": len(final_results),
+        "domains": final_results
+    }
 
 def find_backlink_domains_for_keyword(keyword, country="TR", min_backlinks=100, limit=20):
     """Keyword için en çok backlink'e sahip müsait domain'leri bulur"""
     try:
-        # Domain önerileri oluştur (string listesi döndürür)
-        domain_suggestions = generate_domain_suggestions(keyword, country)
-        
-        # Her domain için backlink analizi yap
-        backlink_results = []
-        
-        for domain in domain_suggestions[:limit * 2]:  # Daha fazla domain analiz et
-            # Domain müsaitlik kontrolü (simüle)
-            is_available = simulate_domain_availability(domain)
-            
-            if is_available:
-                # Backlink verilerini simüle et
-                backlink_data = simulate_backlink_data(domain, keyword)
-                
-                # Minimum backlink şartını kontrol et
-                if backlink_data['backlinks'] >= min_backlinks:
-                    # SEO değeri hesapla
-                    seo_value = analyze_domain_seo_value(domain, keyword)
-                    
-                    # Domain yaşı bilgisi
-                    age_info = estimate_domain_age(domain)
-                    
-                    result = {
-                        "domain": domain,
-                        "available": True,
-                        "backlinks": backlink_data['backlinks'],
-                        "quality_score": backlink_data['quality_score'],
-                        "referring_domains": backlink_data['referring_domains'],
-                        "domain_authority": backlink_data['domain_authority'],
-                        "estimated_value": seo_value['estimated_value'],
-                        "keyword_relevance": seo_value['keyword_relevance'],
-                        "domain_age": age_info
-                    }
-                    
-                    backlink_results.append(result)
-        
-        # Backlink sayısına göre sırala
-        backlink_results.sort(key=lambda x: x['backlinks'], reverse=True)
-        
-        # Limit uygula
-        final_results = backlink_results[:limit]
-        
-        return {
-            "success": True,
-            "keyword": keyword,
-            "country": country,
-            "min_backlinks": min_backlinks,
-            "total_found": len(final_results),
-            "domains": final_results
-        }
+        return run_search_events(iter_backlink_domain_search(keyword, country, min_backlinks, limit))
         
     except Exception as e:
         return {
@@ -1007,69 +2302,311 @@ def find_backlink_domains_for_keyword(keyword, country="TR", min_backlinks=100,
             "error": f"Backlink domain arama hatası: {str(e)}"
         }
 
-@app.route("/find_backlink_domains", methods=["POST"])
+@app.route("/find_backlink_domains", methods=["GET", "POST"])
 def find_backlink_domains():
     """Keyword için en çok backlink'e sahip müsait domain'leri bulur"""
     try:
-        keyword = request.form.get("keyword", "").strip()
-        country = request.form.get("country", "TR").upper()
-        min_backlinks = int(request.form.get("min_backlinks", 100))
-        limit = int(request.form.get("limit", 15))
+        keyword = request.values.get("keyword", "").strip()
+        country = request.values.get("country", "TR").upper()
+        try:
+            min_backlinks = int(request.values.get("min_backlinks", 100))
+            limit = request_limit(15)
+        except ValueError as e:
+            return jsonify({"success": False, "error": f"Geçersiz parametre: {str(e)}"}), 400
         
         if not keyword:
             return jsonify({"success": False, "error": "Lütfen bir keyword girin."})
         
         # Backlink domain analizi yap
-        result = find_backlink_domains_for_keyword(keyword, country, min_backlinks, limit)
-        
-        return jsonify(result)
+        return cached_json_response(
+            "find_backlink_domains", keyword, country, (min_backlinks, limit), find_backlink_domains_for_keyword
+        )
         
     except Exception as e:
         error_msg = f"Backlink domain arama hatası: {str(e)}"
         print(f"Error in find_backlink_domains: {error_msg}")
         return jsonify({"success": False, "error": error_msg})
 
-@app.route("/check_domain", methods=["POST"])
-def check_domain():
+def sse_event(event, data):
+    """Server-Sent Events formatında tek olay"""
+    return f"event: {event}\ndata: {encode_json(data).decode('utf-8')}\n\n"
+
+def stream_search_events(events, error_prefix):
+    """Arama olay akışını text/event-stream yanıtına çevirir"""
+    def generate():
+        try:
+            for event, data in events:
+                yield sse_event(event, data)
+        except Exception as e:
+            print(f"Error in stream: {e}")
+            yield sse_event("error", {"success": False, "error": f"{error_prefix}: {str(e)}"})
+    
+    return Response(generate(), mimetype="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+
+@app.route("/find_seo_domains/stream", methods=["GET", "POST"])
+def find_seo_domains_stream():
+    """/find_seo_domains'in SSE sürümü - sonuçlar hazır oldukça gönderilir"""
     try:
-        domain_name = request.form.get("domain", "").strip()
-        
-        if not domain_name:
-            return jsonify({"success": False, "error": "Lütfen bir domain adı girin."})
-        
-        # .com uzantısı ekle
-        full_domain = domain_name + ".com"
-        
-        # WHOIS sorgusu
-        domain_info = whois.whois(full_domain)
+        keyword = request.values.get("keyword", "").strip()
+        country = request.values.get("country", "TR").upper()
+        limit = request_limit(10)
+    except ValueError as e:
+        return Response(sse_event("error", {"success": False, "error": f"Geçersiz parametre: {str(e)}"}), mimetype="text/event-stream")
+    
+    if not keyword:
+        return Response(sse_event("error", {"success": False, "error": "Lütfen bir keyword girin."}), mimetype="text/event-stream")
+    
+    return stream_search_events(iter_seo_domain_search(keyword, country, limit), "SEO domain arama hatası")
+
+@app.route("/find_backlink_domains/stream", methods=["GET", "POST"])
+def find_backlink_domains_stream():
+    """/find_backlink_domains'in SSE sürümü - sonuçlar hazır oldukça gönderilir"""
+    try:
+        keyword = request.values.get("keyword", "").strip()
+        country = request.values.get("country", "TR").upper()
+        min_backlinks = int(request.values.get("min_backlinks", 100))
+        limit = request_limit(15)
+    except ValueError as e:
+        return Response(sse_event("error", {"success": False, "error": f"Geçersiz parametre: {str(e)}"}), mimetype="text/event-stream")
+    
+    if not keyword:
+        return Response(sse_event("error", {"success": False, "error": "Lütfen bir keyword girin."}), mimetype="text/event-stream")
+    
+    return stream_search_events(
+        iter_backlink_domain_search(keyword, country, min_backlinks, limit),
+        "Backlink domain arama hatası"
+    )
+
+def submit_search_job(kind, params, events_factory, *args):
+    """İşi kuyruğa ekler - 202 ve durum adresiyle hemen döner"""
+    try:
+        job = job_queue.submit(kind, params, events_factory, *args)
+    except JobQueueFull as e:
+        return jsonify({"success": False, "error": str(e)}), 429
+    
+    job["status_url"] = f"/jobs/{job['job_id']}"
+    return jsonify({"success": True, "job": job}), 202
+
+@app.route("/jobs/find_seo_domains", methods=["POST"])
+def submit_seo_domains_job():
+    """/find_seo_domains'in arka plan iş sürümü"""
+    try:
+        keyword = request.values.get("keyword", "").strip()
+        country = request.values.get("country", "TR").upper()
+        limit = request_limit(10)
+    except ValueError as e:
+        return jsonify({"success": False, "error": f"Geçersiz parametre: {str(e)}"}), 400
+    
+    if not keyword:
+        return jsonify({"success": False, "error": "Lütfen bir keyword girin."}), 400
+    
+    params = {"keyword": keyword, "country": country, "limit": limit}
+    return submit_search_job("find_seo_domains", params, iter_seo_domain_search, keyword, country, limit)
+
+@app.route("/jobs/find_backlink_domains", methods=["POST"])
+def submit_backlink_domains_job():
+    """/find_backlink_domains'in arka plan iş sürümü"""
+    try:
+        keyword = request.values.get("keyword", "").strip()
+        country = request.values.get("country", "TR").upper()
+        min_backlinks = int(request.values.get("min_backlinks", 100))
+        limit = request_limit(15)
+    except ValueError as e:
+        return jsonify({"success": False, "error": f"Geçersiz parametre: {str(e)}"}), 400
+    
+    if not keyword:
+        return jsonify({"success": False, "error": "Lütfen bir keyword girin."}), 400
+    
+    params = {"keyword": keyword, "country": country, "min_backlinks": min_backlinks, "limit": limit}
+    return submit_search_job(
+        "find_backlink_domains", params, iter_backlink_domain_search, keyword, country, min_backlinks, limit
+    )
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    """İş durumu, ilerleme, kısmi sonuçlar (domain analizleri) ve bittiyse nihai sonuç"""
+    job = job_queue.snapshot(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": "İş bulunamadı (süresi dolmuş olabilir)."}), 404
+    return jsonify({"success": True, "job": job})
+
+@app.route("/jobs/<job_id>", methods=["DELETE"])
+@app.route("/jobs/<job_id>/cancel", methods=["POST"])
+def cancel_job(job_id):
+    job = job_queue.cancel(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": "İş bulunamadı (süresi dolmuş olabilir)."}), 404
+    return jsonify({"success": True, "job": job})
+
+def check_full_domain(full_domain, cancel_event=None):
+    """Tek domain için WHOIS tabanlı müsaitlik sonucu (/check_domain ve toplu kontrol ortak)"""
+    try:
+        # WHOIS sorgusu (önbellekli)
+        record = get_whois_record(full_domain, cancel_event)
+        if record.get("unchecked"):
+            # Kuyruk dolu / istek iptal edildi - sorgu yapılmadı, müsait denemez
+            return {
+                "success": True,
+                "domain": full_domain,
+                "status": "Bilinmiyor (WHOIS sorgulanamadı)",
+                "details": {"note": f"{record['error']} - daha sonra tekrar deneyin."}
+            }
+        if record.get("error"):
+            raise Exception(record["error"])
         
         # Domain durumunu kontrol et
-        if domain_info.domain_name:
+        if record["registered"]:
             status = "Müsait değil"
             details = {
-                "registrar": domain_info.registrar,
-                "creation_date": str(domain_info.creation_date) if domain_info.creation_date else "Bilinmiyor",
-                "expiration_date": str(domain_info.expiration_date) if domain_info.expiration_date else "Bilinmiyor"
+                "registrar": record["registrar"],
+                "creation_date": record["creation_date"] or "Bilinmiyor",
+                "expiration_date": record["expiration_date"] or "Bilinmiyor"
             }
         else:
             status = "Müsait olabilir"
             details = {}
             
-        return jsonify({
+        return {
             "success": True, 
             "domain": full_domain,
             "status": status,
             "details": details
-        })
+        }
         
     except Exception as e:
-        # Domain müsait olabilir veya WHOIS hatası
-        return jsonify({
+        # WHOIS hatası - domain kayıtlı olabilir, müsait denemez
+        return {
             "success": True,
-            "domain": domain_name + ".com",
-            "status": "Müsait olabilir (WHOIS sorgusu başarısız)",
+            "domain": full_domain,
+            "status": "Bilinmiyor (WHOIS sorgusu başarısız)",
             "details": {"note": "Domain kontrol edilemedi, manuel olarak kontrol edin."}
-        })
+        }
+
+@app.route("/check_domain", methods=["POST"])
+def check_domain():
+    domain_name = request.form.get("domain", "").strip()
+    
+    if not domain_name:
+        return jsonify({"success": False, "error": "Lütfen bir domain adı girin."})
+    
+    # .com uzantısı ekle
+    return jsonify(check_full_domain(domain_name + ".com"))
+
+def _split_list_param(name, value):
+    """Virgül/boşluk ayrılmış metin ya da metin listesi - başka tipler ValueError"""
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return [item.strip() for item in value if item.strip()]
+    if isinstance(value, str):
+        return [item for item in re.split(r'[\s,;]+', value) if item]
+    raise ValueError(f"'{name}' metin ya da metin listesi olmalı")
+
+def build_bulk_domain_list(names, tlds):
+    """İsim x uzantı listesini oluşturur - nokta içeren isimler olduğu gibi kullanılır"""
+    tlds = ["." + tld.lstrip(".").lower() for tld in tlds] or [".com"]
+    domains = []
+    seen = set()
+    for name in names:
+        name = name.lower()
+        candidates = [name] if "." in name else [f"{name}{tld}" for tld in tlds]
+        for domain in candidates:
+            if domain not in seen:
+                seen.add(domain)
+                domains.append(domain)
+    return domains
+
+@app.route("/check_domains_bulk", methods=["POST"])
+def check_domains_bulk():
+    """Birden fazla domain'i paralel kontrol eder, her sonucu biter bitmez NDJSON satırı olarak yollar"""
+    payload = request.get_json(silent=True) or {}
+    try:
+        if not isinstance(payload, dict):
+            raise ValueError("JSON gövdesi bir nesne olmalı")
+        names = _split_list_param("names", payload.get("names", request.form.get("names", "")))
+        tlds = _split_list_param("tlds", payload.get("tlds", request.form.get("tlds", ".com")))
+    except ValueError as e:
+        return jsonify({"success": False, "error": f"Geçersiz parametre: {str(e)}"}), 400
+    
+    if not names:
+        return jsonify({"success": False, "error": "Lütfen en az bir domain adı girin."})
+    
+    domains = build_bulk_domain_list(names, tlds)
+    if len(domains) > BULK_CHECK_MAX_DOMAINS:
+        return jsonify({"success": False, "error": f"En fazla {BULK_CHECK_MAX_DOMAINS} domain kontrol edilebilir."})
+    
+    def generate():
+        executor = ThreadPoolExecutor(max_workers=min(BULK_CHECK_WORKERS, len(domains)))
+        cancel_event = threading.Event()
+        try:
+            futures = [executor.submit(check_full_domain, domain, cancel_event) for domain in domains]
+            for future in as_completed(futures):
+                yield encode_json(future.result()) + b"\n"
+        finally:
+            # İstemci bağlantıyı kapatırsa bekleyen kontroller iptal edilir, WHOIS beklemeleri bırakılır
+            cancel_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    return Response(generate(), mimetype="application/x-ndjson")
+
+def simulation_cache_stats():
+    """Deterministik simülasyon sonuçlarının bellek içi önbellek sayaçları"""
+    stats = {}
+    for name, func in (("availability", simulate_domain_availability), ("backlink_data", _simulated_backlink_profile), ("backlink_analysis", _simulated_backlink_count)):
+        info = func.cache_info()
+        stats[name] = {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}
+    return stats
+
+@app.route("/cache_stats", methods=["GET"])
+def cache_stats():
+    """Önbellek isabet/ıskalama sayaçları"""
+    return jsonify({"success": True, "cache": cache_backend.stats(), "trends_breaker": trends_breaker.snapshot(), "trends_pool": trends_pool.stats(), "trends_batcher": trends_batcher.stats(), "single_flight": request_flights.stats(), "jobs": job_queue.stats(), "simulation": simulation_cache_stats()})
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    started = getattr(g, "request_started", None)
+    if started is not None and request.url_rule is not None:
+        endpoint = request.url_rule.rule
+        metrics.observe("http_request_seconds", time.perf_counter() - started, (("endpoint", endpoint),))
+        metrics.inc("http_requests_total", (("endpoint", endpoint), ("status", response.status_code)))
+    return response
+
+def collect_metric_gauges():
+    """Mevcut bileşen sayaçlarından okuma anında üretilen metrikler"""
+    cache = cache_backend.stats()
+    for namespace, stats in cache["namespaces"].items():
+        labels = (("namespace", namespace),)
+        yield "cache_hits_total", "counter", "Önbellek isabetleri", labels, stats["hits"]
+        yield "cache_misses_total", "counter", "Önbellek ıskalamaları", labels, stats["misses"]
+        yield "cache_entries", "gauge", "Önbellekteki kayıt sayısı", labels, stats["size"]
+    
+    breaker = trends_breaker.snapshot()
+    states = {"closed": 0, "half-open": 1, "open": 2}
+    yield "trends_breaker_state", "gauge", "Google Trends devre kesici (0 kapalı, 1 yarı açık, 2 açık)", (), states[breaker["state"]]
+    yield "trends_breaker_rejected_total", "counter", "Devre açıkken reddedilen Trends istekleri", (), breaker["rejected"]
+    
+    batcher = trends_batcher.stats()
+    yield "trends_payloads_total", "counter", "Google Trends'e gönderilen payload sayısı", (), batcher["payloads"]
+    yield "trends_terms_total", "counter", "Payload'larda sorgulanan terim sayısı", (), batcher["terms"]
+    
+    flights = request_flights.stats()
+    for endpoint, counters in flights["endpoints"].items():
+        labels = (("endpoint", endpoint),)
+        yield "single_flight_executed_total", "counter", "Birleştirilmeden çalışan istekler", labels, counters["executed"]
+        yield "single_flight_coalesced_total", "counter", "Devam eden özdeş isteğe bağlanan istekler", labels, counters["coalesced"]
+    
+    for status, count in job_queue.stats()["by_status"].items():
+        yield "jobs", "gauge", "Durumuna göre iş sayısı", (("status", status),), count
+
+@app.route("/metrics", methods=["GET"])
+def metrics_endpoint():
+    """Prometheus metin formatında metrikler"""
+    return Response(metrics.render(collect_metric_gauges()), mimetype="text/plain; version=0.0.4; charset=utf-8")
 
 if __name__ == "__main__":
     app.run(debug=True)
@@ -0,0 +1,244 @@
+"""
+Toplu (vektörel) domain skorlama motoru
+
+scoring.py'deki skaler fonksiyonlarla (calculate_keyword_relevance, analyze_domain_quality,
+simulate_domain_age, calculate_seo_score, estimate_domain_value) birebir aynı sonucu verir.
+Tüm aday listesi tek seferde NumPy dizi işlemleriyle skorlanır; büyük expired-domain
+dökümleri çevrimdışı sıralanabilir.
+
+ASCII olmayan domain'ler (IDN, Türkçe karakterli isimler) skaler fonksiyonlarla
+hesaplanır, böylece Unicode büyük/küçük harf ve rakam kuralları aynen korunur.
+
+Skor tabloları ve skaler fonksiyonlar scoring.py'den gelir (Flask uygulaması oluşturulmaz).
+Vektörel olmayan, domain başına Python döngüsünde kalan adımlar:
+- domain_age_batch: md5 hash'leri (hashlib dizi girdisi almaz)
+- backlink_counts verilmezse simulate_backlink_analysis (domain başına tohumlanmış üreteç)
+- ASCII olmayan isimlerin skaler hesabı
+"""
+import hashlib
+
+import numpy as np
+
+from scoring import (
+    EXTENSION_SCORES,
+    SPECIAL_COMBINATIONS,
+    POPULAR_AGE_KEYWORDS,
+    normalize_keyword,
+    calculate_keyword_relevance,
+    analyze_domain_quality,
+    simulate_backlink_analysis,
+    simulate_domain_age
+)
+
+VOWEL_BYTES = np.frombuffer(b"aeiouAEIOU", dtype=np.uint8)
+
+# simulate_domain_age ile aynı sıra - ilk eşleşen uzantı kazanır
+AGE_RANGES = [
+    ('.com', 2, 20),
+    ('.net', 1, 15),
+    ('.org', 3, 18),
+    ('.info', 1, 12),
+    ('.biz', 1, 10),
+    ('.com.tr', 1, 15),
+    ('.net.tr', 1, 12)
+]
+
+SCORE_COLUMNS = [
+    "keyword_relevance", "extension_score", "length_score", "character_score",
+    "pronounceable", "backlink_estimate", "backlink_quality", "domain_age_score",
+    "seo_score", "value_total"
+]
+
+def _split_domains(domains):
+    """domain.split('.')[0] ve domain.split('.', 1)[1] karşılıkları"""
+    parts = np.char.partition(domains, '.')
+    names = parts[:, 0]
+    extensions = np.where(parts[:, 1] == '.', parts[:, 2], '')
+    return names, extensions
+
+def _byte_matrix(names):
+    """İsimleri (n x genişlik) uint8 matrisine çevirir; ASCII olmayan satırları işaretler"""
+    encoded = np.char.encode(names, 'utf-8')
+    ascii_mask = np.char.str_len(encoded) == np.char.str_len(names)
+    width = encoded.dtype.itemsize
+    matrix = encoded.view(np.uint8).reshape(len(names), width)
+    return matrix, ascii_mask
+
+def _character_stats(matrix):
+    is_lower = (matrix >= ord('a')) & (matrix <= ord('z'))
+    is_upper = (matrix >= ord('A')) & (matrix <= ord('Z'))
+    alpha_count = (is_lower | is_upper).sum(axis=1)
+    vowel_count = np.isin(matrix, VOWEL_BYTES).sum(axis=1)
+    has_digit = ((matrix >= ord('0')) & (matrix <= ord('9'))).any(axis=1)
+    has_hyphen = (matrix == ord('-')).any(axis=1)
+    return alpha_count, vowel_count, has_digit, has_hyphen
+
+def keyword_relevance_batch(names_lower, keyword_clean, has_digit, has_hyphen):
+    """calculate_keyword_relevance'ın vektörel karşılığı"""
+    lengths = np.char.str_len(names_lower)
+    contains = np.char.find(names_lower, keyword_clean) >= 0
+    starts = np.char.startswith(names_lower, keyword_clean)
+    ends = np.char.endswith(names_lower, keyword_clean)
+
+    # Tam eşleşme / başta / sonda / ortada
+    score = np.where(
+        names_lower == keyword_clean, 80,
+        np.where(contains, np.select([starts, ends], [60, 55], 45), 0)
+    ).astype(np.int64)
+
+    # Kısmi eşleşme - keyword'ün kelimeleri
+    for word in keyword_clean.split():
+        if len(word) > 2:
+            word_in = np.char.find(names_lower, word) >= 0
+            word_starts = np.char.startswith(names_lower, word)
+            word_ends = np.char.endswith(names_lower, word)
+            score += np.where(word_in, np.select([word_starts, word_ends], [25, 20], 15), 0)
+
+    # Domain uzunluğu bonusu
+    score += np.select([lengths <= 6, lengths <= 8, lengths <= 10, lengths <= 12], [20, 15, 10, 5], 0)
+
+    # Özel kombinasyon bonusu
+    has_combo = np.zeros(len(names_lower), dtype=bool)
+    for combo in SPECIAL_COMBINATIONS:
+        has_combo |= np.char.find(names_lower, combo) >= 0
+    score += np.where(has_combo & contains, 10, 0)
+
+    # Sayı ve özel karakter cezası
+    score -= np.where(has_digit, 5, 0)
+    score -= np.where(has_hyphen, 3, 0)
+
+    return np.minimum(score, 100)
+
+def domain_quality_batch(names, extensions, alpha_count, vowel_count, has_digit, has_hyphen):
+    """analyze_domain_quality'nin vektörel karşılığı"""
+    unique_extensions, inverse = np.unique(extensions, return_inverse=True)
+    extension_lookup = np.array([EXTENSION_SCORES.get(str(ext), 5) for ext in unique_extensions], dtype=np.int64)
+    extension_score = extension_lookup[inverse.reshape(-1)]
+
+    lengths = np.char.str_len(names)
+    length_score = np.select([lengths <= 6, lengths <= 10, lengths <= 15], [25, 20, 15], 5)
+
+    character_score = np.maximum(20 - np.where(has_hyphen, 5, 0) - np.where(has_digit, 3, 0), 0)
+
+    # Telaffuz kolaylığı
+    consonant_count = alpha_count - vowel_count
+    both = (vowel_count > 0) & (consonant_count > 0)
+    ratio = np.divide(vowel_count, vowel_count + consonant_count, out=np.zeros(len(names)), where=both)
+    pronounceable = np.where(both, np.where((ratio >= 0.2) & (ratio <= 0.6), 15, 5), 0)
+
+    return {
+        "extension_score": extension_score,
+        "length_score": length_score,
+        "character_score": character_score,
+        "pronounceable": pronounceable
+    }
+
+def domain_age_batch(domains, names_lower):
+    """simulate_domain_age'in yaş skoru ve yılı (md5 tabanlı, deterministik)"""
+    # md5 hash'leri domain başına Python döngüsünde hesaplanır; aralık ve skor hesabı vektörel
+    domain_hash = np.array(
+        [int(hashlib.md5(domain.encode()).hexdigest()[:8], 16) for domain in domains.tolist()],
+        dtype=np.int64
+    )
+
+    conditions = [np.char.endswith(domains, ext) for ext, _, _ in AGE_RANGES]
+    min_years = np.select(conditions, [low for _, low, _ in AGE_RANGES], 1)
+    max_years = np.select(conditions, [high for _, _, high in AGE_RANGES], 10)
+
+    # Kısa domain'ler genelde daha eski
+    lengths = np.char.str_len(names_lower)
+    min_years = min_years + np.select([lengths <= 4, lengths <= 6], [3, 1], 0)
+    max_years = max_years + np.select([lengths <= 4, lengths <= 6], [5, 2], 0)
+
+    # Popüler keyword'ler daha eski olabilir
+    popular = np.zeros(len(domains), dtype=bool)
+    for keyword in POPULAR_AGE_KEYWORDS:
+        popular |= np.char.find(names_lower, keyword) >= 0
+    min_years = min_years + np.where(popular, 2, 0)
+    max_years = max_years + np.where(popular, 3, 0)
+
+    age_years = min_years + (domain_hash % ((max_years - min_years) * 10)) / 10.0
+    age_score = np.select(
+        [age_years > 15, age_years > 10, age_years > 5, age_years > 2, age_years > 1],
+        [30, 25, 20, 15, 10], 5
+    )
+    return age_score, age_years
+
+def backlink_quality_batch(backlink_counts):
+    """simulate_backlink_analysis'teki kalite eşiklerinin vektörel karşılığı"""
+    return np.select(
+        [backlink_counts > 1000, backlink_counts > 500, backlink_counts > 100, backlink_counts > 50],
+        [30, 25, 20, 15], 10
+    )
+
+def domain_value_totals(seo_score, backlink_counts, keyword_relevance):
+    """estimate_domain_value'daki sayısal toplam"""
+    return seo_score * 10 + np.minimum(backlink_counts * 0.5, 1000) + keyword_relevance * 5
+
+def format_domain_value(total_value):
+    """estimate_domain_value ile aynı metin formatı"""
+    if total_value > 5000:
+        return f"${total_value:,.0f}+"
+    elif total_value > 1000:
+        return f"${total_value:,.0f}"
+    else:
+        return f"${total_value:.0f}"
+
+def score_domains_batch(domains, keyword, backlink_counts=None, age_scores=None):
+    """
+    Aday listesinin tüm skor faktörlerini tek seferde hesaplar (sütun bazlı sonuç)
+    - backlink_counts verilmezse simulate_backlink_analysis kullanılır
+    - age_scores verilmezse simulate_domain_age skoru kullanılır (WHOIS yok)
+    """
+    domains = np.asarray(domains, dtype=str)
+    count = len(domains)
+    if count == 0:
+        return {column: np.zeros(0, dtype=np.int64) for column in SCORE_COLUMNS}
+
+    keyword_clean = normalize_keyword(keyword)
+    names, extensions = _split_domains(domains)
+    names_lower = np.char.lower(names)
+    matrix, ascii_mask = _byte_matrix(names)
+    alpha_count, vowel_count, has_digit, has_hyphen = _character_stats(matrix)
+
+    keyword_relevance = keyword_relevance_batch(names_lower, keyword_clean, has_digit, has_hyphen)
+    quality = domain_quality_batch(names, extensions, alpha_count, vowel_count, has_digit, has_hyphen)
+    if age_scores is None:
+        domain_age_score, _ = domain_age_batch(domains, names_lower)
+    else:
+        domain_age_score = np.asarray(age_scores, dtype=np.int64)
+
+    # ASCII olmayan isimler skaler fonksiyonlarla hesaplanır
+    for index in np.flatnonzero(~ascii_mask).tolist():
+        domain = str(domains[index])
+        keyword_relevance[index] = calculate_keyword_relevance(domain, keyword)
+        for factor, value in analyze_domain_quality(domain).items():
+            quality[factor][index] = value
+        if age_scores is None:
+            domain_age_score[index] = simulate_domain_age(domain)["score"]
+
+    if backlink_counts is None:
+        # Skaler döngü - simülasyon domain ve keyword'e göre tohumlanmış üreteç kullanır
+        backlink_counts = [simulate_backlink_analysis(domain, keyword)["count"] for domain in domains.tolist()]
+    backlink_counts = np.asarray(backlink_counts, dtype=np.int64)
+    backlink_quality = backlink_quality_batch(backlink_counts)
+
+    # calculate_seo_score: tüm faktörlerin toplamı, en fazla 100
+    seo_score = np.minimum(
+        keyword_relevance + quality["extension_score"] + quality["length_score"]
+        + quality["character_score"] + quality["pronounceable"] + backlink_quality + domain_age_score,
+        100
+    )
+
+    return {
+        "keyword_relevance": keyword_relevance,
+        "extension_score": quality["extension_score"],
+        "length_score": quality["length_score"],
+        "character_score": quality["character_score"],
+        "pronounceable": quality["pronounceable"],
+        "backlink_estimate": backlink_counts,
+        "backlink_quality": backlink_quality,
+        "domain_age_score": domain_age_score,
+        "seo_score": seo_score,
+        "value_total": domain_value_totals(seo_score, backlink_counts, keyword_relevance)
+    }
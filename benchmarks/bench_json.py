@@ -0,0 +1,171 @@
+"""
+Büyük yanıtlar için JSON kodlama benchmark'ı
+
+10.000 domain'lik SEO ve backlink yanıtları ile büyük bir related_queries yükü
+üretilir; Flask'ın varsayılan (standart json) kodlayıcısı ile uygulamanın hızlı
+JSON sağlayıcısı (encode_json - orjson kuruluysa onu kullanır) karşılaştırılır.
+
+"Önceki yol" satırı önbelleğe alınmayan bir isteğin eski maliyetidir: ETag için
+json.dumps + jsonify ile ikinci kez kodlama. Yeni yolda gövde bir kez kodlanır ve
+önbellekten verilen yanıtlar yeniden kodlanmaz.
+
+Kullanım:
+    python benchmarks/bench_json.py
+    python benchmarks/bench_json.py --domains 50000 --repeat 3
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+
+from json_encoding import orjson, encode_json, FastJSONProvider
+from scoring import (
+    DomainAnalysis,
+    calculate_keyword_relevance,
+    analyze_domain_quality,
+    simulate_backlink_analysis,
+    simulate_backlink_data,
+    simulate_domain_age,
+    calculate_seo_score,
+    estimate_domain_value
+)
+
+KEYWORDS = ["altın", "gram altın", "bitcoin", "dolar kuru", "gold price", "real estate"]
+PREFIXES = ["", "best", "my", "get", "pro", "online"]
+SUFFIXES = ["", "market", "hub", "tr", "news", "fiyat"]
+EXTENSIONS = [".com", ".com.tr", ".net", ".org", ".info"]
+
+def candidate_domains(count):
+    """Keyword, ön/son ek ve uzantı kombinasyonlarından `count` benzersiz domain"""
+    domains = []
+    number = 0
+    while len(domains) < count:
+        for keyword in KEYWORDS:
+            name = keyword.replace(" ", "").replace("ı", "i")
+            prefix = PREFIXES[number % len(PREFIXES)]
+            suffix = SUFFIXES[(number // len(PREFIXES)) % len(SUFFIXES)]
+            extension = EXTENSIONS[number % len(EXTENSIONS)]
+            domains.append((keyword, f"{prefix}{name}{suffix}{number}{extension}"))
+        number += 1
+    return domains[:count]
+
+def seo_record(keyword, domain):
+    """analyze_domain_seo_value ile aynı alanlar - ağ çağrısı olmadan"""
+    analysis = DomainAnalysis(domain)
+    analysis.status = "available"
+    analysis.keyword_relevance = analysis.keyword_match = calculate_keyword_relevance(domain, keyword)
+    quality = analyze_domain_quality(domain)
+    analysis.extension_score = quality["extension_score"]
+    analysis.length_score = quality["length_score"]
+    analysis.character_score = quality["character_score"]
+    analysis.pronounceable = quality["pronounceable"]
+    backlinks = simulate_backlink_analysis(domain, keyword)
+    analysis.backlink_estimate = backlinks["count"]
+    analysis.backlink_quality = backlinks["quality_score"]
+    age = simulate_domain_age(domain)
+    analysis.domain_age = age["age"]
+    analysis.age_score = age["score"]
+    analysis.creation_date = age["creation_date"]
+    analysis.age_note = age["note"]
+    analysis.seo_score = calculate_seo_score(analysis.factors)
+    analysis.estimated_value = estimate_domain_value(analysis)
+    return analysis
+
+def build_payloads(count):
+    pairs = candidate_domains(count)
+    records = [seo_record(keyword, domain) for keyword, domain in pairs]
+
+    seo_response = {
+        "success": True,
+        "keyword": "altın",
+        "total_found": len(records),
+        "domains": [record.to_dict() for record in records]
+    }
+
+    backlink_domains = []
+    for (keyword, domain), record in zip(pairs, records):
+        backlink_data = simulate_backlink_data(domain, keyword)
+        backlink_domains.append({
+            "domain": domain,
+            "available": True,
+            **backlink_data,
+            "estimated_value": record.estimated_value,
+            "keyword_relevance": record.keyword_relevance,
+            "domain_age": {"age": record.domain_age, "score": record.age_score, "creation_date": record.creation_date, "note": record.age_note}
+        })
+    backlink_response = {
+        "success": True,
+        "keyword": "altın",
+        "country": "TR",
+        "min_backlinks": 100,
+        "total_found": len(backlink_domains),
+        "domains": backlink_domains
+    }
+
+    related = [{"query": f"{keyword} {domain}", "value": index % 100} for index, (keyword, domain) in enumerate(pairs)]
+    keywords_response = {
+        "success": True,
+        "data": {
+            "keyword": "altın",
+            "interest_data": "✅ Google Trends verisi",
+            "related_queries": {"top": related[: count // 2], "rising": related[count // 2:]}
+        }
+    }
+
+    return {
+        "find_seo_domains": (seo_response, records),
+        "find_backlink_domains": (backlink_response, None),
+        "get_keywords (related_queries)": (keywords_response, None)
+    }
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Büyük yanıtlar için JSON kodlama benchmark'ı")
+    parser.add_argument("--domains", type=int, default=10000, help="Yanıt başına domain / sorgu sayısı")
+    parser.add_argument("--repeat", type=int, default=5, help="Tekrar sayısı (en iyi sonuç alınır)")
+    args = parser.parse_args(argv)
+
+    print(f"Kodlayıcı: {'orjson ' + orjson.__version__ if orjson is not None else 'standart json (orjson kurulu değil)'}")
+    payloads = build_payloads(args.domains)
+
+    # Flask'ın varsayılan sağlayıcısı: sort_keys=True, ensure_ascii=True, kompakt ayırıcılar
+    flask_default = lambda value: json.dumps(value, sort_keys=True, separators=(",", ":"))
+    etag_dump = lambda value: json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+    print(f"\n{'yanıt':<32} {'boyut KB':>9} {'stdlib ms':>10} {'hızlı ms':>9} {'hızlanma':>9} {'önceki yol ms':>14} {'yeni yol ms':>12}")
+    for name, (payload, records) in payloads.items():
+        size = len(encode_json(payload, sort_keys=True)) / 1024
+        stdlib_ms = best_of(lambda: flask_default(payload), args.repeat)
+        fast_ms = best_of(lambda: encode_json(payload, sort_keys=True), args.repeat)
+        previous_ms = best_of(lambda: (etag_dump(payload), flask_default(payload)), args.repeat)
+        if records is not None:
+            # Yeni yolda kayıtların JSON şekline çevrilmesi de istek maliyetine dahil
+            current = lambda: encode_json({**payload, "domains": [record.to_dict() for record in records]}, sort_keys=True)
+        else:
+            current = lambda: encode_json(payload, sort_keys=True)
+        current_ms = best_of(current, args.repeat)
+        print(f"{name:<32} {size:>9.0f} {stdlib_ms:>10.1f} {fast_ms:>9.1f} {stdlib_ms / fast_ms:>8.1f}x {previous_ms:>14.1f} {current_ms:>12.1f}")
+
+    # Uçtan uca: Flask yanıt nesnesi (jsonify) oluşturma - uygulamanın sağlayıcısıyla boş bir Flask uygulaması
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    seo_payload = payloads["find_seo_domains"][0]
+    with app.test_request_context():
+        jsonify_ms = best_of(lambda: app.json.response(seo_payload), args.repeat)
+    print(f"\njsonify (find_seo_domains, {args.domains} domain): {jsonify_ms:.1f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Keyword normalizasyonu mikro benchmark'ı
+
+Eski, her çağrıda regex + replace döngüsü çalıştıran üç varyantı yeni
+normalize_keyword (str.translate + önceden derlenmiş regex + lru_cache) ile
+karşılaştırır. Skorlama döngüsünde her aday domain için keyword tekrar
+normalize edildiğinden asıl kazanç orada görülür.
+
+Kullanım:
+    python benchmarks/bench_keyword_normalization.py
+"""
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from scoring import normalize_keyword, calculate_keyword_relevance
+from corpus import domain_candidates
+
+KEYWORDS = ["altın", "Gram Altın", "bitcoin fiyatı", "dolar kuru", "İstanbul emlak", "çeyrek altın", "gold price"]
+
+def legacy_suggestion_keyword(keyword):
+    # generate_domain_suggestions'taki eski hali
+    clean_keyword = re.sub(r'[^a-zA-ZğüşıöçĞÜŞİÖÇ0-9]', '', keyword.lower())
+    tr_to_en = {
+        'ğ': 'g', 'ü': 'u', 'ş': 's', 'ı': 'i', 'ö': 'o', 'ç': 'c',
+        'Ğ': 'G', 'Ü': 'U', 'Ş': 'S', 'İ': 'I', 'Ö': 'O', 'Ç': 'C'
+    }
+    for tr_char, en_char in tr_to_en.items():
+        clean_keyword = clean_keyword.replace(tr_char, en_char)
+    return clean_keyword
+
+def legacy_relevance_keyword(keyword):
+    # calculate_keyword_relevance'taki eski hali ("altın" -> "altn")
+    keyword_clean = re.sub(r'[^a-zA-Z0-9]', '', keyword.lower())
+    tr_to_en = {'ğ': 'g', 'ü': 'u', 'ş': 's', 'ı': 'i', 'ö': 'o', 'ç': 'c'}
+    for tr_char, en_char in tr_to_en.items():
+        keyword_clean = keyword_clean.replace(tr_char, en_char)
+    return keyword_clean
+
+def legacy_backlink_keyword(keyword):
+    # simulate_backlink_analysis'teki eski hali
+    return re.sub(r'[^a-zA-Z0-9]', '', keyword.lower())
+
+def ns_per_call(func, number):
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    return best / number * 1e9
+
+def main():
+    number = 20000
+    uncached = normalize_keyword.__wrapped__
+
+    print("Normalizasyon (ns/çağrı, keyword başına ortalama)")
+    rows = [
+        ("eski generate_domain_suggestions", legacy_suggestion_keyword),
+        ("eski calculate_keyword_relevance", legacy_relevance_keyword),
+        ("eski simulate_backlink_analysis", legacy_backlink_keyword),
+        ("normalize_keyword (önbelleksiz)", uncached),
+        ("normalize_keyword (önbellekli)", normalize_keyword)
+    ]
+    for label, func in rows:
+        cost = sum(ns_per_call(lambda: func(keyword), number) for keyword in KEYWORDS) / len(KEYWORDS)
+        print(f"  {label:<36} {cost:8.0f} ns")
+
+    # Skorlama döngüsü: aynı keyword her aday için tekrar normalize edilir
+    print("\nSkorlama döngüsü (aday başına keyword normalizasyonu, ns/aday)")
+    for keyword in ["altın", "Gram Altın"]:
+        candidates = domain_candidates(keyword, "TR")
+
+        def legacy_loop():
+            for _ in candidates:
+                legacy_relevance_keyword(keyword)
+
+        def new_loop():
+            for _ in candidates:
+                normalize_keyword(keyword)
+
+        legacy = ns_per_call(legacy_loop, 2000) / len(candidates)
+        new = ns_per_call(new_loop, 2000) / len(candidates)
+        print(f"  {keyword:<12} eski {legacy:6.0f} ns  yeni {new:6.0f} ns  ({legacy / new:.1f}x)")
+
+        relevance = ns_per_call(lambda: [calculate_keyword_relevance(domain, keyword) for domain in candidates], 2000)
+        print(f"  {'':<12} calculate_keyword_relevance toplam: {relevance / len(candidates):.0f} ns/aday")
+
+    print("\nTutarlılık")
+    for keyword in KEYWORDS:
+        print(f"  {keyword!r:<18} eski alaka: {legacy_relevance_keyword(keyword)!r:<16} yeni: {normalize_keyword(keyword)!r}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+Skorlama fonksiyonları mikro benchmark'ı ve regresyon kapısı
+
+Her aday domain için çalışan saf fonksiyonlar (calculate_keyword_relevance,
+analyze_domain_quality, simulate_domain_age, calculate_seo_score, estimate_domain_value)
+Türkçe ve İngilizce keyword/domain derlemi üzerinde ölçülür: ns/çağrı ve çağrı başına
+tepe bellek (tracemalloc).
+
+Her turda sabit bir kalibrasyon döngüsü ve fonksiyon art arda, yaklaşık eşit sürelerde
+ölçülür; turun sonucu ikisinin oranıdır. Böylece aynı makinedeki anlık yük ve frekans
+değişimleri iki tarafı birlikte etkiler. Ölçüm sabit PYTHONHASHSEED ile birkaç ayrı süreçte
+tekrarlanır (süreçler arası bellek / hash yerleşimi farkı tek süreçte görünmez); kapı, süreç
+başına tur oranları medyanlarının medyanına göre çalışır. Baseline'dan eşikten fazla
+yavaşlayan fonksiyon varsa çıkış kodu 1.
+
+Baseline makineye özeldir: oran farklı CPU / Python sürümleri arasında taşınmaz (fonksiyonlar
+ve kalibrasyon döngüsü donanımdan farklı etkilenir). Yeni bir makinede karşılaştırmadan önce
+değişiklik yapılmamış kodla --save-baseline çalıştırılmalıdır; kayıtlı baseline başka bir
+ortamda alınmışsa uyarı verilir.
+
+Kullanım:
+    python benchmarks/bench_scoring.py                    # ölç ve baseline ile karşılaştır
+    python benchmarks/bench_scoring.py --threshold 0.10   # %10'dan fazla yavaşlama = hata
+    python benchmarks/bench_scoring.py --save-baseline    # bu makine için baseline oluştur
+    python benchmarks/bench_scoring.py --processes 5      # daha fazla süreç, daha kararlı medyan
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from scoring import (
+    calculate_keyword_relevance,
+    analyze_domain_quality,
+    simulate_domain_age,
+    calculate_seo_score,
+    estimate_domain_value
+)
+from corpus import domain_candidates
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "scoring.json")
+
+TURKISH_KEYWORDS = ["altın", "gram altın", "çeyrek altın", "dolar kuru", "İstanbul emlak", "borsa", "kiralık ev", "ikinci el araba"]
+ENGLISH_KEYWORDS = ["gold price", "bitcoin", "real estate", "car rental", "stock market", "crypto news", "oil", "euro"]
+
+def build_corpus():
+    """(keyword, domain) çiftleri ve skor girdileri - öneri üreticisinin sabit varyasyonlarından"""
+    pairs = []
+    for keyword in TURKISH_KEYWORDS:
+        pairs.extend((keyword, domain) for domain in domain_candidates(keyword, "TR", 40))
+    for keyword in ENGLISH_KEYWORDS:
+        pairs.extend((keyword, domain) for domain in domain_candidates(keyword, "US", 40))
+
+    factors = []
+    analyses = []
+    for index, (keyword, domain) in enumerate(pairs):
+        relevance = calculate_keyword_relevance(domain, keyword)
+        factor = {"keyword_match": relevance, **analyze_domain_quality(domain)}
+        factor["backlink_quality"] = (10, 15, 20, 25, 30)[index % 5]
+        factor["domain_age"] = simulate_domain_age(domain)["score"]
+        factors.append(factor)
+        analyses.append({
+            "seo_score": calculate_seo_score(factor),
+            "backlink_estimate": (index * 137) % 3000,
+            "keyword_relevance": relevance
+        })
+    return pairs, factors, analyses
+
+def benchmark_cases(pairs, factors, analyses):
+    """Fonksiyon adı -> derlemin tamamını bir kez işleyen çağrı ve çağrı sayısı"""
+    domains = [domain for _, domain in pairs]
+    return {
+        "calculate_keyword_relevance": (lambda: [calculate_keyword_relevance(domain, keyword) for keyword, domain in pairs], len(pairs)),
+        "analyze_domain_quality": (lambda: [analyze_domain_quality(domain) for domain in domains], len(domains)),
+        "simulate_domain_age": (lambda: [simulate_domain_age(domain) for domain in domains], len(domains)),
+        "calculate_seo_score": (lambda: [calculate_seo_score(factor) for factor in factors], len(factors)),
+        "estimate_domain_value": (lambda: [estimate_domain_value(analysis) for analysis in analyses], len(analyses))
+    }
+
+def calibration_loop():
+    # Sabit saf-Python iş yükü: string, dict ve aritmetik karışımı
+    total = 0
+    table = {}
+    for number in range(200):
+        key = f"k{number % 17}"
+        table[key] = table.get(key, 0) + number
+        total += len(key) * 3
+    return total
+
+# Turdaki her ölçümün hedef süresi (saniye)
+SAMPLE_SECONDS = 0.05
+
+def loops_for(timer, seconds):
+    """Bir ölçümün yaklaşık `seconds` sürmesi için gereken döngü sayısı"""
+    number, elapsed = timer.autorange()
+    return max(int(number * seconds / elapsed), 1)
+
+def measure(func, calls, rounds):
+    """
+    Kalibrasyon ve fonksiyon her turda art arda ölçülür
+    (fonksiyonun en düşük ns/çağrısı, kalibrasyonun en düşük ns'si, tur oranlarının medyanı ve yayılımı)
+    """
+    func()  # Önbellekler ve ilk çağrı maliyetleri dışarıda kalsın
+    func_timer = timeit.Timer(func)
+    calibration_timer = timeit.Timer(calibration_loop)
+    func_number = loops_for(func_timer, SAMPLE_SECONDS)
+    calibration_number = loops_for(calibration_timer, SAMPLE_SECONDS)
+
+    costs = []
+    calibrations = []
+    ratios = []
+    for index in range(rounds):
+        # Sıra her turda değişir - ölçüm sırasına bağlı ısınma etkisi iki tarafa eşit dağılır
+        if index % 2:
+            cost = func_timer.timeit(func_number) / (func_number * calls) * 1e9
+            calibration_ns = calibration_timer.timeit(calibration_number) / calibration_number * 1e9
+        else:
+            calibration_ns = calibration_timer.timeit(calibration_number) / calibration_number * 1e9
+            cost = func_timer.timeit(func_number) / (func_number * calls) * 1e9
+        costs.append(cost)
+        calibrations.append(calibration_ns)
+        ratios.append(cost / calibration_ns)
+
+    quartiles = statistics.quantiles(ratios, n=4)
+    median = statistics.median(ratios)
+    return min(costs), min(calibrations), median, (quartiles[2] - quartiles[0]) / median
+
+def peak_bytes_per_call(func, calls):
+    """Derlem bir kez işlenirken tracemalloc tepe belleği / çağrı sayısı"""
+    tracemalloc.start()
+    try:
+        func()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(peak - baseline, 0) / calls
+
+def environment():
+    """Baseline'ın alındığı ortam - farklıysa karşılaştırma anlamlı değildir"""
+    return {
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count()
+    }
+
+def run(rounds):
+    pairs, factors, analyses = build_corpus()
+    calibrations = []
+    results = {}
+    for name, (func, calls) in benchmark_cases(pairs, factors, analyses).items():
+        cost, calibration_ns, ratio, spread = measure(func, calls, rounds)
+        calibrations.append(calibration_ns)
+        results[name] = {
+            "ns_per_call": round(cost, 1),
+            "relative_cost": round(ratio, 5),
+            "spread": round(spread, 4),
+            "peak_bytes_per_call": round(peak_bytes_per_call(func, calls), 1)
+        }
+    return {
+        "environment": environment(),
+        "corpus_size": len(pairs),
+        "calibration_ns": round(min(calibrations), 1),
+        "results": results
+    }
+
+def run_processes(rounds, processes):
+    """
+    run() ayrı süreçlerde tekrarlanır; oran süreç medyanlarının medyanı, ns/çağrı en düşüğüdür
+    spread süreçler arası (en yüksek - en düşük) / medyan - kapı eşiği bunun belirgin üstünde olmalı
+    """
+    env = dict(os.environ, PYTHONHASHSEED="0")
+    command = [sys.executable, os.path.abspath(__file__), "--worker", "--rounds", str(rounds)]
+    reports = [json.loads(subprocess.run(command, env=env, check=True, capture_output=True, text=True).stdout) for _ in range(processes)]
+
+    results = {}
+    for name, first in reports[0]["results"].items():
+        ratios = [report["results"][name]["relative_cost"] for report in reports]
+        median = statistics.median(ratios)
+        results[name] = {
+            "ns_per_call": min(report["results"][name]["ns_per_call"] for report in reports),
+            "relative_cost": round(median, 5),
+            "spread": round((max(ratios) - min(ratios)) / median, 4) if processes > 1 else first["spread"],
+            "peak_bytes_per_call": first["peak_bytes_per_call"]
+        }
+    return {
+        "environment": reports[0]["environment"],
+        "corpus_size": reports[0]["corpus_size"],
+        "calibration_ns": min(report["calibration_ns"] for report in reports),
+        "processes": processes,
+        "rounds": rounds,
+        "results": results
+    }
+
+def check_regressions(report, baseline, threshold):
+    """Kalibrasyona oranlanmış maliyet baseline'dan `threshold` kadar kötüyse regresyon"""
+    regressions = []
+    if baseline.get("environment") != report["environment"]:
+        print(f"\n⚠️ Baseline farklı bir ortamda alınmış ({baseline.get('environment')}) - bu makinede --save-baseline ile yeniden oluşturun")
+    print(f"\nBaseline karşılaştırması (eşik %{threshold * 100:.0f}, kalibrasyona oranlı medyan)")
+    for name, current in report["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            print(f"  {name:<28} baseline yok")
+            continue
+        change = current["relative_cost"] / previous["relative_cost"] - 1
+        flag = "❌" if change > threshold else "✅"
+        print(f"  {name:<28} {change:+7.1%} {flag}")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Skorlama fonksiyonları mikro benchmark'ı")
+    parser.add_argument("--rounds", type=int, default=15, help="Süreç başına tur sayısı (oranların medyanı alınır)")
+    parser.add_argument("--processes", type=int, default=3, help="Ölçümün tekrarlandığı süreç sayısı (medyan alınır)")
+    parser.add_argument("--threshold", type=float, default=0.20, help="İzin verilen yavaşlama oranı")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline dosyası")
+    parser.add_argument("--save-baseline", action="store_true", help="Sonuçları baseline olarak kaydet")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run(max(args.rounds, 3))))
+        return 0
+
+    report = run_processes(max(args.rounds, 3), max(args.processes, 1))
+    print(f"Derlem: {report['corpus_size']} (keyword, domain) çifti, kalibrasyon: {report['calibration_ns']:.0f} ns, {report['processes']} süreç x {report['rounds']} tur")
+    print(f"\n{'fonksiyon':<28} {'ns/çağrı':>10} {'oran':>9} {'yayılım':>8} {'tepe B/çağrı':>13}")
+    for name, row in report["results"].items():
+        print(f"{name:<28} {row['ns_per_call']:>10.1f} {row['relative_cost']:>9.4f} {row['spread']:>7.1%} {row['peak_bytes_per_call']:>13.1f}")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, ensure_ascii=False, indent=2)
+            handle.write("\n")
+        print(f"\n💾 Baseline kaydedildi: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("\nBaseline yok - önce --save-baseline ile oluşturun")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    regressions = check_regressions(report, baseline, args.threshold)
+    if regressions:
+        print(f"\n❌ Yavaşlayan fonksiyonlar: {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
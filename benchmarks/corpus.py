@@ -0,0 +1,37 @@
+"""
+Benchmark derlemi - uygulamayı içe aktarmadan aday domain üretir
+
+generate_domain_suggestions'ın sabit varyasyonları ve uzantı grupları kullanılır (kategori
+verisinden gelen ek varyasyonlar hariç). Böylece benchmark'lar Flask uygulamasını, thread
+havuzlarını ve önbelleği oluşturmadan sadece scoring.py'deki saf fonksiyonları ölçer.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scoring import normalize_keyword
+
+# app.get_domain_variations'taki sabit varyasyonlar ve app.PRIMARY/SECONDARY_EXTENSIONS sırası
+VARIATIONS = ("{}", "{}tr", "{}market", "{}hub", "{}pro", "my{}", "get{}", "{}online")
+EXTENSION_TIERS = {
+    "TR": ((".com", ".com.tr", ".net", ".net.tr"), (".org", ".org.tr", ".info", ".biz")),
+    "default": ((".com", ".net", ".org"), (".info", ".biz"))
+}
+
+def domain_candidates(keyword, country="TR", limit=30):
+    """Keyword için ilk `limit` aday domain (uzantı grubu, varyasyon, uzantı sırasıyla)"""
+    clean_keyword = normalize_keyword(keyword)
+    variations = [pattern.format(clean_keyword) for pattern in VARIATIONS if country == "TR" or pattern != "{}tr"]
+    candidates = []
+    seen = set()
+    for extensions in EXTENSION_TIERS.get(country, EXTENSION_TIERS["default"]):
+        for variation in variations:
+            for extension in extensions:
+                domain = f"{variation}{extension}"
+                if domain not in seen:
+                    seen.add(domain)
+                    candidates.append(domain)
+                    if len(candidates) == limit:
+                        return candidates
+    return candidates
@@ -0,0 +1,232 @@
+"""
+Endpoint yük testi - canlı Google / WHOIS / DNS'e gitmeden
+
+Yerel sahte Trends (HTTP), WHOIS (port 43) ve DNS (UDP) sunucuları başlatılır, uygulama
+bunlara yönlendirilerek gerçek bir HTTP sunucusunda çalıştırılır ve dört endpoint eş
+zamanlı yük altında ölçülür. Her endpoint için istek/sn ile p50/p95/p99 gecikme raporlanır;
+sonuçlar kayıtlı bir baseline ile karşılaştırılabilir.
+
+Kullanım:
+    python benchmarks/load_test.py                                  # varsayılan senaryo
+    python benchmarks/load_test.py --concurrency 16 --requests 200 --trends-429 0.05
+    python benchmarks/load_test.py --save-baseline                  # baseline'ı güncelle
+    python benchmarks/load_test.py --max-regression 0.25            # %25'ten kötüyse çıkış kodu 1
+
+Varsayılan olarak tüm önbellekler kapatılır (--warm ile açık kalır) ve keyword'ler
+numaralandırılır, böylece her istek gerçekten DNS/WHOIS/Trends yolundan geçer.
+"""
+import argparse
+import contextlib
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from standin_servers import FaultConfig, TrendsStandin, WhoisStandin, DnsStandin, Port43Redirect
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "load_test.json")
+
+KEYWORDS = [
+    "altın", "gram altın", "bitcoin", "dolar", "euro", "borsa", "ev", "araba",
+    "petrol", "kredi", "gold price", "crypto", "real estate", "car rental"
+]
+
+ENDPOINTS = ["get_keywords", "find_seo_domains", "find_backlink_domains", "check_domain"]
+
+def build_request(endpoint, keyword, number):
+    """Endpoint için (yol, form verisi)"""
+    if endpoint == "get_keywords":
+        return "/get_keywords", {"keyword": keyword, "country": "TR"}
+    if endpoint == "find_seo_domains":
+        return "/find_seo_domains", {"keyword": keyword, "country": "TR", "limit": 10}
+    if endpoint == "find_backlink_domains":
+        return "/find_backlink_domains", {"keyword": keyword, "country": "TR", "min_backlinks": 100, "limit": 15}
+    return "/check_domain", {"domain": f"{keyword.replace(' ', '')}{number}"}
+
+def percentile(sorted_values, fraction):
+    """En yakın sıra yöntemiyle yüzdelik"""
+    if not sorted_values:
+        return 0.0
+    index = max(int(round(fraction * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+def run_endpoint(base_url, endpoint, total_requests, concurrency, cold):
+    counter = itertools.count()
+    local = threading.local()
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+
+    def one_request(_):
+        nonlocal errors
+        number = next(counter)
+        keyword = KEYWORDS[number % len(KEYWORDS)]
+        if cold:
+            # Önbellekleri ve istek birleştirmeyi devre dışı bırakmak için benzersiz keyword
+            keyword = f"{keyword} {number}"
+        path, data = build_request(endpoint, keyword, number)
+
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+
+        started = time.perf_counter()
+        try:
+            response = session.post(base_url + path, data=data, timeout=60)
+            ok = response.status_code == 200 and response.json().get("success", False)
+        except (requests.RequestException, ValueError):
+            ok = False
+        elapsed = time.perf_counter() - started
+
+        with lock:
+            latencies.append(elapsed)
+            if not ok:
+                errors += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(one_request, range(total_requests)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": total_requests,
+        "errors": errors,
+        "rps": round(total_requests / wall, 2),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 1)
+    }
+
+def configure_environment(args, trends, dns_server):
+    """Uygulama import edilmeden önce ortam değişkenleri ayarlanır"""
+    os.environ["TRENDS_BASE_URL"] = trends.base_url
+    os.environ["DNS_NAMESERVERS"] = f"127.0.0.1:{dns_server.port}"
+    os.environ["DNS_TIMEOUT"] = "1.0"
+    os.environ["DNS_LIFETIME"] = "2.0"
+    os.environ["WHOIS_MIN_INTERVAL"] = str(args.whois_interval)
+    os.environ["TRENDS_ATTEMPT_DELAY"] = str(args.trends_attempt_delay)
+    os.environ["CACHE_BACKEND"] = "memory"
+    if not args.warm:
+        for name in ["WHOIS_CACHE_TTL", "WHOIS_NEGATIVE_TTL", "DNS_CACHE_TTL", "DNS_NEGATIVE_TTL", "TRENDS_CACHE_TTL",
+                     "RESPONSE_TTL_KEYWORDS", "RESPONSE_TTL_SEO_DOMAINS", "RESPONSE_TTL_BACKLINK_DOMAINS"]:
+            os.environ[name] = "0"
+
+def start_app():
+    from werkzeug.serving import make_server
+    import app as app_module
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = make_server("127.0.0.1", 0, app_module.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+def compare_with_baseline(results, baseline, max_regression):
+    """Baseline'a göre değişim tablosu; eşik aşılırsa regresyon listesi döner"""
+    regressions = []
+    print("\nBaseline karşılaştırması (pozitif = daha iyi)")
+    for endpoint, current in results.items():
+        previous = baseline.get("results", {}).get(endpoint)
+        if not previous:
+            print(f"  {endpoint:<22} baseline yok")
+            continue
+        rps_change = (current["rps"] - previous["rps"]) / previous["rps"] if previous["rps"] else 0.0
+        p95_change = (previous["p95_ms"] - current["p95_ms"]) / previous["p95_ms"] if previous["p95_ms"] else 0.0
+        print(f"  {endpoint:<22} rps {rps_change:+7.1%}   p95 {p95_change:+7.1%}")
+        if max_regression is not None and (rps_change < -max_regression or p95_change < -max_regression):
+            regressions.append(endpoint)
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sahte Trends/WHOIS/DNS sunucularıyla endpoint yük testi")
+    parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, default=ENDPOINTS)
+    parser.add_argument("--concurrency", type=int, default=8, help="Eş zamanlı istemci sayısı")
+    parser.add_argument("--requests", type=int, default=80, help="Endpoint başına istek sayısı")
+    parser.add_argument("--warm", action="store_true", help="Önbellekleri açık bırak, keyword'leri tekrarla")
+    parser.add_argument("--seed", type=int, default=42, help="Hata enjeksiyonu tohumu")
+    parser.add_argument("--trends-latency", type=float, default=80.0, help="Trends gecikmesi (ms)")
+    parser.add_argument("--trends-errors", type=float, default=0.0, help="Trends 500 oranı")
+    parser.add_argument("--trends-429", type=float, default=0.0, help="Trends 429 oranı")
+    parser.add_argument("--whois-latency", type=float, default=40.0, help="WHOIS gecikmesi (ms)")
+    parser.add_argument("--whois-errors", type=float, default=0.0, help="WHOIS bağlantı kopması oranı")
+    parser.add_argument("--whois-429", type=float, default=0.0, help="WHOIS hız sınırı yanıtı oranı")
+    parser.add_argument("--dns-latency", type=float, default=5.0, help="DNS gecikmesi (ms)")
+    parser.add_argument("--dns-errors", type=float, default=0.0, help="DNS yanıtsız kalma oranı")
+    parser.add_argument("--whois-interval", type=float, default=0.05, help="WHOIS_MIN_INTERVAL (sn)")
+    parser.add_argument("--trends-attempt-delay", type=float, default=0.05, help="TRENDS_ATTEMPT_DELAY (sn)")
+    parser.add_argument("--verbose", action="store_true", help="Uygulama çıktılarını gizleme")
+    parser.add_argument("--output", help="Sonuçları JSON olarak yaz")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Karşılaştırılacak baseline dosyası")
+    parser.add_argument("--save-baseline", action="store_true", help="Sonuçları baseline olarak kaydet")
+    parser.add_argument("--max-regression", type=float, help="rps veya p95 bu orandan fazla kötüleşirse çıkış kodu 1")
+    args = parser.parse_args(argv)
+
+    trends = TrendsStandin(FaultConfig(args.trends_latency, args.trends_latency / 4, args.trends_errors, args.trends_429, args.seed)).start()
+    whois_server = WhoisStandin(FaultConfig(args.whois_latency, args.whois_latency / 4, args.whois_errors, args.whois_429, args.seed + 1)).start()
+    dns_server = DnsStandin(FaultConfig(args.dns_latency, args.dns_latency / 4, args.dns_errors, 0.0, args.seed + 2)).start()
+    configure_environment(args, trends, dns_server)
+
+    app_output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(open(os.devnull, "w"))
+    with Port43Redirect(whois_server.port), app_output:
+        server, base_url = start_app()
+        try:
+            # Isınma: havuzlar, çerez ve import maliyetleri ölçüme girmesin
+            requests.post(base_url + "/check_domain", data={"domain": "isinma"}, timeout=60)
+
+            results = {}
+            for endpoint in args.endpoints:
+                results[endpoint] = run_endpoint(base_url, endpoint, args.requests, args.concurrency, not args.warm)
+        finally:
+            server.shutdown()
+
+    print(f"\n{'endpoint':<22} {'istek':>6} {'hata':>5} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for endpoint, row in results.items():
+        print(f"{endpoint:<22} {row['requests']:>6} {row['errors']:>5} {row['rps']:>8.2f} "
+              f"{row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f}")
+    print(f"\nSahte sunucu istekleri: trends={trends.requests} whois={whois_server.requests} dns={dns_server.requests}")
+
+    report = {
+        "scenario": {
+            key: value for key, value in vars(args).items()
+            if key not in ("output", "baseline", "save_baseline", "max_regression", "verbose")
+        },
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, ensure_ascii=False, indent=2)
+
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        if baseline.get("scenario") != report["scenario"]:
+            print("\n⚠️ Baseline farklı bir senaryoyla alınmış - karşılaştırma yaklaşık")
+        regressions = compare_with_baseline(results, baseline, args.max_regression)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, ensure_ascii=False, indent=2)
+            handle.write("\n")
+        print(f"\n💾 Baseline kaydedildi: {args.baseline}")
+
+    for stand_in in (trends, whois_server, dns_server):
+        stand_in.stop()
+
+    if regressions:
+        print(f"\n❌ Regresyon: {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
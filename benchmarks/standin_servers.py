@@ -0,0 +1,291 @@
+"""
+Yük testi için yerel sahte (stand-in) servisler
+
+- TrendsStandin: pytrends'in kullandığı Google Trends HTTP uçları (explore, multiline, relatedsearches)
+- WhoisStandin: port-43 WHOIS protokolü (sorgu satırı -> metin yanıt, bağlantı kapanır)
+- DnsStandin: UDP DNS (A/AAAA/NS/SOA; NOERROR / NXDOMAIN / SERVFAIL)
+
+Her servis FaultConfig ile gecikme, hata oranı ve hız sınırı (429) enjekte edebilir.
+Kayıtlı / müsait / belirsiz kararları domain adının hash'inden türetilir; DNS ve WHOIS
+aynı domain için tutarlı yanıt verir, aynı tohum aynı hata dizisini üretir.
+"""
+import hashlib
+import json
+import random
+import socket
+import socketserver
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import dns.message
+import dns.rcode
+import dns.rdataclass
+import dns.rdatatype
+import dns.rrset
+
+class FaultConfig:
+    """Gecikme (ms), sapma (ms), hata oranı ve hız sınırı oranı (0-1)"""
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, rate_limit_rate=0.0, seed=42):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def decide(self):
+        """Bu istek için (gecikme saniyesi, sonuç) - sonuç "ok", "error" veya "rate_limited" """
+        with self._lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms)
+            roll = self._random.random()
+        delay = max(self.latency_ms + jitter, 0) / 1000
+        if roll < self.rate_limit_rate:
+            return delay, "rate_limited"
+        if roll < self.rate_limit_rate + self.error_rate:
+            return delay, "error"
+        return delay, "ok"
+
+def domain_state(domain):
+    """Domain için sabit durum: "registered", "available" veya "ambiguous" (DNS'te SERVFAIL)"""
+    value = int(hashlib.md5(domain.lower().rstrip(".").encode()).hexdigest()[:8], 16) % 10
+    if value < 5:
+        return "registered"
+    if value < 8:
+        return "available"
+    return "ambiguous"
+
+def _keyword_interest(keyword, points):
+    seed = int(hashlib.md5(keyword.encode()).hexdigest()[:8], 16)
+    if seed % 7 == 0:
+        return [0] * points  # Veri olmayan keyword'ler
+    rng = random.Random(seed)
+    return [rng.randint(10, 100) for _ in range(points)]
+
+class _Server:
+    """Arka plan thread'inde çalışan sunucu için ortak başlat/durdur"""
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    @property
+    def port(self):
+        return self.server.server_address[1]
+
+class TrendsStandin(_Server):
+    POINTS = 52
+
+    def __init__(self, faults=None, host="127.0.0.1", port=0):
+        self.faults = faults or FaultConfig()
+        self.requests = 0
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body, content_type="application/json; charset=utf-8", headers=None):
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                standin.requests += 1
+                url = urlparse(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+                if url.path == "/":
+                    return self._send(200, "ok", "text/html", {"Set-Cookie": "NID=standin; Path=/"})
+
+                delay, outcome = standin.faults.decide()
+                time.sleep(delay)
+                if outcome == "rate_limited":
+                    return self._send(429, "Too Many Requests", "text/html")
+                if outcome == "error":
+                    return self._send(500, "Internal Server Error", "text/html")
+
+                if url.path == "/trends/api/explore":
+                    request = json.loads(params.get("req", "{}"))
+                    keywords = [item["keyword"] for item in request.get("comparisonItem", [])]
+                    return self._send(200, ")]}'" + json.dumps(standin.explore(keywords)))
+                if url.path == "/trends/api/widgetdata/multiline":
+                    request = json.loads(params.get("req", "{}"))
+                    return self._send(200, ")]}'," + json.dumps(standin.multiline(request.get("keywords", []))))
+                if url.path == "/trends/api/widgetdata/relatedsearches":
+                    request = json.loads(params.get("req", "{}"))
+                    keyword = request["restriction"]["complexKeywordsRestriction"]["keyword"][0]["value"]
+                    return self._send(200, ")]}'," + json.dumps(standin.related(keyword)))
+                return self._send(404, "Not Found", "text/html")
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    def explore(self, keywords):
+        widgets = [{"id": "TIMESERIES", "request": {"keywords": keywords}, "token": "standin"}]
+        for keyword in keywords:
+            widgets.append({
+                "id": "RELATED_QUERIES",
+                "request": {"restriction": {"complexKeywordsRestriction": {"keyword": [{"type": "BROAD", "value": keyword}]}}},
+                "token": "standin"
+            })
+        return {"widgets": widgets}
+
+    def multiline(self, keywords):
+        series = [_keyword_interest(keyword, self.POINTS) for keyword in keywords]
+        start = 1700000000
+        return {"default": {"timelineData": [
+            {"time": str(start + week * 604800), "value": [values[week] for values in series]}
+            for week in range(self.POINTS)
+        ]}}
+
+    def related(self, keyword):
+        ranked = lambda suffixes: [{"query": f"{keyword} {suffix}", "value": 100 - index * 10} for index, suffix in enumerate(suffixes)]
+        return {"default": {"rankedList": [
+            {"rankedKeyword": ranked(["fiyatı", "nedir", "yorum", "2024", "canlı"])},
+            {"rankedKeyword": ranked(["tahmin", "analiz"])}
+        ]}}
+
+class WhoisStandin(_Server):
+    """Port-43 WHOIS - .com/.net için Verisign, .tr için NIC.TR biçiminde yanıt"""
+
+    def __init__(self, faults=None, host="127.0.0.1", port=0):
+        self.faults = faults or FaultConfig()
+        self.requests = 0
+        standin = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                standin.requests += 1
+                query = self.rfile.readline().decode("utf-8", "replace").strip()
+                delay, outcome = standin.faults.decide()
+                time.sleep(delay)
+                if outcome == "error":
+                    return  # Yanıt vermeden bağlantıyı kapatır
+                if outcome == "rate_limited":
+                    self.wfile.write(b"Query rate limit exceeded. Please try again later.\r\n")
+                    return
+                self.wfile.write(standin.response(query).encode("utf-8"))
+
+        self.server = socketserver.ThreadingTCPServer((host, port), Handler)
+        self.server.daemon_threads = True
+
+    def response(self, domain):
+        registered = domain_state(domain) == "registered"
+        digest = int(hashlib.md5(domain.encode()).hexdigest()[:8], 16)
+        created = time.strftime("%Y-%m-%d", time.gmtime(946684800 + digest % (20 * 365 * 86400)))
+        if domain.endswith(".tr"):
+            if not registered:
+                return "** Domain Name not found.\r\n"
+            return (
+                f"** Domain Name: {domain}\r\n"
+                "** Registrant:\r\n   Standin Registrant\r\n\r\n"
+                f"Created on..............: {created}\r\n"
+                "Expires on..............: 2030-01-01\r\n"
+            )
+        if not registered:
+            return f'No match for "{domain.upper()}".\r\n'
+        return (
+            f"   Domain Name: {domain.upper()}\r\n"
+            "   Registrar: Standin Registrar, Inc.\r\n"
+            f"   Creation Date: {created}T00:00:00Z\r\n"
+            "   Registry Expiry Date: 2030-01-01T00:00:00Z\r\n"
+        )
+
+class DnsStandin(_Server):
+    """UDP DNS - kayıtlı domain'ler NOERROR, müsaitler NXDOMAIN, belirsizler SERVFAIL"""
+
+    def __init__(self, faults=None, host="127.0.0.1", port=0):
+        self.faults = faults or FaultConfig()
+        self.requests = 0
+        standin = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                standin.requests += 1
+                data, sock = self.request
+                try:
+                    query = dns.message.from_wire(data)
+                except Exception:
+                    return
+                delay, outcome = standin.faults.decide()
+                time.sleep(delay)
+                if outcome == "error":
+                    return  # Yanıt yok - istemci zaman aşımına düşer
+                response = standin.answer(query, refused=outcome == "rate_limited")
+                sock.sendto(response.to_wire(), self.client_address)
+
+        self.server = socketserver.ThreadingUDPServer((host, port), Handler)
+        self.server.daemon_threads = True
+
+    def answer(self, query, refused=False):
+        response = dns.message.make_response(query)
+        if refused:
+            response.set_rcode(dns.rcode.REFUSED)
+            return response
+
+        question = query.question[0]
+        state = domain_state(question.name.to_text())
+        if state == "available":
+            response.set_rcode(dns.rcode.NXDOMAIN)
+        elif state == "ambiguous":
+            response.set_rcode(dns.rcode.SERVFAIL)
+        elif question.rdtype == dns.rdatatype.A:
+            response.answer.append(dns.rrset.from_text(question.name, 300, dns.rdataclass.IN, dns.rdatatype.A, "192.0.2.10"))
+        elif question.rdtype == dns.rdatatype.NS:
+            response.answer.append(dns.rrset.from_text(question.name, 300, dns.rdataclass.IN, dns.rdatatype.NS, "ns1.standin.test."))
+        return response
+
+class Port43Redirect:
+    """
+    python-whois sunucuya sabit 43 portundan bağlanır; yük testi süresince bu portu
+    sahte WHOIS sunucusuna yönlendirir (whois.whois modülündeki socket referansı değiştirilir)
+    """
+
+    def __init__(self, port, host="127.0.0.1"):
+        self.address = (host, port)
+
+    def __enter__(self):
+        import whois
+        # whois paketindeki whois() fonksiyonu alt modülü gölgeler
+        whois_client = sys.modules[whois.NICClient.__module__]
+
+        address = self.address
+
+        class RedirectSocket(socket.socket):
+            def connect(self, target):
+                super().connect(address if target[1] == 43 else target)
+
+        class SocketModule:
+            def __getattr__(self, name):
+                return getattr(socket, name)
+
+        module = SocketModule()
+        module.socket = RedirectSocket
+        self._client = whois_client
+        self._original = whois_client.socket
+        whois_client.socket = module
+        return self
+
+    def __exit__(self, *exc):
+        self._client.socket = self._original
+        return False
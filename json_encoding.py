@@ -0,0 +1,59 @@
+"""
+Hızlı JSON kodlama - uygulama yanıtları, SSE olayları ve önbellek kayıtları ortak kullanır
+
+orjson kuruluysa onu kullanır, değilse standart json modülüne döner. Sadece Flask'ın JSON
+sağlayıcı sınıfına bağlıdır; içe aktarmak uygulamayı oluşturmaz.
+"""
+import json
+
+from flask.json.provider import DefaultJSONProvider
+
+# Hızlı JSON kodlayıcı (isteğe bağlı) - kurulu değilse standart json modülü kullanılır
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_default(value):
+    """
+    Standart JSON dışındaki tipler: numpy skalerleri düz Python sayısına çevrilir, geri kalanı
+    Flask'ın varsayılan sağlayıcısıyla aynı işlenir (tarih -> http_date, Decimal/UUID -> metin).
+    Bilinmeyen tipler TypeError fırlatır - serileştirme hataları sessizce metne dönüşmez.
+    """
+    if type(value).__module__ == "numpy" and getattr(value, "shape", None) == ():
+        return value.item()
+    return DefaultJSONProvider.default(value)
+
+# Tarihler orjson'un ISO biçimi yerine json_default'a (Flask ile aynı http_date) bırakılır
+ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson is not None else 0
+
+def encode_json(value, sort_keys=False):
+    """Değeri kompakt UTF-8 JSON'a (bytes) çevirir - orjson varsa onunla, yoksa standart json ile"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=json_default, option=ORJSON_OPTIONS | (orjson.OPT_SORT_KEYS if sort_keys else 0))
+        except TypeError:
+            pass  # 64 bitten büyük tamsayı gibi orjson'un desteklemediği değerler
+    return json.dumps(value, ensure_ascii=False, sort_keys=sort_keys, separators=(",", ":"), default=json_default).encode("utf-8")
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON sağlayıcısı - jsonify ve app.json hızlı kodlayıcıyı (encode_json) kullanır
+    Ek argüman verilen çağrılar ve debug modundaki girintili çıktı Flask'ın varsayılanına bırakılır.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return encode_json(obj, self.sort_keys).decode("utf-8")
+    
+    def loads(self, s, **kwargs):
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+    
+    def response(self, *args, **kwargs):
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(encode_json(obj, self.sort_keys) + b"\n", mimetype=self.mimetype)
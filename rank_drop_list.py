@@ -0,0 +1,217 @@
+"""
+Expired domain drop list'lerini keyword'lere göre sıralayan çevrimdışı araç
+
+Dosya (düz metin veya CSV, gzip destekli) parça parça okunur, her parça
+batch_scoring ile vektörel skorlanır ve her keyword için sadece en iyi K domain
+bir heap'te tutulur. Bellek kullanımı dosya boyutundan bağımsızdır.
+
+Kullanım:
+    python rank_drop_list.py droplist.txt.gz -k altın -k "gram altın" --top 500 -o sonuc.csv
+"""
+import argparse
+import csv
+import gzip
+import heapq
+import io
+import json
+import sys
+
+import numpy as np
+
+from batch_scoring import score_domains_batch, format_domain_value
+
+OUTPUT_FIELDS = [
+    "keyword", "rank", "domain", "seo_score", "keyword_relevance", "extension_score",
+    "length_score", "character_score", "pronounceable", "domain_age_score", "estimated_value"
+]
+
+def open_input(path):
+    """Dosyayı metin olarak açar - gzip sıkıştırması otomatik algılanır"""
+    if path == "-":
+        return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="replace")
+
+    with open(path, "rb") as probe:
+        is_gzip = probe.read(2) == b"\x1f\x8b"
+    if is_gzip:
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, "r", encoding="utf-8", errors="replace")
+
+def detect_format(path, requested):
+    if requested != "auto":
+        return requested
+    name = path.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    return "csv" if name.endswith(".csv") else "text"
+
+def normalize_domain(value):
+    domain = value.strip().strip('"').lower().rstrip(".")
+    if not domain or "." not in domain or " " in domain:
+        return None
+    return domain
+
+class ColumnNotFoundError(ValueError):
+    """CSV başlığında istenen domain sütunu yok"""
+
+def iter_domains(handle, input_format, column=None):
+    """Dosyadaki domain'leri tek tek döndürür (başlık ve yorum satırları atlanır)"""
+    if input_format == "csv":
+        reader = csv.reader(handle)
+        column_index = 0
+        if column is not None:
+            if column.isdigit():
+                column_index = int(column)
+            else:
+                header = [field.strip().lower() for field in next(reader, [])]
+                if column.lower() not in header:
+                    raise ColumnNotFoundError(f"CSV başlığında '{column}' sütunu yok (sütunlar: {', '.join(header) or '-'})")
+                column_index = header.index(column.lower())
+        for row in reader:
+            if len(row) > column_index:
+                domain = normalize_domain(row[column_index])
+                if domain:
+                    yield domain
+    else:
+        for line in handle:
+            if line.startswith("#"):
+                continue
+            domain = normalize_domain(line.split()[0] if line.strip() else "")
+            if domain:
+                yield domain
+
+def iter_chunks(domains, chunk_size):
+    chunk = []
+    for domain in domains:
+        chunk.append(domain)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+class TopK:
+    """Keyword başına en iyi K domain'i tutan sınırlı min-heap"""
+
+    def __init__(self, k):
+        self.k = k
+        self.heap = []
+        self.members = set()
+
+    def offer(self, sort_key, domain, row):
+        if domain in self.members:
+            return
+        item = (sort_key, domain, row)
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, item)
+            self.members.add(domain)
+        elif item[:2] > self.heap[0][:2]:
+            evicted = heapq.heapreplace(self.heap, item)
+            self.members.discard(evicted[1])
+            self.members.add(domain)
+
+    def threshold(self):
+        return self.heap[0][0] if len(self.heap) >= self.k else None
+
+    def ranked(self):
+        return [row for _, _, row in sorted(self.heap, key=lambda item: (item[0], item[1]), reverse=True)]
+
+def rank_chunk(chunk, keyword, top_k, min_relevance):
+    """Bir parçayı skorlar ve heap'e girebilecek adayları ekler"""
+    scores = score_domains_batch(chunk, keyword, backlink_counts=np.zeros(len(chunk), dtype=np.int64))
+
+    # Sıralama: SEO skoru, eşitlikte keyword alakası, sonra 100 ile sınırlanmamış faktör toplamı
+    factor_sum = (
+        scores["keyword_relevance"] + scores["extension_score"] + scores["length_score"]
+        + scores["character_score"] + scores["pronounceable"] + scores["domain_age_score"]
+    )
+    sort_keys = scores["seo_score"] * 1000000 + (scores["keyword_relevance"] + 128) * 1000 + factor_sum
+    eligible = np.flatnonzero(scores["keyword_relevance"] >= min_relevance)
+    threshold = top_k.threshold()
+    if threshold is not None:
+        eligible = eligible[sort_keys[eligible] >= threshold]
+
+    # Parça içinde sadece en iyi K aday Python tarafına geçer
+    if len(eligible) > top_k.k:
+        best = np.argpartition(sort_keys[eligible], -top_k.k)[-top_k.k:]
+        eligible = eligible[best]
+
+    for index in eligible.tolist():
+        domain = chunk[index]
+        top_k.offer(int(sort_keys[index]), domain, {
+            "keyword": keyword,
+            "domain": domain,
+            "seo_score": int(scores["seo_score"][index]),
+            "keyword_relevance": int(scores["keyword_relevance"][index]),
+            "extension_score": int(scores["extension_score"][index]),
+            "length_score": int(scores["length_score"][index]),
+            "character_score": int(scores["character_score"][index]),
+            "pronounceable": int(scores["pronounceable"][index]),
+            "domain_age_score": int(scores["domain_age_score"][index]),
+            "estimated_value": format_domain_value(scores["value_total"][index])
+        })
+
+def rank_drop_list(path, keywords, top=100, chunk_size=100000, input_format="auto", column=None, min_relevance=45):
+    """Drop list'i okur ve her keyword için sıralanmış en iyi domain listesini döndürür"""
+    input_format = detect_format(path, input_format)
+    heaps = {keyword: TopK(top) for keyword in keywords}
+    processed = 0
+
+    with open_input(path) as handle:
+        for chunk in iter_chunks(iter_domains(handle, input_format, column), chunk_size):
+            processed += len(chunk)
+            # Parça içi tekrarlar atılır (parçalar arası tekrarları TopK engeller)
+            chunk = list(dict.fromkeys(chunk))
+            for keyword in keywords:
+                rank_chunk(chunk, keyword, heaps[keyword], min_relevance)
+            print(f"📥 {processed:,} domain işlendi", file=sys.stderr)
+
+    return {keyword: heaps[keyword].ranked() for keyword in keywords}
+
+def write_results(results, output, output_format):
+    if output_format == "jsonl":
+        for rows in results.values():
+            for rank, row in enumerate(rows, 1):
+                output.write(json.dumps({**row, "rank": rank}, ensure_ascii=False) + "\n")
+    else:
+        writer = csv.DictWriter(output, fieldnames=OUTPUT_FIELDS)
+        writer.writeheader()
+        for rows in results.values():
+            for rank, row in enumerate(rows, 1):
+                writer.writerow({**row, "rank": rank})
+
+def positive_int(value):
+    """argparse tipi: 1 veya daha büyük tamsayı"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 veya daha büyük olmalı: {value}")
+    return number
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Expired domain drop list'ini keyword'lere göre sıralar")
+    parser.add_argument("input", help="Drop list dosyası (txt/csv, .gz olabilir) veya stdin için -")
+    parser.add_argument("-k", "--keyword", action="append", required=True, help="Keyword (birden fazla verilebilir)")
+    parser.add_argument("--top", type=positive_int, default=100, help="Keyword başına tutulacak domain sayısı")
+    parser.add_argument("--chunk-size", type=positive_int, default=100000, help="Tek seferde skorlanan domain sayısı")
+    parser.add_argument("--format", choices=["auto", "text", "csv"], default="auto", help="Girdi formatı")
+    parser.add_argument("--column", help="CSV'de domain sütunu (başlık adı veya sıra numarası)")
+    parser.add_argument("--min-relevance", type=int, default=45, help="Minimum keyword alakası (45: keyword isimde geçiyor)")
+    parser.add_argument("-o", "--output", help="Çıktı dosyası (varsayılan: stdout)")
+    parser.add_argument("--output-format", choices=["csv", "jsonl"], default="csv", help="Çıktı formatı")
+    args = parser.parse_args(argv)
+
+    try:
+        results = rank_drop_list(
+            args.input, args.keyword, top=args.top, chunk_size=args.chunk_size,
+            input_format=args.format, column=args.column, min_relevance=args.min_relevance
+        )
+    except ColumnNotFoundError as e:
+        parser.error(str(e))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as output:
+            write_results(results, output, args.output_format)
+    else:
+        write_results(results, sys.stdout, args.output_format)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,446 @@
+"""
+Saf domain skorlama fonksiyonları, tabloları ve analiz kaydı (DomainAnalysis)
+
+app.py (canlı endpoint'ler) ve batch_scoring.py (NumPy ile toplu skorlama) ortak kullanır.
+Flask, ağ veya önbellek bağımlılığı yoktur; içe aktarmak uygulamayı oluşturmaz.
+"""
+import hashlib
+import os
+import random
+import re
+from functools import lru_cache
+
+# Simülasyon tohumu ve bellek içi sonuç önbelleği boyutu - aynı tohumla aynı (domain, keyword) hep aynı sonucu verir
+SIMULATION_SEED = os.environ.get("SIMULATION_SEED", "seo-domain-finder")
+SIMULATION_CACHE_SIZE = int(os.environ.get("SIMULATION_CACHE_SIZE", 16384))
+
+# Keyword normalizasyonu - tüm skorlama yolları aynı sonucu kullanır
+# Türkçe karakterler küçük harfe çevirmeden önce dönüştürülür ("İ".lower() iki karakter üretir)
+TR_TRANSLATION_TABLE = str.maketrans("ğĞüÜşŞıİöÖçÇ", "gguussiioocc")
+NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]+')
+
+@lru_cache(maxsize=4096)
+def normalize_keyword(keyword):
+    """Keyword'ü domain karşılaştırması için normalize eder: "Gram Altın" -> "gramaltin" """
+    return NON_ALNUM_PATTERN.sub('', keyword.translate(TR_TRANSLATION_TABLE).lower())
+
+def query_keyword(keyword):
+    """
+    İstek birleştirme, yanıt önbelleği ve Trends önbelleği anahtarlarındaki keyword: "  Gram  ALTIN " -> "gram altin"
+    normalize_keyword'den farklı olarak boşluk ve Türkçe karakterler korunur - "gram altın" ile "gramaltin"
+    farklı Trends sorguları ve farklı simülasyon tohumlarıdır, aynı anahtarı paylaşamazlar.
+    """
+    return " ".join(keyword.lower().split())
+
+# Skorlama tabloları
+EXTENSION_SCORES = {
+    "com": 30, "net": 20, "org": 25, "info": 15, "biz": 10,
+    "com.tr": 25, "net.tr": 15, "org.tr": 20
+}
+
+# Özel keyword kombinasyonları için bonus
+SPECIAL_COMBINATIONS = {
+    'tr', 'market', 'hub', 'pro', 'online', 'get', 'my', 'best'
+}
+
+# Popüler keyword'ler daha eski olabilir
+POPULAR_AGE_KEYWORDS = ['altın', 'bitcoin', 'dolar', 'gold', 'money', 'news', 'market', 'trade']
+
+def calculate_keyword_relevance(domain, keyword):
+    """Domain'in keyword ile alakasını hesaplar"""
+    domain_name = domain.split('.')[0].lower()
+    keyword_clean = normalize_keyword(keyword)
+    
+    score = 0
+    
+    # Tam eşleşme (en yüksek puan)
+    if keyword_clean == domain_name:
+        score += 80
+    elif keyword_clean in domain_name:
+        # Keyword domain içinde geçiyor
+        if domain_name.startswith(keyword_clean):
+            score += 60  # Başında geçiyor
+        elif domain_name.endswith(keyword_clean):
+            score += 55  # Sonunda geçiyor
+        else:
+            score += 45  # Ortada geçiyor
+    
+    # Kısmi eşleşme - keyword'ün kelimelerini kontrol et
+    keyword_words = keyword_clean.split()
+    for word in keyword_words:
+        if len(word) > 2 and word in domain_name:
+            if domain_name.startswith(word):
+                score += 25
+            elif domain_name.endswith(word):
+                score += 20
+            else:
+                score += 15
+    
+    # Domain uzunluğu bonusu (kısa domain'ler daha değerli)
+    domain_length = len(domain_name)
+    if domain_length <= 6:
+        score += 20
+    elif domain_length <= 8:
+        score += 15
+    elif domain_length <= 10:
+        score += 10
+    elif domain_length <= 12:
+        score += 5
+    
+    # Özel keyword kombinasyonları için bonus
+    for combo in SPECIAL_COMBINATIONS:
+        if combo in domain_name and keyword_clean in domain_name:
+            score += 10
+            break
+    
+    # Sayı ve özel karakter cezası
+    if any(char.isdigit() for char in domain_name):
+        score -= 5
+    if '-' in domain_name:
+        score -= 3
+    
+    return min(score, 100)
+
+def analyze_domain_quality(domain):
+    """Domain kalitesini analiz eder"""
+    domain_name = domain.split('.')[0]
+    extension = domain.split('.', 1)[1] if '.' in domain else ""
+    
+    quality_factors = {}
+    
+    # Uzantı skoru
+    quality_factors["extension_score"] = EXTENSION_SCORES.get(extension, 5)
+    
+    # Domain uzunluğu
+    length = len(domain_name)
+    if length <= 6:
+        quality_factors["length_score"] = 25
+    elif length <= 10:
+        quality_factors["length_score"] = 20
+    elif length <= 15:
+        quality_factors["length_score"] = 15
+    else:
+        quality_factors["length_score"] = 5
+    
+    # Karakter kalitesi
+    char_score = 20
+    if '-' in domain_name:
+        char_score -= 5
+    if any(char.isdigit() for char in domain_name):
+        char_score -= 3
+    quality_factors["character_score"] = max(char_score, 0)
+    
+    # Telaffuz kolaylığı
+    vowels = 'aeiouAEIOU'
+    vowel_count = sum(1 for char in domain_name if char in vowels)
+    consonant_count = sum(1 for char in domain_name if char.isalpha() and char not in vowels)
+    
+    if vowel_count > 0 and consonant_count > 0:
+        ratio = vowel_count / (vowel_count + consonant_count)
+        if 0.2 <= ratio <= 0.6:
+            quality_factors["pronounceable"] = 15
+        else:
+            quality_factors["pronounceable"] = 5
+    else:
+        quality_factors["pronounceable"] = 0
+    
+    return quality_factors
+
+def seeded_random(namespace, *parts):
+    """
+    (namespace, parts) anahtarına bağlı rastgele sayı üreteci
+    simulate_domain_age'deki md5 yaklaşımı: aynı girdi her istekte ve her süreçte aynı
+    diziyi üretir, böylece simülasyon sonuçları önbelleğe alınabilir ve tekrarlanabilir.
+    """
+    key = "|".join((SIMULATION_SEED, namespace) + tuple(str(part) for part in parts))
+    return random.Random(int(hashlib.md5(key.encode("utf-8")).hexdigest(), 16))
+
+@lru_cache(maxsize=SIMULATION_CACHE_SIZE)
+def _simulated_backlink_count(domain, keyword_clean):
+    # Domain kalitesine göre simüle edilmiş backlink sayısı
+    domain_name = domain.split('.')[0]
+    base_score = len(domain_name) * 10
+    
+    # Keyword alakası bonusu
+    if keyword_clean in domain_name.lower():
+        base_score *= 2
+    
+    # (domain, keyword) için sabit faktör
+    random_factor = seeded_random("backlink_analysis", domain, keyword_clean).uniform(0.5, 2.0)
+    return int(base_score * random_factor)
+
+def simulate_backlink_analysis(domain, keyword):
+    """Simüle edilmiş backlink analizi (gerçek API'ler için key gerekir)"""
+    estimated_backlinks = _simulated_backlink_count(domain, normalize_keyword(keyword))
+    
+    # Kalite skoru
+    if estimated_backlinks > 1000:
+        quality_score = 30
+    elif estimated_backlinks > 500:
+        quality_score = 25
+    elif estimated_backlinks > 100:
+        quality_score = 20
+    elif estimated_backlinks > 50:
+        quality_score = 15
+    else:
+        quality_score = 10
+    
+    return {
+        "count": estimated_backlinks,
+        "quality_score": quality_score
+    }
+
+BACKLINK_DATA_FIELDS = ("backlinks", "quality_score", "referring_domains", "domain_authority")
+
+@lru_cache(maxsize=SIMULATION_CACHE_SIZE)
+def _simulated_backlink_profile(domain, keyword_lower):
+    """(domain, keyword) için sabit backlink profili - BACKLINK_DATA_FIELDS sırasıyla tuple"""
+    rng = seeded_random("backlink_data", domain.lower(), keyword_lower)
+    try:
+        # Domain karakteristiklerine göre backlink sayısı hesapla
+        base_backlinks = rng.randint(50, 5000)
+        
+        # Keyword relevansına göre bonus
+        domain_lower = domain.lower()
+        
+        if keyword_lower in domain_lower:
+            base_backlinks *= rng.uniform(1.5, 3.0)
+        
+        # Domain uzunluğuna göre ayarlama
+        if len(domain) <= 8:
+            base_backlinks *= rng.uniform(1.2, 2.0)
+        elif len(domain) >= 15:
+            base_backlinks *= rng.uniform(0.5, 0.8)
+        
+        # TLD'ye göre ayarlama
+        if domain.endswith('.com'):
+            base_backlinks *= rng.uniform(1.3, 2.0)
+        elif domain.endswith('.com.tr'):
+            base_backlinks *= rng.uniform(1.1, 1.5)
+        elif domain.endswith('.net'):
+            base_backlinks *= rng.uniform(1.0, 1.3)
+        
+        backlinks = int(base_backlinks)
+        
+        # Kalite skoru hesapla (1-100)
+        quality_score = min(100, max(10, 
+            rng.randint(30, 95) + 
+            (20 if keyword_lower in domain_lower else 0) +
+            (10 if len(domain) <= 10 else 0) +
+            (15 if domain.endswith('.com') else 0)
+        ))
+        
+        # Referring domains (backlink sayısının %10-30'u)
+        referring_domains = int(backlinks * rng.uniform(0.1, 0.3))
+        
+        # Domain Authority (DA) simülasyonu
+        domain_authority = min(100, max(1, 
+            rng.randint(15, 85) + 
+            (15 if backlinks > 1000 else 0) +
+            (10 if quality_score > 70 else 0)
+        ))
+        
+        return backlinks, quality_score, referring_domains, domain_authority
+        
+    except Exception as e:
+        return (
+            rng.randint(100, 1000),
+            rng.randint(40, 80),
+            rng.randint(20, 200),
+            rng.randint(20, 60)
+        )
+
+def simulate_backlink_data(domain, keyword):
+    """Backlink verilerini simüle eder (aynı domain ve keyword için her zaman aynı sonuç)"""
+    return dict(zip(BACKLINK_DATA_FIELDS, _simulated_backlink_profile(domain, keyword.lower())))
+
+def simulate_domain_age(domain):
+    """Domain özelliklerine göre yaş simülasyonu"""
+    from datetime import datetime, timedelta
+    import hashlib
+    
+    # Domain'in hash'ine göre deterministik yaş oluştur
+    domain_hash = int(hashlib.md5(domain.encode()).hexdigest()[:8], 16)
+    
+    # Domain uzantısına göre yaş aralığı
+    if domain.endswith('.com'):
+        # .com domain'ler genelde daha eski
+        min_years, max_years = 2, 20
+    elif domain.endswith('.net'):
+        min_years, max_years = 1, 15
+    elif domain.endswith('.org'):
+        min_years, max_years = 3, 18
+    elif domain.endswith('.info'):
+        min_years, max_years = 1, 12
+    elif domain.endswith('.biz'):
+        min_years, max_years = 1, 10
+    elif domain.endswith('.com.tr'):
+        min_years, max_years = 1, 15
+    elif domain.endswith('.net.tr'):
+        min_years, max_years = 1, 12
+    else:
+        min_years, max_years = 1, 10
+    
+    # Domain adı özelliklerine göre ayarlama
+    domain_name = domain.split('.')[0].lower()
+    
+    # Kısa domain'ler genelde daha eski
+    if len(domain_name) <= 4:
+        min_years += 3
+        max_years += 5
+    elif len(domain_name) <= 6:
+        min_years += 1
+        max_years += 2
+    
+    # Popüler keyword'ler daha eski olabilir
+    for keyword in POPULAR_AGE_KEYWORDS:
+        if keyword in domain_name:
+            min_years += 2
+            max_years += 3
+            break
+    
+    # Hash'e göre yaş hesapla
+    age_range = max_years - min_years
+    age_years = min_years + (domain_hash % (age_range * 10)) / 10.0
+    
+    # Yaş skoru
+    if age_years > 15:
+        age_score = 30
+    elif age_years > 10:
+        age_score = 25
+    elif age_years > 5:
+        age_score = 20
+    elif age_years > 2:
+        age_score = 15
+    elif age_years > 1:
+        age_score = 10
+    else:
+        age_score = 5
+    
+    # Tahmini oluşturulma tarihi
+    creation_date = datetime.now() - timedelta(days=age_years * 365.25)
+    
+    return {
+        "age": f"~{age_years:.1f} yıl",
+        "score": age_score,
+        "creation_date": creation_date.strftime("%Y-%m-%d"),
+        "note": "Tahmini yaş (WHOIS verisi alınamadı)"
+    }
+
+def calculate_seo_score(factors):
+    """Tüm faktörleri kullanarak SEO skoru hesaplar"""
+    total_score = 0
+    
+    # Tüm faktörleri topla
+    for factor, score in factors.items():
+        if isinstance(score, (int, float)):
+            total_score += score
+    
+    # 0-100 arasında normalize et
+    return min(total_score, 100)
+
+def estimate_domain_value(analysis):
+    """Domain'in tahmini değerini hesaplar"""
+    seo_score = analysis["seo_score"]
+    backlinks = analysis["backlink_estimate"]
+    keyword_relevance = analysis["keyword_relevance"]
+    
+    # Temel değer hesaplama
+    base_value = seo_score * 10
+    backlink_value = min(backlinks * 0.5, 1000)
+    keyword_value = keyword_relevance * 5
+    
+    total_value = base_value + backlink_value + keyword_value
+    
+    if total_value > 5000:
+        return f"${total_value:,.0f}+"
+    elif total_value > 1000:
+        return f"${total_value:,.0f}"
+    elif total_value > 100:
+        return f"${total_value:.0f}"
+    else:
+        return f"${total_value:.0f}"
+
+class DomainAnalysis:
+    """
+    Tek domain'in SEO analizi - iç içe dict yerine __slots__ ile sabit alanlı kayıt
+    Skor faktörleri ayrı alanlarda tutulur; JSON'a sadece to_dict() ile (yanıta girecek
+    domain'ler için) çevrilir, böylece elenen adaylar için dict oluşturulmaz.
+    """
+    
+    __slots__ = (
+        "domain", "status", "seo_score", "backlink_estimate", "domain_age", "keyword_relevance",
+        "estimated_value", "creation_date", "age_note", "error",
+        "keyword_match", "extension_score", "length_score", "character_score", "pronounceable",
+        "backlink_quality", "age_score"
+    )
+    
+    # JSON'daki "factors" anahtarı -> alan adı (sıra yanıttaki sırayla aynı)
+    FACTOR_FIELDS = (
+        ("keyword_match", "keyword_match"),
+        ("extension_score", "extension_score"),
+        ("length_score", "length_score"),
+        ("character_score", "character_score"),
+        ("pronounceable", "pronounceable"),
+        ("backlink_quality", "backlink_quality"),
+        ("domain_age", "age_score")
+    )
+    
+    # Sadece değer atanmışsa yanıta eklenen alanlar
+    OPTIONAL_FIELDS = ("creation_date", "age_note", "error")
+    
+    def __init__(self, domain):
+        self.domain = domain
+        self.status = "unknown"
+        self.seo_score = 0
+        self.backlink_estimate = 0
+        self.domain_age = "unknown"
+        self.keyword_relevance = 0
+        self.estimated_value = "$0"
+        self.creation_date = None
+        self.age_note = None
+        self.error = None
+        # Hesaplanmamış faktörler yanıtta yer almaz
+        self.keyword_match = None
+        self.extension_score = None
+        self.length_score = None
+        self.character_score = None
+        self.pronounceable = None
+        self.backlink_quality = None
+        self.age_score = None
+    
+    @property
+    def availability(self):
+        return self.status
+    
+    @property
+    def factors(self):
+        return {name: getattr(self, field) for name, field in self.FACTOR_FIELDS if getattr(self, field) is not None}
+    
+    def __getitem__(self, key):
+        # Eski dict tabanlı kullanım için okuma erişimi: analysis["seo_score"]
+        if key in self.OPTIONAL_FIELDS and getattr(self, key) is None:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def to_dict(self):
+        """Önceki dict tabanlı analizle aynı JSON şekli"""
+        data = {
+            "domain": self.domain,
+            "status": self.status,
+            "seo_score": self.seo_score,
+            "factors": self.factors,
+            "backlink_estimate": self.backlink_estimate,
+            "domain_age": self.domain_age,
+            "keyword_relevance": self.keyword_relevance,
+            "availability": self.status,
+            "estimated_value": self.estimated_value
+        }
+        for field in self.OPTIONAL_FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                data[field] = value
+        return data